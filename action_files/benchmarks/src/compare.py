@@ -0,0 +1,48 @@
+import argparse
+import json
+import sys
+from typing import Dict
+
+# metric -> True when higher is better
+METRICS = {
+    'fit_steps_per_sec': True,
+    'predict_latency_s': False,
+    'import_time_s': False,
+    'peak_rss_mb': False,
+}
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    with open(path) as f:
+        results = json.load(f)['results']
+    return {result['model']: result for result in results if 'error' not in result}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare two benchmark result files.')
+    parser.add_argument('baseline', type=str, help='results json of the reference commit')
+    parser.add_argument('candidate', type=str, help='results json of the commit under test')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative change considered a regression')
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline)
+    candidate = load_results(args.candidate)
+    regressions = []
+    print(f"{'model':>20} " + ' '.join(f'{metric:>18}' for metric in METRICS))
+    for model in sorted(baseline.keys() & candidate.keys()):
+        changes = []
+        for metric, higher_is_better in METRICS.items():
+            change = candidate[model][metric] / baseline[model][metric] - 1
+            if (-change if higher_is_better else change) > args.threshold:
+                regressions.append((model, metric, change))
+            changes.append(f'{change:+18.1%}')
+        print(f'{model:>20} ' + ' '.join(changes))
+
+    for model, metric, change in regressions:
+        print(f'regression: {model} {metric} {change:+.1%}', file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
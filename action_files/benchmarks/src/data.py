@@ -0,0 +1,24 @@
+import pandas as pd
+
+from neuralforecast.utils import generate_series
+
+
+def get_data(
+    n_series: int,
+    min_length: int,
+    max_length: int,
+    freq: str = 'D',
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Synthetic panel with `unique_id`, `ds` and `y` columns, no downloads involved."""
+    df = generate_series(
+        n_series=n_series,
+        freq=freq,
+        min_length=min_length,
+        max_length=max_length,
+        equal_ends=True,
+        seed=seed,
+    )
+    df = df.reset_index()
+    df['unique_id'] = df['unique_id'].astype(str)
+    return df
@@ -0,0 +1,176 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+BENCHMARK_ARGS = {
+    'n_series': (int, 100, 'number of synthetic series'),
+    'min_length': (int, 200, 'minimum length of the series'),
+    'max_length': (int, 200, 'maximum length of the series'),
+    'h': (int, 12, 'forecast horizon'),
+    'input_size': (int, 24, 'input size of the models'),
+    'max_steps': (int, 50, 'training steps of each fit'),
+    'predict_repeats': (int, 3, 'number of timed predict calls, the median is reported'),
+    'threads': (int, 1, 'torch intra-op threads'),
+    'seed': (int, 0, 'seed of the synthetic panel and of the models'),
+    'compile': (int, 0, 'if 1 the models run with compile=True'),
+    'precision': (str, '32-true', 'lightning precision of the trainer, e.g. bf16-mixed'),
+}
+
+
+def model_names() -> List[str]:
+    """Lowercase names of the distinct model classes in `MODEL_FILENAME_DICT`."""
+    from neuralforecast.core import MODEL_FILENAME_DICT
+
+    classes = {cls.__name__.lower(): cls for cls in MODEL_FILENAME_DICT.values()}
+    return sorted(classes)
+
+
+def peak_rss_mb() -> float:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes on linux
+    if sys.platform == 'darwin':
+        return max_rss / 1024**2
+    return max_rss / 1024
+
+
+def benchmark_model(model: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Runs in a fresh interpreter, so the import time and peak RSS belong to this model only."""
+    start = time.perf_counter()
+    import torch
+    from neuralforecast.core import MODEL_FILENAME_DICT, NeuralForecast
+    import_time = time.perf_counter() - start
+
+    import pytorch_lightning as pl
+    from src.data import get_data
+
+    class StepTimer(pl.Callback):
+        # Times the optimization steps after the first one,
+        # which also pays for the lazy initializations.
+        def on_train_batch_start(self, trainer, pl_module, batch, batch_idx):
+            if trainer.global_step == 1 and not hasattr(self, 'start'):
+                self.start = time.perf_counter()
+
+        def on_train_end(self, trainer, pl_module):
+            self.end = time.perf_counter()
+
+    torch.set_num_threads(config['threads'])
+    model_cls = {cls.__name__.lower(): cls for cls in MODEL_FILENAME_DICT.values()}[model]
+    df = get_data(
+        n_series=config['n_series'],
+        min_length=config['min_length'],
+        max_length=config['max_length'],
+        seed=config['seed'],
+    )
+    model_kwargs = dict(
+        h=config['h'],
+        input_size=config['input_size'],
+        max_steps=config['max_steps'],
+        random_seed=config['seed'],
+        compile=bool(config['compile']),
+        precision=config['precision'],
+        accelerator='cpu',
+        devices=1,
+        logger=False,
+        callbacks=[StepTimer()],
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    if model_cls.SAMPLING_TYPE == 'multivariate':
+        model_kwargs['n_series'] = config['n_series']
+    nf = NeuralForecast(models=[model_cls(**model_kwargs)], freq='D')
+
+    start = time.perf_counter()
+    nf.fit(df=df)
+    fit_time = time.perf_counter() - start
+    trainer = nf.models[0].trainer
+    timer = next(cb for cb in trainer.callbacks if isinstance(cb, StepTimer))
+    steps = trainer.global_step
+
+    predict_times = []
+    for _ in range(config['predict_repeats']):
+        start = time.perf_counter()
+        nf.predict()
+        predict_times.append(time.perf_counter() - start)
+    predict_times.sort()
+
+    return {
+        'model': model,
+        'import_time_s': import_time,
+        'fit_time_s': fit_time,
+        'fit_steps': steps,
+        'fit_steps_per_sec': (steps - 1) / (timer.end - timer.start),
+        'predict_latency_s': predict_times[len(predict_times) // 2],
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def metadata(config: Dict[str, Any]) -> Dict[str, Any]:
+    import neuralforecast
+    import torch
+
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'neuralforecast': neuralforecast.__version__,
+        'torch': torch.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'config': config,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Offline throughput benchmark of the neuralforecast models.')
+    for arg, (type_, default, help_) in BENCHMARK_ARGS.items():
+        parser.add_argument(f'--{arg}', type=type_, default=default, help=help_)
+    parser.add_argument('--models', type=str, default=None,
+                        help='comma separated lowercase model names, defaults to all models')
+    parser.add_argument('--output', type=str, default='benchmark.json', help='path of the results json')
+    parser.add_argument('--worker', type=str, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    config = {arg: getattr(args, arg) for arg in BENCHMARK_ARGS}
+
+    if args.worker is not None:
+        print(json.dumps(benchmark_model(args.worker, config)))
+        return
+
+    models = args.models.split(',') if args.models is not None else model_names()
+    results = []
+    for model in models:
+        cmd = [sys.executable, '-m', 'src.run', '--worker', model]
+        cmd += [f'--{arg}={value}' for arg, value in config.items()]
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f'{model} failed:\n{proc.stderr}', file=sys.stderr)
+            error = proc.stderr.strip().splitlines() or ['']
+            results.append({'model': model, 'error': error[-1]})
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(
+            f"{model:>20}: {result['fit_steps_per_sec']:8.2f} steps/s, "
+            f"predict {result['predict_latency_s']:7.3f}s, "
+            f"import {result['import_time_s']:5.2f}s, "
+            f"peak rss {result['peak_rss_mb']:7.1f}MB"
+        )
+        results.append(result)
+
+    with open(args.output, 'w') as f:
+        json.dump({'metadata': metadata(config), 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,10 @@
 __version__ = "1.6.4"
 __all__ = ['NeuralForecast']
-from .core import NeuralForecast
+
+
+def __getattr__(name):
+    # Lazy, so that `neuralforecast.serving` can be used without torch
+    if name == 'NeuralForecast':
+        from .core import NeuralForecast
+        return NeuralForecast
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -60,8 +60,20 @@ d = { 'settings': { 'branch': 'main',
             'neuralforecast.core': { 'neuralforecast.core.NeuralForecast': ('core.html#neuralforecast', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.__init__': ( 'core.html#neuralforecast.__init__',
                                                                                       'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._load_manifest': ( 'core.html#neuralforecast._load_manifest',
+                                                                                            'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit': ( 'core.html#neuralforecast._prepare_fit',
                                                                                           'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._restore_full_history': ( 'core.html#neuralforecast._restore_full_history',
+                                                                                                   'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._retain': ( 'core.html#neuralforecast._retain',
+                                                                                     'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._retention_size': ( 'core.html#neuralforecast._retention_size',
+                                                                                             'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._save_manifest': ( 'core.html#neuralforecast._save_manifest',
+                                                                                            'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.append': ( 'core.html#neuralforecast.append',
+                                                                                    'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.cross_validation': ( 'core.html#neuralforecast.cross_validation',
                                                                                               'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.fit': ('core.html#neuralforecast.fit', 'neuralforecast/core.py'),
@@ -70,10 +82,37 @@ d = { 'settings': { 'branch': 'main',
                                                                                      'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.predict_insample': ( 'core.html#neuralforecast.predict_insample',
                                                                                               'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.quantize': ( 'core.html#neuralforecast.quantize',
+                                                                                      'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.save': ('core.html#neuralforecast.save', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._LazyModel': ('core.html#_lazymodel', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._LazyModel.__deepcopy__': ( 'core.html#_lazymodel.__deepcopy__',
+                                                                                      'neuralforecast/core.py'),
+                                     'neuralforecast.core._LazyModel.__getattr__': ( 'core.html#_lazymodel.__getattr__',
+                                                                                     'neuralforecast/core.py'),
+                                     'neuralforecast.core._LazyModel.__init__': ('core.html#_lazymodel.__init__', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._LazyModel.__repr__': ('core.html#_lazymodel.__repr__', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._LazyModel.__setattr__': ( 'core.html#_lazymodel.__setattr__',
+                                                                                     'neuralforecast/core.py'),
+                                     'neuralforecast.core._LazyModel._get_model': ( 'core.html#_lazymodel._get_model',
+                                                                                    'neuralforecast/core.py'),
                                      'neuralforecast.core._cv_dates': ('core.html#_cv_dates', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._cv_positions': ('core.html#_cv_positions', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._cv_windows': ('core.html#_cv_windows', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._decode_hparams': ('core.html#_decode_hparams', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._encode_hparams': ('core.html#_encode_hparams', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._flatten_quantized': ('core.html#_flatten_quantized', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._frame_type': ('core.html#_frame_type', 'neuralforecast/core.py'),
                                      'neuralforecast.core._future_dates': ('core.html#_future_dates', 'neuralforecast/core.py'),
-                                     'neuralforecast.core._insample_dates': ('core.html#_insample_dates', 'neuralforecast/core.py')},
+                                     'neuralforecast.core._insample_dates': ('core.html#_insample_dates', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._is_json': ('core.html#_is_json', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._quantizable_model': ('core.html#_quantizable_model', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._read_arrays': ('core.html#_read_arrays', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._shift_dates': ('core.html#_shift_dates', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._to_frame': ('core.html#_to_frame', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._unflatten_quantized': ( 'core.html#_unflatten_quantized',
+                                                                                   'neuralforecast/core.py'),
+                                     'neuralforecast.core._write_arrays': ('core.html#_write_arrays', 'neuralforecast/core.py')},
             'neuralforecast.losses.numpy': { 'neuralforecast.losses.numpy._divide_no_nan': ( 'losses.numpy.html#_divide_no_nan',
                                                                                              'neuralforecast/losses/numpy.py'),
                                              'neuralforecast.losses.numpy._metric_protections': ( 'losses.numpy.html#_metric_protections',
@@ -804,6 +843,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.GRN.forward': ( 'models.tft.html#grn.forward',
                                                                                       'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.GroupedGRN': ( 'models.tft.html#groupedgrn',
+                                                                                     'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.GroupedGRN.__init__': ( 'models.tft.html#groupedgrn.__init__',
+                                                                                              'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.GroupedGRN._load_from_state_dict': ( 'models.tft.html#groupedgrn._load_from_state_dict',
+                                                                                                           'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.GroupedGRN.forward': ( 'models.tft.html#groupedgrn.forward',
+                                                                                             'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.InterpretableMultiHeadAttention': ( 'models.tft.html#interpretablemultiheadattention',
                                                                                                           'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.InterpretableMultiHeadAttention.__init__': ( 'models.tft.html#interpretablemultiheadattention.__init__',
@@ -893,6 +940,18 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                     'neuralforecast/models/vanillatransformer.py'),
                                                           'neuralforecast.models.vanillatransformer.VanillaTransformer.forward': ( 'models.vanillatransformer.html#vanillatransformer.forward',
                                                                                                                                    'neuralforecast/models/vanillatransformer.py')},
+            'neuralforecast.serving': { 'neuralforecast.serving.OnnxForecaster': ( 'serving.html#onnxforecaster',
+                                                                                   'neuralforecast/serving.py'),
+                                        'neuralforecast.serving.OnnxForecaster.__init__': ( 'serving.html#onnxforecaster.__init__',
+                                                                                            'neuralforecast/serving.py'),
+                                        'neuralforecast.serving.OnnxForecaster.__repr__': ( 'serving.html#onnxforecaster.__repr__',
+                                                                                            'neuralforecast/serving.py'),
+                                        'neuralforecast.serving.OnnxForecaster._predict': ( 'serving.html#onnxforecaster._predict',
+                                                                                            'neuralforecast/serving.py'),
+                                        'neuralforecast.serving.OnnxForecaster.predict': ( 'serving.html#onnxforecaster.predict',
+                                                                                           'neuralforecast/serving.py'),
+                                        'neuralforecast.serving.OnnxForecaster.predict_dataset': ( 'serving.html#onnxforecaster.predict_dataset',
+                                                                                                   'neuralforecast/serving.py')},
             'neuralforecast.tsdataset': { 'neuralforecast.tsdataset.TimeSeriesDataModule': ( 'tsdataset.html#timeseriesdatamodule',
                                                                                              'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.__init__': ( 'tsdataset.html#timeseriesdatamodule.__init__',
@@ -909,18 +968,46 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__getitem__': ( 'tsdataset.html#timeseriesdataset.__getitem__',
                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__getitems__': ( 'tsdataset.html#timeseriesdataset.__getitems__',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__getstate__': ( 'tsdataset.html#timeseriesdataset.__getstate__',
+                                                                                                       'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__init__': ( 'tsdataset.html#timeseriesdataset.__init__',
                                                                                                    'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__len__': ( 'tsdataset.html#timeseriesdataset.__len__',
                                                                                                   'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__repr__': ( 'tsdataset.html#timeseriesdataset.__repr__',
                                                                                                    'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__setstate__': ( 'tsdataset.html#timeseriesdataset.__setstate__',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._column': ( 'tsdataset.html#timeseriesdataset._column',
+                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._from_arrays': ( 'tsdataset.html#timeseriesdataset._from_arrays',
+                                                                                                       'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset._invert_target_transform': ( 'tsdataset.html#timeseriesdataset._invert_target_transform',
                                                                                                                    'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._mask_rows': ( 'tsdataset.html#timeseriesdataset._mask_rows',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._pack_mask': ( 'tsdataset.html#timeseriesdataset._pack_mask',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._select_rows': ( 'tsdataset.html#timeseriesdataset._select_rows',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._set_column': ( 'tsdataset.html#timeseriesdataset._set_column',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._set_temporal': ( 'tsdataset.html#timeseriesdataset._set_temporal',
+                                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._take': ( 'tsdataset.html#timeseriesdataset._take',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._to_arrays': ( 'tsdataset.html#timeseriesdataset._to_arrays',
+                                                                                                     'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset._transform_temporal': ( 'tsdataset.html#timeseriesdataset._transform_temporal',
                                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.append': ( 'tsdataset.html#timeseriesdataset.append',
+                                                                                                 'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.from_df': ( 'tsdataset.html#timeseriesdataset.from_df',
                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.temporal': ( 'tsdataset.html#timeseriesdataset.temporal',
+                                                                                                   'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.trim_dataset': ( 'tsdataset.html#timeseriesdataset.trim_dataset',
                                                                                                        'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.update_dataset': ( 'tsdataset.html#timeseriesdataset.update_dataset',
@@ -929,8 +1016,70 @@ d = { 'settings': { 'branch': 'main',
                                                                                          'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesLoader.__init__': ( 'tsdataset.html#timeseriesloader.__init__',
                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesLoader.__iter__': ( 'tsdataset.html#timeseriesloader.__iter__',
+                                                                                                  'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesLoader._collate_fn': ( 'tsdataset.html#timeseriesloader._collate_fn',
-                                                                                                     'neuralforecast/tsdataset.py')},
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowsDataset': ( 'tsdataset.html#timeserieswindowsdataset',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowsDataset.__getitem__': ( 'tsdataset.html#timeserieswindowsdataset.__getitem__',
+                                                                                                             'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowsDataset.__getitems__': ( 'tsdataset.html#timeserieswindowsdataset.__getitems__',
+                                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowsDataset.__init__': ( 'tsdataset.html#timeserieswindowsdataset.__init__',
+                                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowsDataset.__len__': ( 'tsdataset.html#timeserieswindowsdataset.__len__',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowsDataset.__repr__': ( 'tsdataset.html#timeserieswindowsdataset.__repr__',
+                                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LocalScaler': ( 'tsdataset.html#_localscaler',
+                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LocalScaler.__contains__': ( 'tsdataset.html#_localscaler.__contains__',
+                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LocalScaler.__getitem__': ( 'tsdataset.html#_localscaler.__getitem__',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LocalScaler.__init__': ( 'tsdataset.html#_localscaler.__init__',
+                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LocalScaler.__iter__': ( 'tsdataset.html#_localscaler.__iter__',
+                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LocalScaler.__len__': ( 'tsdataset.html#_localscaler.__len__',
+                                                                                             'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LocalScaler._from_transforms': ( 'tsdataset.html#_localscaler._from_transforms',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LocalScaler.fit_transform': ( 'tsdataset.html#_localscaler.fit_transform',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LocalScaler.inverse_transform': ( 'tsdataset.html#_localscaler.inverse_transform',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LocalScaler.scale': ( 'tsdataset.html#_localscaler.scale',
+                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LocalScaler.transform': ( 'tsdataset.html#_localscaler.transform',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator': ( 'tsdataset.html#_prefetchiterator',
+                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator.__init__': ( 'tsdataset.html#_prefetchiterator.__init__',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator.__iter__': ( 'tsdataset.html#_prefetchiterator.__iter__',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator.__next__': ( 'tsdataset.html#_prefetchiterator.__next__',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator._worker': ( 'tsdataset.html#_prefetchiterator._worker',
+                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._arrow_to_frame': ( 'tsdataset.html#_arrow_to_frame',
+                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._local_fit_transform': ( 'tsdataset.html#_local_fit_transform',
+                                                                                             'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._local_scale': ( 'tsdataset.html#_local_scale',
+                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._minmax_stats': ( 'tsdataset.html#_minmax_stats',
+                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._robust_iqr_stats': ( 'tsdataset.html#_robust_iqr_stats',
+                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._robust_mad_stats': ( 'tsdataset.html#_robust_mad_stats',
+                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._standard_stats': ( 'tsdataset.html#_standard_stats',
+                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._trim_rows': ( 'tsdataset.html#_trim_rows',
+                                                                                   'neuralforecast/tsdataset.py')},
             'neuralforecast.utils': { 'neuralforecast.utils.DayOfMonth': ('utils.html#dayofmonth', 'neuralforecast/utils.py'),
                                       'neuralforecast.utils.DayOfMonth.__call__': ( 'utils.html#dayofmonth.__call__',
                                                                                     'neuralforecast/utils.py'),
@@ -962,8 +1111,13 @@ d = { 'settings': { 'branch': 'main',
                                       'neuralforecast.utils.WeekOfYear': ('utils.html#weekofyear', 'neuralforecast/utils.py'),
                                       'neuralforecast.utils.WeekOfYear.__call__': ( 'utils.html#weekofyear.__call__',
                                                                                     'neuralforecast/utils.py'),
+                                      'neuralforecast.utils._series_positions': ('utils.html#_series_positions', 'neuralforecast/utils.py'),
                                       'neuralforecast.utils.augment_calendar_df': ( 'utils.html#augment_calendar_df',
                                                                                     'neuralforecast/utils.py'),
                                       'neuralforecast.utils.generate_series': ('utils.html#generate_series', 'neuralforecast/utils.py'),
+                                      'neuralforecast.utils.generate_series_shards': ( 'utils.html#generate_series_shards',
+                                                                                       'neuralforecast/utils.py'),
                                       'neuralforecast.utils.time_features_from_frequency_str': ( 'utils.html#time_features_from_frequency_str',
-                                                                                                 'neuralforecast/utils.py')}}}
+                                                                                                 'neuralforecast/utils.py'),
+                                      'neuralforecast.utils.write_series_parquet': ( 'utils.html#write_series_parquet',
+                                                                                     'neuralforecast/utils.py')}}}
@@ -69,6 +69,10 @@ class AutoRNN(BaseAuto):
         gpus=torch.cuda.device_count(),
         verbose=False,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         """Auto RNN
 
@@ -104,6 +108,10 @@ class AutoRNN(BaseAuto):
             gpus=gpus,
             verbose=verbose,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 14
@@ -136,6 +144,10 @@ class AutoLSTM(BaseAuto):
         gpus=torch.cuda.device_count(),
         verbose=False,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -166,6 +178,10 @@ class AutoLSTM(BaseAuto):
             gpus=gpus,
             verbose=verbose,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 17
@@ -199,6 +215,10 @@ class AutoGRU(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -230,6 +250,10 @@ class AutoGRU(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 20
@@ -262,6 +286,10 @@ class AutoTCN(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -293,6 +321,10 @@ class AutoTCN(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 23
@@ -328,6 +360,10 @@ class AutoDeepAR(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -357,6 +393,10 @@ class AutoDeepAR(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 26
@@ -391,6 +431,10 @@ class AutoDilatedRNN(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -422,6 +466,10 @@ class AutoDilatedRNN(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 30
@@ -454,6 +502,10 @@ class AutoMLP(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -483,6 +535,10 @@ class AutoMLP(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 33
@@ -513,6 +569,10 @@ class AutoNBEATS(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -542,6 +602,10 @@ class AutoNBEATS(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 36
@@ -572,6 +636,10 @@ class AutoNBEATSx(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -601,6 +669,10 @@ class AutoNBEATSx(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 39
@@ -644,6 +716,10 @@ class AutoNHITS(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -673,6 +749,10 @@ class AutoNHITS(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 43
@@ -705,6 +785,10 @@ class AutoTFT(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -734,6 +818,10 @@ class AutoTFT(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 46
@@ -766,6 +854,10 @@ class AutoVanillaTransformer(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -795,6 +887,10 @@ class AutoVanillaTransformer(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 49
@@ -827,6 +923,10 @@ class AutoInformer(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -856,6 +956,10 @@ class AutoInformer(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 52
@@ -888,6 +992,10 @@ class AutoAutoformer(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -917,6 +1025,10 @@ class AutoAutoformer(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 55
@@ -948,6 +1060,10 @@ class AutoFEDformer(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -977,6 +1093,10 @@ class AutoFEDformer(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 58
@@ -1011,6 +1131,10 @@ class AutoPatchTST(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -1040,6 +1164,10 @@ class AutoPatchTST(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 62
@@ -1072,6 +1200,10 @@ class AutoTimesNet(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -1101,6 +1233,10 @@ class AutoTimesNet(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 66
@@ -1134,6 +1270,10 @@ class AutoStemGNN(BaseAuto):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         # Define search space, input/output sizes
         if config is None:
@@ -1166,6 +1306,10 @@ class AutoStemGNN(BaseAuto):
             verbose=verbose,
             alias=alias,
             backend=backend,
+            threads_per_trial=threads_per_trial,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
 
 # %% ../nbs/models.ipynb 70
@@ -1185,6 +1329,9 @@ class AutoHINT(BaseAuto):
         refit_with_val=False,
         verbose=False,
         alias=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         super(AutoHINT, self).__init__(
             cls_model=cls_model,
@@ -1199,6 +1346,9 @@ class AutoHINT(BaseAuto):
             gpus=gpus,
             verbose=verbose,
             alias=alias,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
+            trial_max_steps=trial_max_steps,
         )
         # Validate presence of reconciliation strategy
         # parameter in configuration space
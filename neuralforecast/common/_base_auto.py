@@ -4,15 +4,19 @@
 __all__ = ['BaseAuto']
 
 # %% ../../nbs/common.base_auto.ipynb 5
+import os
 from copy import deepcopy
 from os import cpu_count
+from tempfile import TemporaryDirectory
 
 import torch
 import pytorch_lightning as pl
 
 from pytorch_lightning.callbacks import TQDMProgressBar
-from ray import air, tune
+from pytorch_lightning.callbacks.early_stopping import EarlyStopping
+from ray import air, cloudpickle, tune
 from ray.tune.integration.pytorch_lightning import TuneReportCallback
+from ray.tune.schedulers import ASHAScheduler
 from ray.tune.search.basic_variant import BasicVariantGenerator
 
 # %% ../../nbs/common.base_auto.ipynb 6
@@ -37,6 +41,58 @@ class MockTrial:
         return "float"
 
 # %% ../../nbs/common.base_auto.ipynb 7
+class _OptunaPruningCallback(pl.Callback):
+    # Reports the validation loss of every validation check
+    # to the optuna trial and stops the fit if it gets pruned.
+    def __init__(self, trial):
+        self.trial = trial
+
+    def on_validation_end(self, trainer, pl_module):
+        import optuna
+
+        if trainer.sanity_checking or "ptl/val_loss" not in trainer.callback_metrics:
+            return
+        self.trial.report(
+            trainer.callback_metrics["ptl/val_loss"].item(), step=trainer.global_step
+        )
+        if self.trial.should_prune():
+            raise optuna.TrialPruned(f"Trial pruned at step {trainer.global_step}.")
+
+# %% ../../nbs/common.base_auto.ipynb 8
+def _optuna_worker(
+    payload, dataset, study_name, storage, n_trials, timeout, threads_per_trial, verbose
+):
+    # Runs a share of the trials of a study in a separate process,
+    # the dataset tensors arrive through shared memory.
+    import optuna
+
+    torch.set_num_threads(threads_per_trial)
+    auto, cls_model, config, sampler, pruner, val_size, test_size = cloudpickle.loads(
+        payload
+    )
+    if sampler is not None:
+        # Avoid repeating the same suggestions in every worker
+        sampler.reseed_rng()
+    study = optuna.load_study(
+        study_name=study_name, storage=storage, sampler=sampler, pruner=pruner
+    )
+
+    def objective(trial):
+        valid_loss, _ = auto._optuna_objective(
+            trial=trial,
+            cls_model=cls_model,
+            config=config,
+            dataset=dataset,
+            val_size=val_size,
+            test_size=test_size,
+        )
+        return valid_loss
+
+    study.optimize(
+        objective, n_trials=n_trials, timeout=timeout, show_progress_bar=verbose
+    )
+
+# %% ../../nbs/common.base_auto.ipynb 9
 class BaseAuto(pl.LightningModule):
     """
     Class for Automatic Hyperparameter Optimization, it builds on top of `ray` to
@@ -64,10 +120,15 @@ class BaseAuto(pl.LightningModule):
     search_alg : ray.tune.search variant or optuna.sampler
         For ray see https://docs.ray.io/en/latest/tune/api_docs/suggestion.html
         For optuna see https://optuna.readthedocs.io/en/stable/reference/samplers/index.html.
+    scheduler : ray.tune.schedulers variant or optuna.pruners, optional (default=None)
+        Early termination of unpromising trials based on the validation loss of every validation check.
+        Defaults to ray's `ASHAScheduler` and optuna's `MedianPruner`.
+        For ray see https://docs.ray.io/en/latest/tune/api/schedulers.html
+        For optuna see https://optuna.readthedocs.io/en/stable/reference/pruners.html.
     num_samples : int
         Number of hyperparameter optimization steps/samples.
     cpus : int (default=os.cpu_count())
-        Number of cpus to use during optimization. Only used with ray tune.
+        Number of cpus to use during optimization. Used with ray tune, and with optuna when `threads_per_trial` is set.
     gpus : int (default=torch.cuda.device_count())
         Number of gpus to use during optimization, default all available. Only used with ray tune.
     refit_with_val : bool
@@ -78,6 +139,14 @@ class BaseAuto(pl.LightningModule):
         Custom name of the model.
     backend : str (default='ray')
         Backend to use for searching the hyperparameter space, can be either 'ray' or 'optuna'.
+    threads_per_trial : int, optional (default=None)
+        Number of torch threads of each optuna trial. When set, `cpus // threads_per_trial` trials
+        run concurrently in separate processes that share a SQLite storage, otherwise
+        the trials run serially in the current process. Only used with optuna.
+    time_budget_s : float, optional (default=None)
+        Wall-clock budget of the whole hyperparameter search in seconds, no new trials start after it.
+    trial_max_steps : int, optional (default=None)
+        Upper bound on the `max_steps` of each trial, the refit of the best configuration uses its own `max_steps`.
     """
 
     def __init__(
@@ -95,6 +164,10 @@ class BaseAuto(pl.LightningModule):
         verbose=False,
         alias=None,
         backend="ray",
+        threads_per_trial=None,
+        scheduler=None,
+        time_budget_s=None,
+        trial_max_steps=None,
     ):
         super(BaseAuto, self).__init__()
         self.save_hyperparameters()  # Allows instantiation from a checkpoint from class
@@ -166,6 +239,10 @@ class BaseAuto(pl.LightningModule):
         self.verbose = verbose
         self.alias = alias
         self.backend = backend
+        self.threads_per_trial = threads_per_trial
+        self.scheduler = scheduler
+        self.time_budget_s = time_budget_s
+        self.trial_max_steps = trial_max_steps
 
         # Base Class attributes
         self.SAMPLING_TYPE = cls_model.SAMPLING_TYPE
@@ -173,6 +250,31 @@ class BaseAuto(pl.LightningModule):
     def __repr__(self):
         return type(self).__name__ if self.alias is None else self.alias
 
+    def _trial_config(self, config_step, report_callback):
+        # Callbacks, dtypes and step budget of a single trial
+        callbacks = [TQDMProgressBar(), report_callback]
+        if config_step.get("early_stop_patience_steps", -1) > 0:
+            callbacks += [
+                EarlyStopping(
+                    monitor="ptl/val_loss",
+                    patience=config_step["early_stop_patience_steps"],
+                )
+            ]
+        if "callbacks" in config_step.keys():
+            callbacks += config_step["callbacks"]
+        config_step = {**config_step, **{"callbacks": callbacks}}
+
+        # Protect dtypes from tune samplers
+        if "batch_size" in config_step.keys():
+            config_step["batch_size"] = int(config_step["batch_size"])
+        if "windows_batch_size" in config_step.keys():
+            config_step["windows_batch_size"] = int(config_step["windows_batch_size"])
+
+        if self.trial_max_steps is not None:
+            max_steps = config_step.get("max_steps", self.trial_max_steps)
+            config_step["max_steps"] = min(int(max_steps), self.trial_max_steps)
+        return config_step
+
     def _train_tune(self, config_step, cls_model, dataset, val_size, test_size):
         """BaseAuto._train_tune
 
@@ -188,19 +290,9 @@ class BaseAuto(pl.LightningModule):
         `test_size`: int, test size for temporal cross-validation.<br>
         """
         metrics = {"loss": "ptl/val_loss"}
-        callbacks = [
-            TQDMProgressBar(),
-            TuneReportCallback(metrics, on="validation_end"),
-        ]
-        if "callbacks" in config_step.keys():
-            callbacks += config_step["callbacks"]
-        config_step = {**config_step, **{"callbacks": callbacks}}
-
-        # Protect dtypes from tune samplers
-        if "batch_size" in config_step.keys():
-            config_step["batch_size"] = int(config_step["batch_size"])
-        if "windows_batch_size" in config_step.keys():
-            config_step["windows_batch_size"] = int(config_step["windows_batch_size"])
+        config_step = self._trial_config(
+            config_step, TuneReportCallback(metrics, on="validation_end")
+        )
 
         # Tune session receives validation signal
         # from the specialized PL TuneReportCallback
@@ -224,6 +316,8 @@ class BaseAuto(pl.LightningModule):
         num_samples,
         search_alg,
         config,
+        scheduler=None,
+        time_budget_s=None,
     ):
         train_fn_with_parameters = tune.with_parameters(
             self._train_tune,
@@ -253,6 +347,8 @@ class BaseAuto(pl.LightningModule):
                 mode="min",
                 num_samples=num_samples,
                 search_alg=search_alg,
+                scheduler=scheduler if scheduler is not None else ASHAScheduler(),
+                time_budget_s=time_budget_s,
             ),
             param_space=config,
         )
@@ -303,34 +399,123 @@ class BaseAuto(pl.LightningModule):
         num_samples,
         search_alg,
         config,
+        scheduler=None,
+        time_budget_s=None,
     ):
         import optuna
 
         def objective(trial):
-            cfg = config(trial)
-            fitted_model = self._fit_model(
+            valid_loss, cfg = self._optuna_objective(
+                trial=trial,
                 cls_model=cls_model,
-                config=cfg,
+                config=config,
                 dataset=dataset,
                 val_size=val_size,
                 test_size=test_size,
             )
             trial.set_user_attr("ALL_PARAMS", cfg)
-            return fitted_model.trainer.callback_metrics["valid_loss"].item()
+            return valid_loss
 
         if isinstance(search_alg, optuna.samplers.BaseSampler):
             sampler = search_alg
         else:
             sampler = None
+        if isinstance(scheduler, optuna.pruners.BasePruner):
+            pruner = scheduler
+        else:
+            pruner = None
 
-        study = optuna.create_study(sampler=sampler, direction="minimize")
+        study = optuna.create_study(
+            sampler=sampler, pruner=pruner, direction="minimize"
+        )
         study.optimize(
             objective,
             n_trials=num_samples,
+            timeout=time_budget_s,
             show_progress_bar=verbose,
         )
         return study
 
+    def _optuna_objective(self, trial, cls_model, config, dataset, val_size, test_size):
+        cfg = config(trial)
+        fitted_model = self._fit_model(
+            cls_model=cls_model,
+            config=self._trial_config(cfg, _OptunaPruningCallback(trial)),
+            dataset=dataset,
+            val_size=val_size,
+            test_size=test_size,
+        )
+        return fitted_model.trainer.callback_metrics["valid_loss"].item(), cfg
+
+    def _optuna_parallel_tune_model(
+        self,
+        cls_model,
+        dataset,
+        val_size,
+        test_size,
+        verbose,
+        num_samples,
+        search_alg,
+        config,
+        cpus,
+        threads_per_trial,
+        scheduler=None,
+        time_budget_s=None,
+    ):
+        import optuna
+        import torch.multiprocessing as mp
+
+        if isinstance(search_alg, optuna.samplers.BaseSampler):
+            sampler = search_alg
+        else:
+            sampler = None
+        if isinstance(scheduler, optuna.pruners.BasePruner):
+            pruner = scheduler
+        else:
+            pruner = None
+
+        n_workers = min(max(cpus // threads_per_trial, 1), num_samples)
+        payload = cloudpickle.dumps(
+            (self, cls_model, config, sampler, pruner, val_size, test_size)
+        )
+        ctx = mp.get_context("spawn")
+        with TemporaryDirectory() as tmpdir:
+            storage = f"sqlite:///{os.path.join(tmpdir, 'optuna.db')}"
+            study = optuna.create_study(
+                storage=storage, sampler=sampler, pruner=pruner, direction="minimize"
+            )
+            workers = []
+            for i in range(n_workers):
+                n_trials = num_samples // n_workers + int(i < num_samples % n_workers)
+                worker = ctx.Process(
+                    target=_optuna_worker,
+                    args=(
+                        payload,
+                        dataset,
+                        study.study_name,
+                        storage,
+                        n_trials,
+                        time_budget_s,
+                        threads_per_trial,
+                        verbose and i == 0,
+                    ),
+                )
+                worker.start()
+                workers.append(worker)
+            for worker in workers:
+                worker.join()
+            if any(worker.exitcode != 0 for worker in workers):
+                raise RuntimeError("An optuna worker failed, see the traceback above.")
+
+            # Move the finished study out of the temporary storage
+            in_memory = optuna.storages.InMemoryStorage()
+            optuna.copy_study(
+                from_study_name=study.study_name,
+                from_storage=storage,
+                to_storage=in_memory,
+            )
+        return optuna.load_study(study_name=study.study_name, storage=in_memory)
+
     def _fit_model(self, cls_model, config, dataset, val_size, test_size):
         model = cls_model(**config)
         model.fit(dataset, val_size=val_size, test_size=test_size)
@@ -356,6 +541,7 @@ class BaseAuto(pl.LightningModule):
         # we need val_size > 0 to perform
         # hyperparameter selection.
         search_alg = deepcopy(self.search_alg)
+        scheduler = deepcopy(self.scheduler)
         val_size = val_size if val_size > 0 else self.h
         if self.backend == "ray":
             results = self._tune_model(
@@ -369,9 +555,11 @@ class BaseAuto(pl.LightningModule):
                 num_samples=self.num_samples,
                 search_alg=search_alg,
                 config=self.config,
+                scheduler=scheduler,
+                time_budget_s=self.time_budget_s,
             )
             best_config = results.get_best_result().config
-        else:
+        elif self.threads_per_trial is None:
             results = self._optuna_tune_model(
                 cls_model=self.cls_model,
                 dataset=dataset,
@@ -381,8 +569,29 @@ class BaseAuto(pl.LightningModule):
                 num_samples=self.num_samples,
                 search_alg=search_alg,
                 config=self.config,
+                scheduler=scheduler,
+                time_budget_s=self.time_budget_s,
             )
             best_config = results.best_trial.user_attrs["ALL_PARAMS"]
+        else:
+            from optuna.trial import FixedTrial
+
+            results = self._optuna_parallel_tune_model(
+                cls_model=self.cls_model,
+                dataset=dataset,
+                val_size=val_size,
+                test_size=test_size,
+                verbose=self.verbose,
+                num_samples=self.num_samples,
+                search_alg=search_alg,
+                config=self.config,
+                cpus=self.cpus,
+                threads_per_trial=self.threads_per_trial,
+                scheduler=scheduler,
+                time_budget_s=self.time_budget_s,
+            )
+            # The shared storage only keeps the sampled parameters
+            best_config = self.config(FixedTrial(results.best_trial.params))
         self.model = self._fit_model(
             cls_model=self.cls_model,
             config=best_config,
@@ -14,6 +14,7 @@ import pytorch_lightning as pl
 from pytorch_lightning.callbacks import TQDMProgressBar
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
 
+from ._compile import compiled_forward
 from ._scalers import TemporalNorm
 from ..tsdataset import TimeSeriesDataModule
 
@@ -50,6 +51,9 @@ class BaseMultivariate(pl.LightningModule):
         stat_exog_list=None,
         num_workers_loader=0,
         drop_last_loader=False,
+        dataloader_kwargs=None,
+        compile=False,
+        compile_mode="default",
         random_seed=1,
         alias=None,
         **trainer_kwargs,
@@ -143,6 +147,12 @@ class BaseMultivariate(pl.LightningModule):
         # DataModule arguments
         self.num_workers_loader = num_workers_loader
         self.drop_last_loader = drop_last_loader
+        self.dataloader_kwargs = (
+            dataloader_kwargs if dataloader_kwargs is not None else {}
+        )
+        # torch.compile of the forward, see `compiled_forward`
+        self.torch_compile = compile
+        self.compile_mode = compile_mode
         # used by on_validation_epoch_end hook
         self.validation_step_outputs = []
         self.alias = alias
@@ -371,6 +381,21 @@ class BaseMultivariate(pl.LightningModule):
             stat_exog,
         )
 
+    def _forward(self, windows_batch):
+        if self.torch_compile:
+            # The static variables are per series, not per window
+            batch_keys = ["insample_y", "insample_mask", "futr_exog", "hist_exog"]
+            output = compiled_forward(
+                self, windows_batch, mode=self.compile_mode, batch_keys=batch_keys
+            )
+        else:
+            output = self(windows_batch)
+        # With precision='bf16-mixed' the outputs are bfloat16, the losses
+        # and the inverse normalization run in float32
+        if isinstance(output, (tuple, list)):
+            return type(output)(o.float() for o in output)
+        return output.float()
+
     def training_step(self, batch, batch_idx):
         # Create and normalize windows [batch_size, n_series, C, L+H]
         windows = self._create_windows(batch, step="train")
@@ -396,7 +421,7 @@ class BaseMultivariate(pl.LightningModule):
         )  # [n_series, n_feats]
 
         # Model Predictions
-        output = self(windows_batch)
+        output = self._forward(windows_batch)
         if self.loss.is_distribution_output:
             outsample_y, y_loc, y_scale = self._inv_normalization(
                 y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
@@ -447,7 +472,7 @@ class BaseMultivariate(pl.LightningModule):
         )  # [Ws, 1]
 
         # Model Predictions
-        output = self(windows_batch)
+        output = self._forward(windows_batch)
         if self.loss.is_distribution_output:
             outsample_y, y_loc, y_scale = self._inv_normalization(
                 y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
@@ -512,7 +537,7 @@ class BaseMultivariate(pl.LightningModule):
         )  # [Ws, 1]
 
         # Model Predictions
-        output = self(windows_batch)
+        output = self._forward(windows_batch)
         if self.loss.is_distribution_output:
             _, y_loc, y_scale = self._inv_normalization(
                 y_hat=output[0], temporal_cols=batch["temporal_cols"]
@@ -586,6 +611,7 @@ class BaseMultivariate(pl.LightningModule):
             batch_size=self.n_series,
             num_workers=self.num_workers_loader,
             drop_last=self.drop_last_loader,
+            **self.dataloader_kwargs,
         )
 
         if self.val_check_steps > self.max_steps:
@@ -645,7 +671,9 @@ class BaseMultivariate(pl.LightningModule):
         self.predict_step_size = step_size
         self.decompose_forecast = False
         datamodule = TimeSeriesDataModule(
-            dataset=dataset, batch_size=self.n_series, **data_module_kwargs
+            dataset=dataset,
+            batch_size=self.n_series,
+            **{**self.dataloader_kwargs, **data_module_kwargs},
         )
 
         # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
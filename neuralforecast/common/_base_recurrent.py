@@ -14,6 +14,8 @@ import pytorch_lightning as pl
 from pytorch_lightning.callbacks import TQDMProgressBar
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
 
+from ._compile import compiled_forward
+from ._onnx import OnnxRecurrent, export_model
 from ._scalers import TemporalNorm
 from ..tsdataset import TimeSeriesDataModule
 
@@ -50,6 +52,9 @@ class BaseRecurrent(pl.LightningModule):
         stat_exog_list=None,
         num_workers_loader=0,
         drop_last_loader=False,
+        dataloader_kwargs=None,
+        compile=False,
+        compile_mode="default",
         random_seed=1,
         alias=None,
         **trainer_kwargs,
@@ -155,6 +160,12 @@ class BaseRecurrent(pl.LightningModule):
         # DataModule arguments
         self.num_workers_loader = num_workers_loader
         self.drop_last_loader = drop_last_loader
+        self.dataloader_kwargs = (
+            dataloader_kwargs if dataloader_kwargs is not None else {}
+        )
+        # torch.compile of the forward, see `compiled_forward`
+        self.torch_compile = compile
+        self.compile_mode = compile_mode
         # used by on_validation_epoch_end hook
         self.validation_step_outputs = []
         self.alias = alias
@@ -346,6 +357,17 @@ class BaseRecurrent(pl.LightningModule):
             stat_exog,
         )
 
+    def _forward(self, windows_batch):
+        if self.torch_compile:
+            output = compiled_forward(self, windows_batch, mode=self.compile_mode)
+        else:
+            output = self(windows_batch)
+        # With precision='bf16-mixed' the outputs are bfloat16, the losses
+        # and the inverse normalization run in float32
+        if isinstance(output, (tuple, list)):
+            return type(output)(o.float() for o in output)
+        return output.float()
+
     def training_step(self, batch, batch_idx):
         # Create and normalize windows [Ws, L+H, C]
         batch = self._normalization(
@@ -373,7 +395,7 @@ class BaseRecurrent(pl.LightningModule):
         )  # [B, S]
 
         # Model predictions
-        output = self(windows_batch)  # tuple([B, seq_len, H, output])
+        output = self._forward(windows_batch)  # tuple([B, seq_len, H, output])
         if self.loss.is_distribution_output:
             outsample_y, y_loc, y_scale = self._inv_normalization(
                 y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
@@ -442,7 +464,7 @@ class BaseRecurrent(pl.LightningModule):
         outsample_mask = outsample_mask[:, -val_windows:-1, :]
 
         # Model predictions
-        output = self(windows_batch)  # tuple([B, seq_len, H, output])
+        output = self._forward(windows_batch)  # tuple([B, seq_len, H, output])
         if self.loss.is_distribution_output:
             output = [arg[:, -val_windows:-1] for arg in output]
             outsample_y, y_loc, y_scale = self._inv_normalization(
@@ -536,7 +558,7 @@ class BaseRecurrent(pl.LightningModule):
         )  # [B, S]
 
         # Model Predictions
-        output = self(windows_batch)  # tuple([B, seq_len, H], ...)
+        output = self._forward(windows_batch)  # tuple([B, seq_len, H], ...)
         if self.loss.is_distribution_output:
             _, y_loc, y_scale = self._inv_normalization(
                 y_hat=output[0], temporal_cols=batch["temporal_cols"]
@@ -618,6 +640,7 @@ class BaseRecurrent(pl.LightningModule):
             valid_batch_size=self.valid_batch_size,
             num_workers=self.num_workers_loader,
             drop_last=self.drop_last_loader,
+            **self.dataloader_kwargs,
         )
 
         if self.val_check_steps > self.max_steps:
@@ -684,7 +707,7 @@ class BaseRecurrent(pl.LightningModule):
             dataset=dataset,
             valid_batch_size=self.valid_batch_size,
             num_workers=self.num_workers_loader,
-            **data_module_kwargs,
+            **{**self.dataloader_kwargs, **data_module_kwargs},
         )
         fcsts = trainer.predict(self, datamodule=datamodule)
         if self.test_size > 0:
@@ -700,6 +723,19 @@ class BaseRecurrent(pl.LightningModule):
             fcsts = fcsts.reshape(-1, len(self.loss.output_names))
         return fcsts
 
+    def export_onnx(self, path, opset_version=17):
+        """Export ONNX.
+
+        Exports the forecast of the last window of each series to the ONNX graph at `path`,
+        with the `TemporalNorm` normalization and its inverse in the graph, see `OnnxForecaster`
+        to run it. The models with distribution losses can not be exported.
+
+        **Parameters:**<br>
+        `path`: str, path of the ONNX file.<br>
+        `opset_version`: int=17, ONNX opset of the graph.<br>
+        """
+        export_model(self, OnnxRecurrent, path=path, opset_version=opset_version)
+
     def set_test_size(self, test_size):
         self.test_size = test_size
 
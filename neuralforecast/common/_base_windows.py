@@ -13,9 +13,12 @@ import torch.nn as nn
 import pytorch_lightning as pl
 from pytorch_lightning.callbacks import TQDMProgressBar
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
+from torch.ao.quantization import quantize_dynamic
 
+from ._compile import compiled_forward
+from ._onnx import OnnxWindows, export_model
 from ._scalers import TemporalNorm
-from ..tsdataset import TimeSeriesDataModule
+from ..tsdataset import TimeSeriesDataModule, TimeSeriesWindowsDataset
 
 # %% ../../nbs/common.base_windows.ipynb 5
 class BaseWindows(pl.LightningModule):
@@ -52,8 +55,13 @@ class BaseWindows(pl.LightningModule):
         hist_exog_list=None,
         stat_exog_list=None,
         exclude_insample_y=False,
+        windows_sampling="series",
+        valid_series_fraction=1.0,
         num_workers_loader=0,
         drop_last_loader=False,
+        dataloader_kwargs=None,
+        compile=False,
+        compile_mode="default",
         random_seed=1,
         alias=None,
         **trainer_kwargs,
@@ -108,6 +116,22 @@ class BaseWindows(pl.LightningModule):
         self.windows_batch_size = windows_batch_size
         self.step_size = step_size
 
+        # Training windows sampling
+        if windows_sampling not in ["series", "global"]:
+            raise ValueError(
+                f"windows_sampling must be 'series' or 'global', got {windows_sampling}"
+            )
+        if (windows_sampling == "global") and (windows_batch_size is None):
+            raise ValueError("windows_sampling='global' requires a windows_batch_size")
+        self.windows_sampling = windows_sampling
+
+        # Validation series subsample
+        if not (0 < valid_series_fraction <= 1):
+            raise ValueError(
+                f"valid_series_fraction must be in (0, 1], got {valid_series_fraction}"
+            )
+        self.valid_series_fraction = valid_series_fraction
+
         # Variables
         self.futr_exog_list = futr_exog_list if futr_exog_list is not None else []
         self.hist_exog_list = hist_exog_list if hist_exog_list is not None else []
@@ -161,12 +185,25 @@ class BaseWindows(pl.LightningModule):
             trainer_kwargs["enable_checkpointing"] = False
 
         self.trainer_kwargs = trainer_kwargs
+        # bfloat16 storage of the validation windows cache with bf16 precision
+        bf16 = "bf16" in str(trainer_kwargs.get("precision", ""))
+        self.valid_windows_dtype = torch.bfloat16 if bf16 else torch.float
 
         # DataModule arguments
         self.num_workers_loader = num_workers_loader
         self.drop_last_loader = drop_last_loader
+        self.dataloader_kwargs = (
+            dataloader_kwargs if dataloader_kwargs is not None else {}
+        )
+        # torch.compile of the forward, see `compiled_forward`
+        self.torch_compile = compile
+        self.compile_mode = compile_mode
         # used by on_validation_epoch_end hook
         self.validation_step_outputs = []
+        # validation windows cache, filled during fit
+        self._valid_windows = {}
+        # int8 linear layers, see `quantize`
+        self.quantized = False
         self.alias = alias
 
     def __repr__(self):
@@ -194,7 +231,17 @@ class BaseWindows(pl.LightningModule):
         temporal_cols = batch["temporal_cols"]
         temporal = batch["temporal"]
 
-        if step == "train":
+        if step == "train" and self.windows_sampling == "global":
+            # Windows were already sampled and gathered by the train loader
+            windows_batch = dict(
+                temporal=temporal,
+                temporal_cols=temporal_cols,
+                static=batch.get("static", None),
+                static_cols=batch.get("static_cols", None),
+            )
+            return windows_batch
+
+        elif step == "train":
             if self.val_size + self.test_size > 0:
                 cutoff = -self.val_size - self.test_size
                 temporal = temporal[:, :, :cutoff]
@@ -441,6 +488,17 @@ class BaseWindows(pl.LightningModule):
             stat_exog,
         )
 
+    def _forward(self, windows_batch):
+        if self.torch_compile and not self.quantized:
+            output = compiled_forward(self, windows_batch, mode=self.compile_mode)
+        else:
+            output = self(windows_batch)
+        # With precision='bf16-mixed' the outputs are bfloat16, the losses
+        # and the inverse normalization run in float32
+        if isinstance(output, (tuple, list)):
+            return type(output)(o.float() for o in output)
+        return output.float()
+
     def training_step(self, batch, batch_idx):
         # Create and normalize windows [Ws, L+H, C]
         windows = self._create_windows(batch, step="train")
@@ -468,7 +526,7 @@ class BaseWindows(pl.LightningModule):
         )  # [Ws, 1]
 
         # Model Predictions
-        output = self(windows_batch)
+        output = self._forward(windows_batch)
         if self.loss.is_distribution_output:
             _, y_loc, y_scale = self._inv_normalization(
                 y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
@@ -526,11 +584,14 @@ class BaseWindows(pl.LightningModule):
             )
         return valid_loss
 
-    def validation_step(self, batch, batch_idx):
-        if self.val_size == 0:
-            return np.nan
+    def _get_valid_windows(self, batch, batch_idx):
+        # Validation windows do not change during fit, they are created,
+        # normalized and parsed once per batch and reused on every check.
+        # RevIN statistics depend on learnable parameters, so its windows
+        # are cached before normalization.
+        if batch_idx in self._valid_windows:
+            return self._valid_windows[batch_idx]
 
-        # TODO: Hack to compute number of windows
         windows = self._create_windows(batch, step="val")
         n_windows = len(windows["temporal"])
 
@@ -540,17 +601,56 @@ class BaseWindows(pl.LightningModule):
             windows_batch_size = n_windows
         n_batches = int(np.ceil(n_windows / windows_batch_size))
 
-        valid_losses = []
-        batch_sizes = []
+        y_idx = batch["temporal_cols"].get_loc("y")
+        valid_windows = []
         for i in range(n_batches):
-            # Create and normalize windows [Ws, L+H, C]
-            w_idxs = np.arange(
+            # Slice windows [Ws, L+H, C]
+            w_slice = slice(
                 i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows)
             )
-            windows = self._create_windows(batch, step="val", w_idxs=w_idxs)
-            y_idx = batch["temporal_cols"].get_loc("y")
-            original_outsample_y = torch.clone(windows["temporal"][:, -self.h :, y_idx])
-            windows = self._normalization(windows=windows)
+            static = windows["static"]
+            windows_chunk = dict(
+                temporal=windows["temporal"][w_slice],
+                temporal_cols=windows["temporal_cols"],
+                static=static[w_slice] if static is not None else None,
+                static_cols=windows["static_cols"],
+            )
+            original_outsample_y = torch.clone(
+                windows_chunk["temporal"][:, -self.h :, y_idx]
+            )
+            x_shift, x_scale = None, None
+            if self.scaler.scaler_type != "revin":
+                windows_chunk = self._normalization(windows=windows_chunk)
+                x_shift, x_scale = self.scaler.x_shift, self.scaler.x_scale
+            windows_chunk["temporal"] = windows_chunk["temporal"].to(
+                self.valid_windows_dtype
+            )
+            valid_windows.append(
+                (windows_chunk, original_outsample_y, x_shift, x_scale)
+            )
+
+        self._valid_windows[batch_idx] = valid_windows
+        return valid_windows
+
+    def validation_step(self, batch, batch_idx):
+        if self.val_size == 0:
+            return np.nan
+
+        valid_losses = []
+        batch_sizes = []
+        for windows, original_outsample_y, x_shift, x_scale in self._get_valid_windows(
+            batch, batch_idx
+        ):
+            # Normalize a float32 copy of the windows or restore the cached statistics
+            if self.scaler.scaler_type == "revin":
+                windows = dict(
+                    windows, temporal=windows["temporal"].to(torch.float, copy=True)
+                )
+                windows = self._normalization(windows=windows)
+            else:
+                windows = dict(windows, temporal=windows["temporal"].float())
+                self.scaler.x_shift = x_shift
+                self.scaler.x_scale = x_scale
 
             # Parse windows
             (
@@ -571,7 +671,7 @@ class BaseWindows(pl.LightningModule):
             )  # [Ws, 1]
 
             # Model Predictions
-            output_batch = self(windows_batch)
+            output_batch = self._forward(windows_batch)
             valid_loss_batch = self._compute_valid_loss(
                 outsample_y=original_outsample_y,
                 output=output_batch,
@@ -639,7 +739,7 @@ class BaseWindows(pl.LightningModule):
             )  # [Ws, 1]
 
             # Model Predictions
-            output_batch = self(windows_batch)
+            output_batch = self._forward(windows_batch)
             # Inverse normalization and sampling
             if self.loss.is_distribution_output:
                 _, y_loc, y_scale = self._inv_normalization(
@@ -687,6 +787,8 @@ class BaseWindows(pl.LightningModule):
         `random_seed`: int=None, random_seed for pytorch initializer and numpy generators, overwrites model.__init__'s.<br>
         `test_size`: int, test size for temporal cross-validation.<br>
         """
+        if self.quantized:
+            raise Exception("Quantized models can not be trained.")
 
         # Check exogenous variables are contained in dataset
         temporal_cols = set(dataset.temporal_cols.tolist())
@@ -713,12 +815,39 @@ class BaseWindows(pl.LightningModule):
 
         self.val_size = val_size
         self.test_size = test_size
+        if self.windows_sampling == "global":
+            train_dataset = TimeSeriesWindowsDataset(
+                dataset=dataset,
+                input_size=self.input_size,
+                h=self.h,
+                step_size=self.step_size,
+                start_padding_enabled=self.start_padding_enabled,
+                cutoff=self.val_size + self.test_size,
+            )
+            batch_size = self.windows_batch_size
+        else:
+            train_dataset = dataset
+            batch_size = self.batch_size
+        val_dataset = dataset
+        if (self.val_size > 0) and (self.valid_series_fraction < 1):
+            # Fixed subsample of series for validation during the whole fit
+            n_valid = max(
+                int(np.ceil(self.valid_series_fraction * dataset.n_groups)), 1
+            )
+            rng = np.random.default_rng(random_seed)
+            valid_idxs = np.sort(
+                rng.choice(dataset.n_groups, size=n_valid, replace=False)
+            )
+            val_dataset = torch.utils.data.Subset(dataset, valid_idxs.tolist())
         datamodule = TimeSeriesDataModule(
             dataset=dataset,
-            batch_size=self.batch_size,
+            batch_size=batch_size,
             valid_batch_size=self.valid_batch_size,
             num_workers=self.num_workers_loader,
             drop_last=self.drop_last_loader,
+            train_dataset=train_dataset,
+            val_dataset=val_dataset,
+            **self.dataloader_kwargs,
         )
 
         if self.val_check_steps > self.max_steps:
@@ -731,7 +860,9 @@ class BaseWindows(pl.LightningModule):
         self.trainer_kwargs["check_val_every_n_epoch"] = None
 
         trainer = pl.Trainer(**self.trainer_kwargs)
+        self._valid_windows = {}
         trainer.fit(self, datamodule=datamodule)
+        self._valid_windows = {}  # free memory
 
     def predict(
         self,
@@ -739,6 +870,7 @@ class BaseWindows(pl.LightningModule):
         test_size=None,
         step_size=1,
         random_seed=None,
+        quantized=False,
         **data_module_kwargs,
     ):
         """Predict.
@@ -750,6 +882,7 @@ class BaseWindows(pl.LightningModule):
         `test_size`: int=None, test size for temporal cross-validation.<br>
         `step_size`: int=1, Step size between each window.<br>
         `random_seed`: int=None, random_seed for pytorch initializer and numpy generators, overwrites model.__init__'s.<br>
+        `quantized`: bool=False, predict with int8 linear layers, on CPU, without quantizing the model, see `quantize`.<br>
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
 
@@ -781,7 +914,7 @@ class BaseWindows(pl.LightningModule):
         datamodule = TimeSeriesDataModule(
             dataset=dataset,
             valid_batch_size=self.valid_batch_size,
-            **data_module_kwargs,
+            **{**self.dataloader_kwargs, **data_module_kwargs},
         )
 
         # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
@@ -791,8 +924,20 @@ class BaseWindows(pl.LightningModule):
         ):
             pred_trainer_kwargs["devices"] = [0]
 
+        # The quantized kernels only run on CPU
+        float_layers = None
+        if quantized or self.quantized:
+            pred_trainer_kwargs["accelerator"] = "cpu"
+            pred_trainer_kwargs["devices"] = 1
+        if quantized and not self.quantized:
+            float_layers = self._set_layers(self._quantized_linear_layers())
+
         trainer = pl.Trainer(**pred_trainer_kwargs)
-        fcsts = trainer.predict(self, datamodule=datamodule)
+        try:
+            fcsts = trainer.predict(self, datamodule=datamodule)
+        finally:
+            if float_layers is not None:
+                self._set_layers(float_layers)
         fcsts = torch.vstack(fcsts).numpy().flatten()
         fcsts = fcsts.reshape(-1, len(self.loss.output_names))
         return fcsts
@@ -818,13 +963,96 @@ class BaseWindows(pl.LightningModule):
         datamodule = TimeSeriesDataModule(
             dataset=dataset,
             valid_batch_size=self.valid_batch_size,
-            **data_module_kwargs,
+            **{**self.dataloader_kwargs, **data_module_kwargs},
         )
         trainer = pl.Trainer(**self.trainer_kwargs)
         fcsts = trainer.predict(self, datamodule=datamodule)
         self.decompose_forecast = False  # Default decomposition back to false
         return torch.vstack(fcsts).numpy()
 
+    def _quantized_linear_layers(self):
+        """Dynamic int8 copies of the `nn.Linear` layers, by module name."""
+        names = [
+            name for name, module in self.named_modules() if type(module) is nn.Linear
+        ]
+        layers = nn.ModuleList([self.get_submodule(name) for name in names])
+        with warnings.catch_warnings():
+            # torch.ao.quantization is deprecated in favor of torchao
+            warnings.simplefilter("ignore")
+            layers = quantize_dynamic(layers, {nn.Linear}, dtype=torch.qint8)
+        return dict(zip(names, layers))
+
+    def _set_layers(self, layers):
+        """Replaces the modules of `layers` by module name, returns the replaced ones."""
+        replaced = {}
+        for name, layer in layers.items():
+            parent_name, _, attr = name.rpartition(".")
+            parent = self.get_submodule(parent_name)
+            replaced[name] = getattr(parent, attr)
+            setattr(parent, attr, layer)
+        return replaced
+
+    def quantize(self, dataset=None, max_drift=None):
+        """Quantize.
+
+        Post-training dynamic quantization of the linear layers for CPU inference,
+        the weights are stored in int8 and the activations are quantized on the fly.
+        The model is quantized in place, it is saved and loaded quantized and can not be trained anymore.
+
+        With a `dataset`, the forecasts of its last `h` values by the quantized and the float
+        model are compared, the accuracy drift is the relative change of their mean absolute error.
+
+        **Parameters:**<br>
+        `dataset`: NeuralForecast's `TimeSeriesDataset`, optional, holdout to measure the accuracy drift.<br>
+        `max_drift`: float, optional, the model is kept in float when the accuracy drift is larger.<br>
+
+        **Returns:**<br>
+        `drift`: float, accuracy drift on the holdout, None without `dataset`.
+        """
+        if self.quantized:
+            raise Exception("The model is already quantized.")
+        drift = None
+        if dataset is not None:
+            old_test_size = self.get_test_size()
+            self.set_test_size(self.h)  # Forecasts of the last h values
+            float_fcsts = self.predict(dataset=dataset)
+            quantized_fcsts = self.predict(dataset=dataset, quantized=True)
+            self.set_test_size(old_test_size)
+            rows = (dataset.indptr[1:, None] - self.h + np.arange(self.h)).reshape(-1)
+            y = dataset._column(0)[rows].numpy()[:, None]
+            drift = float(
+                np.abs(quantized_fcsts - y).mean() / np.abs(float_fcsts - y).mean() - 1
+            )
+            if (max_drift is not None) and (drift > max_drift):
+                warnings.warn(
+                    f"{repr(self)} was not quantized, its accuracy drift {drift:.4f} is larger than max_drift={max_drift}"
+                )
+                return drift
+        self._set_layers(self._quantized_linear_layers())
+        self.quantized = True
+        return drift
+
+    def on_save_checkpoint(self, checkpoint):
+        checkpoint["quantized"] = self.quantized
+
+    def on_load_checkpoint(self, checkpoint):
+        # The int8 layers must exist before loading their weights
+        if checkpoint.get("quantized", False) and not self.quantized:
+            self.quantize()
+
+    def export_onnx(self, path, opset_version=17):
+        """Export ONNX.
+
+        Exports the forecast of the last window of each series to the ONNX graph at `path`,
+        with the `TemporalNorm` normalization and its inverse in the graph, see `OnnxForecaster`
+        to run it. The models with distribution losses can not be exported.
+
+        **Parameters:**<br>
+        `path`: str, path of the ONNX file.<br>
+        `opset_version`: int=17, ONNX opset of the graph.<br>
+        """
+        export_model(self, OnnxWindows, path=path, opset_version=opset_version)
+
     def forward(self, insample_y, insample_mask):
         raise NotImplementedError("forward")
 
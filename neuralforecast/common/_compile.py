@@ -0,0 +1,87 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/common.compile.ipynb.
+
+# %% auto 0
+__all__ = ['compiled_forward']
+
+# %% ../../nbs/common.compile.ipynb 3
+import weakref
+
+import torch
+import torch.nn as nn
+
+# %% ../../nbs/common.compile.ipynb 5
+# Compiled forwards, shared by the models of a class so that the copies
+# made by `NeuralForecast` and `BaseAuto` do not compile them again
+_COMPILED_FORWARDS = {}
+# Padded batch sizes that each model already ran with
+_BATCH_SIZES = weakref.WeakKeyDictionary()
+# A batch is padded up to this many times its size to reuse a compiled graph,
+# a larger padded forward is still much cheaper than a recompilation
+_MAX_PADDING = 8
+
+
+def _bucket_size(batch_size):
+    """Smallest power of two that holds `batch_size`."""
+    return 1 << max(batch_size - 1, 0).bit_length()
+
+
+def _pad_batch(x, size):
+    if x is None:
+        return x
+    if size == x.shape[0]:
+        return x.contiguous()
+    padding = x.new_zeros((size - x.shape[0],) + x.shape[1:])
+    return torch.cat([x, padding])
+
+
+def _unpad_output(output, batch_size):
+    if isinstance(output, (tuple, list)):
+        return type(output)(_unpad_output(x, batch_size) for x in output)
+    return output[:batch_size]
+
+# %% ../../nbs/common.compile.ipynb 6
+def compiled_forward(model, windows_batch, mode="default", batch_keys=None):
+    """Runs `model.forward(windows_batch)` compiled with `torch.compile`.
+
+    The `batch_keys` entries of `windows_batch`, all of them by default, are padded
+    with zeros along their first dimension, and the output is sliced back to the
+    original batch. The batches are padded to the smallest size that the model already
+    ran with, if it is at most `_MAX_PADDING` times larger, or else to the next power
+    of two. The models with batch normalization are not padded during training,
+    the padding would change their batch statistics.
+    """
+    key = (type(model), mode)
+    if key not in _COMPILED_FORWARDS:
+        _COMPILED_FORWARDS[key] = torch.compile(
+            type(model).forward, mode=mode, dynamic=False
+        )
+    forward = _COMPILED_FORWARDS[key]
+
+    if batch_keys is None:
+        batch_keys = list(windows_batch.keys())
+    batch_size = windows_batch["insample_y"].shape[0]
+    if model.training and any(
+        isinstance(module, nn.modules.batchnorm._BatchNorm)
+        for module in model.modules()
+    ):
+        size = batch_size
+    else:
+        sizes = _BATCH_SIZES.setdefault(model, set())
+        size = min(
+            [
+                padded
+                for padded in sizes
+                if batch_size <= padded <= _MAX_PADDING * batch_size
+            ],
+            default=_bucket_size(batch_size),
+        )
+        sizes.add(size)
+    # The graphs are also specialized on the strides, the batches are often views
+    windows_batch = {
+        key: _pad_batch(x, size) if key in batch_keys else x
+        for key, x in windows_batch.items()
+    }
+    output = forward(model, windows_batch)
+    if size > batch_size:
+        output = _unpad_output(output, batch_size)
+    return output
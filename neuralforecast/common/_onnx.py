@@ -0,0 +1,224 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/common.onnx.ipynb.
+
+# %% auto 0
+__all__ = ['export_model']
+
+# %% ../../nbs/common.onnx.ipynb 3
+import io
+import json
+import warnings
+
+import numpy as np
+import pandas as pd
+import torch
+import torch.nn as nn
+
+# %% ../../nbs/common.onnx.ipynb 6
+class _OnnxModule(nn.Module):
+    """Forecast of the model on normalized inputs and its inverse normalization."""
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+        exog_cols = list(dict.fromkeys(model.hist_exog_list + model.futr_exog_list))
+        temporal_cols = pd.Index(["y"] + exog_cols + ["available_mask"])
+        # Same order as the scaler statistics of the model's batches, `y` first
+        data_cols = model._get_temporal_data_cols(temporal_cols=temporal_cols)
+        self.temporal_cols = pd.Index(data_cols + ["available_mask"])
+        self.static_cols = pd.Index(model.stat_exog_list)
+
+    def _forecast(self, windows):
+        (
+            insample_y,
+            insample_mask,
+            _,
+            _,
+            hist_exog,
+            futr_exog,
+            stat_exog,
+        ) = self.model._parse_windows(windows, windows)
+        windows_batch = dict(
+            insample_y=insample_y,
+            insample_mask=insample_mask,
+            futr_exog=futr_exog,
+            hist_exog=hist_exog,
+            stat_exog=stat_exog,
+        )
+        return self.model(windows_batch)
+
+    def _inv_normalization(self, y_hat):
+        # The y statistics broadcast over the outputs, `repeat_interleave`
+        # in the models' `_inv_normalization` does not trace well.
+        scaler = self.model.scaler
+        z = y_hat.unsqueeze(-1) if y_hat.ndim == 2 else y_hat
+        x = scaler.inverse_transform(
+            z=z, x_shift=scaler.x_shift[:, :1, :1], x_scale=scaler.x_scale[:, :1, :1]
+        )
+        return x.squeeze(-1) if y_hat.ndim == 2 else x
+
+
+class OnnxWindows(_OnnxModule):
+    """ONNX forecast of a `BaseWindows` model from its last window."""
+
+    def forward(self, temporal, static=None):
+        # Out of place normalization, the assignments of the models'
+        # `_normalization` break the negative slices of the exported graph.
+        model = self.model
+        n_cols = len(self.temporal_cols)
+        data = temporal[:, :, : n_cols - 1]
+        available_mask = temporal[:, :, n_cols - 1 :]
+        insample = (
+            torch.arange(model.input_size + model.h, device=temporal.device)
+            < model.input_size
+        )
+        data_mask = available_mask * insample[None, :, None].to(available_mask.dtype)
+        data = model.scaler.transform(x=data, mask=data_mask)
+        windows = dict(
+            temporal=torch.cat([data, available_mask], dim=2),
+            temporal_cols=self.temporal_cols,
+            static=static,
+            static_cols=self.static_cols,
+        )
+        return self._inv_normalization(self._forecast(windows))
+
+    def example_inputs(self, batch_size, n_times=None):
+        window_size = self.model.input_size + self.model.h
+        temporal = torch.randn(batch_size, window_size, len(self.temporal_cols))
+        temporal[:, :, -1] = 1.0
+        temporal[:, -self.model.h :, 0] = float("nan")
+        return temporal
+
+
+class OnnxRecurrent(_OnnxModule):
+    """ONNX forecast of a `BaseRecurrent` model from its whole series."""
+
+    def forward(self, temporal, static=None):
+        model = self.model
+        n_cols = len(self.temporal_cols)
+        n_times = temporal.shape[2]
+        data = temporal[:, : n_cols - 1]
+        available_mask = temporal[:, n_cols - 1 :]
+        insample = torch.arange(n_times, device=temporal.device) < n_times - model.h
+        data = model.scaler.transform(
+            x=data, mask=available_mask * insample.to(available_mask.dtype)
+        )
+        temporal = torch.cat([data, available_mask], dim=1)
+
+        # Windows of size 1+h gathered by index, `unfold` needs a static length
+        window_idxs = (
+            torch.arange(n_times - model.h, device=temporal.device)[:, None]
+            + torch.arange(model.h + 1, device=temporal.device)[None, :]
+        )
+        windows = temporal[:, :, window_idxs]
+        if model.inference_input_size > 0:
+            windows = windows[:, :, -(model.inference_input_size + model.h) :]
+        windows = dict(
+            temporal=windows,
+            temporal_cols=self.temporal_cols,
+            static=static,
+            static_cols=self.static_cols,
+        )
+        # Forecast of the last window
+        return self._inv_normalization(self._forecast(windows)[:, -1])
+
+    def example_inputs(self, batch_size, n_times):
+        temporal = torch.randn(batch_size, len(self.temporal_cols), n_times)
+        temporal[:, -1] = 1.0
+        temporal[:, 0, -self.model.h :] = float("nan")
+        return temporal
+
+# %% ../../nbs/common.onnx.ipynb 7
+def export_model(model, module_cls, path, opset_version=17):
+    """Traces `module_cls(model)` into the ONNX graph at `path`.
+
+    The batch size, and the length of the recurrent models' series, are dynamic.
+    With `onnxruntime` installed, the graph is checked against the model on
+    inputs of another shape, to catch the models whose forward depends on them.
+    """
+    if model.loss.is_distribution_output:
+        raise Exception(
+            f"{repr(model)} can not be exported to ONNX, the forecasts of distribution losses are sampled."
+        )
+    if getattr(model, "quantized", False):
+        raise Exception("Quantized models can not be exported to ONNX.")
+    import onnx
+
+    recurrent = module_cls is OnnxRecurrent
+    module = module_cls(model).eval()
+    input_names = ["temporal"]
+    dynamic_axes = {
+        "temporal": {0: "batch", 2: "time"} if recurrent else {0: "batch"},
+        "y_hat": {0: "batch"},
+    }
+    if len(model.stat_exog_list):
+        input_names.append("static")
+        dynamic_axes["static"] = {0: "batch"}
+    n_times = max(model.input_size, 1) + 2 * model.h
+    device = next(model.parameters()).device
+
+    def example_inputs(batch_size, n_times):
+        inputs = [module.example_inputs(batch_size=batch_size, n_times=n_times)]
+        if len(model.stat_exog_list):
+            inputs.append(torch.randn(batch_size, len(model.stat_exog_list)))
+        return tuple(x.to(device) for x in inputs)
+
+    training = model.training
+    model.eval()
+    try:
+        buffer = io.BytesIO()
+        with torch.no_grad(), warnings.catch_warnings():
+            # The legacy exporter warns about its deprecation and the traced shapes
+            warnings.simplefilter("ignore")
+            torch.onnx.export(
+                module,
+                example_inputs(2, n_times),
+                buffer,
+                dynamo=False,
+                input_names=input_names,
+                output_names=["y_hat"],
+                dynamic_axes=dynamic_axes,
+                opset_version=opset_version,
+            )
+        onnx_model = onnx.load_from_string(buffer.getvalue())
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            ort = None
+        if ort is not None:
+            inputs = example_inputs(3, n_times + 1)
+            with torch.no_grad():
+                expected = module(*inputs).cpu().numpy()
+            options = ort.SessionOptions()
+            options.log_severity_level = 4  # the failed runs are reported below
+            session = ort.InferenceSession(
+                buffer.getvalue(), options, providers=["CPUExecutionProvider"]
+            )
+            try:
+                actual = session.run(
+                    None,
+                    {name: x.cpu().numpy() for name, x in zip(input_names, inputs)},
+                )[0]
+                valid = actual.shape == expected.shape and np.allclose(
+                    actual, expected, rtol=1e-3, atol=1e-4
+                )
+            except Exception:
+                valid = False
+            if not valid:
+                raise Exception(
+                    f"The ONNX graph of {repr(model)} only holds for the traced input shapes, the model can not be exported."
+                )
+    finally:
+        model.train(training)
+
+    metadata = dict(
+        model=repr(model),
+        kind="recurrent" if recurrent else "windows",
+        h=model.h,
+        input_size=model.input_size,
+        temporal_cols=module.temporal_cols.tolist(),
+        static_cols=module.static_cols.tolist(),
+        futr_exog_list=list(model.futr_exog_list),
+        output_names=list(model.loss.output_names),
+    )
+    onnx.helper.set_model_props(onnx_model, {"neuralforecast": json.dumps(metadata)})
+    onnx.save(onnx_model, path)
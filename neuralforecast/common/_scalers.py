@@ -9,6 +9,30 @@ import torch
 import torch.nn as nn
 
 # %% ../../nbs/common.scalers.ipynb 8
+def _onnx_masked_median(x, mask, dim=-1, keepdim=True):
+    # `nanmedian` has no ONNX symbolic, the lower median is gathered
+    # from the sorted values with the masked entries sent to the end.
+    x = x.float()
+    valid = (mask >= 1) & ~torch.isnan(x)
+    x_sorted, _ = torch.where(valid, x, torch.full_like(x, float("inf"))).sort(dim=dim)
+    count = valid.long().sum(dim=dim, keepdim=True)
+    x_median = x_sorted.gather(dim, (count - 1).clamp(min=0) // 2)
+    x_median = torch.where(count > 0, x_median, torch.zeros_like(x_median))
+    if not keepdim:
+        x_median = x_median.squeeze(dim)
+    return x_median
+
+
+def _onnx_masked_mean(x, mask, dim=-1, keepdim=True):
+    # `nanmean` has no ONNX symbolic either.
+    x = x.float()
+    valid = (mask >= 1) & ~torch.isnan(x)
+    x_sum = torch.where(valid, x, torch.zeros_like(x)).sum(dim=dim, keepdim=keepdim)
+    count = valid.float().sum(dim=dim, keepdim=keepdim)
+    x_mean = torch.where(count > 0, x_sum / count.clamp(min=1), torch.zeros_like(x_sum))
+    return x_mean
+
+# %% ../../nbs/common.scalers.ipynb 9
 def masked_median(x, mask, dim=-1, keepdim=True):
     """Masked Median
 
@@ -26,6 +50,8 @@ def masked_median(x, mask, dim=-1, keepdim=True):
     **Returns:**<br>
     `x_median`: torch.Tensor with normalized values.
     """
+    if torch.onnx.is_in_onnx_export():
+        return _onnx_masked_median(x=x, mask=mask, dim=dim, keepdim=keepdim)
     x_nan = x.float().masked_fill(mask < 1, float("nan"))
     x_median, _ = x_nan.nanmedian(dim=dim, keepdim=keepdim)
     x_median = torch.nan_to_num(x_median, nan=0.0)
@@ -49,12 +75,14 @@ def masked_mean(x, mask, dim=-1, keepdim=True):
     **Returns:**<br>
     `x_mean`: torch.Tensor with normalized values.
     """
+    if torch.onnx.is_in_onnx_export():
+        return _onnx_masked_mean(x=x, mask=mask, dim=dim, keepdim=keepdim)
     x_nan = x.float().masked_fill(mask < 1, float("nan"))
     x_mean = x_nan.nanmean(dim=dim, keepdim=keepdim)
     x_mean = torch.nan_to_num(x_mean, nan=0.0)
     return x_mean
 
-# %% ../../nbs/common.scalers.ipynb 12
+# %% ../../nbs/common.scalers.ipynb 13
 def minmax_statistics(x, mask, eps=1e-6, dim=-1):
     """MinMax Scaler
 
@@ -76,9 +104,7 @@ def minmax_statistics(x, mask, eps=1e-6, dim=-1):
     **Returns:**<br>
     `z`: torch.Tensor same shape as `x`, except scaled.
     """
-    mask = mask.clone()
-    mask[mask == 0] = torch.inf
-    mask[mask == 1] = 0
+    mask = torch.where(mask == 0, torch.inf, torch.where(mask == 1, 0.0, mask))
     x_max = torch.max(
         torch.nan_to_num(x - mask, nan=-torch.inf), dim=dim, keepdim=True
     )[0]
@@ -90,11 +116,11 @@ def minmax_statistics(x, mask, eps=1e-6, dim=-1):
 
     # x_range and prevent division by zero
     x_range = x_max - x_min
-    x_range[x_range == 0] = 1.0
+    x_range = torch.where(x_range == 0, 1.0, x_range)
     x_range = x_range + eps
     return x_min, x_range
 
-# %% ../../nbs/common.scalers.ipynb 13
+# %% ../../nbs/common.scalers.ipynb 14
 def minmax_scaler(x, x_min, x_range):
     return (x - x_min) / x_range
 
@@ -102,7 +128,7 @@ def minmax_scaler(x, x_min, x_range):
 def inv_minmax_scaler(z, x_min, x_range):
     return z * x_range + x_min
 
-# %% ../../nbs/common.scalers.ipynb 15
+# %% ../../nbs/common.scalers.ipynb 16
 def minmax1_statistics(x, mask, eps=1e-6, dim=-1):
     """MinMax1 Scaler
 
@@ -125,9 +151,7 @@ def minmax1_statistics(x, mask, eps=1e-6, dim=-1):
     `z`: torch.Tensor same shape as `x`, except scaled.
     """
     # Mask values (set masked to -inf or +inf)
-    mask = mask.clone()
-    mask[mask == 0] = torch.inf
-    mask[mask == 1] = 0
+    mask = torch.where(mask == 0, torch.inf, torch.where(mask == 1, 0.0, mask))
     x_max = torch.max(
         torch.nan_to_num(x - mask, nan=-torch.inf), dim=dim, keepdim=True
     )[0]
@@ -139,11 +163,11 @@ def minmax1_statistics(x, mask, eps=1e-6, dim=-1):
 
     # x_range and prevent division by zero
     x_range = x_max - x_min
-    x_range[x_range == 0] = 1.0
+    x_range = torch.where(x_range == 0, 1.0, x_range)
     x_range = x_range + eps
     return x_min, x_range
 
-# %% ../../nbs/common.scalers.ipynb 16
+# %% ../../nbs/common.scalers.ipynb 17
 def minmax1_scaler(x, x_min, x_range):
     x = (x - x_min) / x_range
     z = x * (2) - 1
@@ -154,7 +178,7 @@ def inv_minmax1_scaler(z, x_min, x_range):
     z = (z + 1) / 2
     return z * x_range + x_min
 
-# %% ../../nbs/common.scalers.ipynb 18
+# %% ../../nbs/common.scalers.ipynb 19
 def std_statistics(x, mask, dim=-1, eps=1e-6):
     """Standard Scaler
 
@@ -180,11 +204,11 @@ def std_statistics(x, mask, dim=-1, eps=1e-6):
     x_stds = torch.sqrt(masked_mean(x=(x - x_means) ** 2, mask=mask, dim=dim))
 
     # Protect against division by zero
-    x_stds[x_stds == 0] = 1.0
+    x_stds = torch.where(x_stds == 0, 1.0, x_stds)
     x_stds = x_stds + eps
     return x_means, x_stds
 
-# %% ../../nbs/common.scalers.ipynb 19
+# %% ../../nbs/common.scalers.ipynb 20
 def std_scaler(x, x_means, x_stds):
     return (x - x_means) / x_stds
 
@@ -192,7 +216,7 @@ def std_scaler(x, x_means, x_stds):
 def inv_std_scaler(z, x_mean, x_std):
     return (z * x_std) + x_mean
 
-# %% ../../nbs/common.scalers.ipynb 21
+# %% ../../nbs/common.scalers.ipynb 22
 def robust_statistics(x, mask, dim=-1, eps=1e-6):
     """Robust Median Scaler
 
@@ -230,11 +254,11 @@ def robust_statistics(x, mask, dim=-1, eps=1e-6):
     x_mad = x_mad * (x_mad > 0) + x_mad_aux * (x_mad == 0)
 
     # Protect against division by zero
-    x_mad[x_mad == 0] = 1.0
+    x_mad = torch.where(x_mad == 0, 1.0, x_mad)
     x_mad = x_mad + eps
     return x_median, x_mad
 
-# %% ../../nbs/common.scalers.ipynb 22
+# %% ../../nbs/common.scalers.ipynb 23
 def robust_scaler(x, x_median, x_mad):
     return (x - x_median) / x_mad
 
@@ -242,7 +266,7 @@ def robust_scaler(x, x_median, x_mad):
 def inv_robust_scaler(z, x_median, x_mad):
     return z * x_mad + x_median
 
-# %% ../../nbs/common.scalers.ipynb 24
+# %% ../../nbs/common.scalers.ipynb 25
 def invariant_statistics(x, mask, dim=-1, eps=1e-6):
     """Invariant Median Scaler
 
@@ -278,19 +302,26 @@ def invariant_statistics(x, mask, dim=-1, eps=1e-6):
     x_mad = x_mad * (x_mad > 0) + x_mad_aux * (x_mad == 0)
 
     # Protect against division by zero
-    x_mad[x_mad == 0] = 1.0
+    x_mad = torch.where(x_mad == 0, 1.0, x_mad)
     x_mad = x_mad + eps
     return x_median, x_mad
 
-# %% ../../nbs/common.scalers.ipynb 25
+# %% ../../nbs/common.scalers.ipynb 26
 def invariant_scaler(x, x_median, x_mad):
-    return torch.arcsinh((x - x_median) / x_mad)
+    z = (x - x_median) / x_mad
+    if torch.onnx.is_in_onnx_export():
+        # `arcsinh` has no ONNX symbolic
+        return torch.sign(z) * torch.log(z.abs() + torch.sqrt(z * z + 1))
+    return torch.arcsinh(z)
 
 
 def inv_invariant_scaler(z, x_median, x_mad):
+    if torch.onnx.is_in_onnx_export():
+        # Neither has `sinh`
+        return (torch.exp(z) - torch.exp(-z)) / 2 * x_mad + x_median
     return torch.sinh(z) * x_mad + x_median
 
-# %% ../../nbs/common.scalers.ipynb 27
+# %% ../../nbs/common.scalers.ipynb 28
 def identity_statistics(x, mask, dim=-1, eps=1e-6):
     """Identity Scaler
 
@@ -316,7 +347,7 @@ def identity_statistics(x, mask, dim=-1, eps=1e-6):
 
     return x_shift, x_scale
 
-# %% ../../nbs/common.scalers.ipynb 28
+# %% ../../nbs/common.scalers.ipynb 29
 def identity_scaler(x, x_shift, x_scale):
     return x
 
@@ -324,7 +355,7 @@ def identity_scaler(x, x_shift, x_scale):
 def inv_identity_scaler(z, x_shift, x_scale):
     return z
 
-# %% ../../nbs/common.scalers.ipynb 31
+# %% ../../nbs/common.scalers.ipynb 32
 class TemporalNorm(nn.Module):
     """Temporal Normalization
 
@@ -419,22 +450,25 @@ class TemporalNorm(nn.Module):
         **Returns:**<br>
         `z`: torch.Tensor same shape as `x`, except scaled.
         """
-        x_shift, x_scale = self.compute_statistics(
-            x=x, mask=mask, dim=self.dim, eps=self.eps
-        )
-        self.x_shift = x_shift
-        self.x_scale = x_scale
-
-        # Original Revin performs this operation
-        # z = self.revin_weight * z
-        # z = z + self.revin_bias
-        # However this is only valid for point forecast not for
-        # distribution's scale decouple technique.
-        if self.scaler_type == "revin":
-            self.x_shift = self.x_shift + self.revin_bias
-            self.x_scale = self.x_scale * (torch.relu(self.revin_weight) + self.eps)
-
-        z = self.scaler(x, x_shift, x_scale)
+        # Statistics in float32, also under bfloat16 autocast
+        with torch.autocast(device_type=x.device.type, enabled=False):
+            x = x.to(torch.promote_types(x.dtype, torch.float))
+            x_shift, x_scale = self.compute_statistics(
+                x=x, mask=mask, dim=self.dim, eps=self.eps
+            )
+            self.x_shift = x_shift
+            self.x_scale = x_scale
+
+            # Original Revin performs this operation
+            # z = self.revin_weight * z
+            # z = z + self.revin_bias
+            # However this is only valid for point forecast not for
+            # distribution's scale decouple technique.
+            if self.scaler_type == "revin":
+                self.x_shift = self.x_shift + self.revin_bias
+                self.x_scale = self.x_scale * (torch.relu(self.revin_weight) + self.eps)
+
+            z = self.scaler(x, x_shift, x_scale)
         return z
 
     # @torch.no_grad()
@@ -459,7 +493,10 @@ class TemporalNorm(nn.Module):
         # However this is only valid for point forecast not for
         # distribution's scale decouple technique.
 
-        x = self.inverse_scaler(z, x_shift, x_scale)
+        with torch.autocast(device_type=z.device.type, enabled=False):
+            x = self.inverse_scaler(
+                z.to(torch.promote_types(z.dtype, torch.float)), x_shift, x_scale
+            )
         return x
 
     def forward(self, x):
@@ -4,18 +4,22 @@
 __all__ = ['NeuralForecast']
 
 # %% ../nbs/core.ipynb 4
+import json
 import os
 import pickle
 import warnings
+from collections import OrderedDict
 from copy import deepcopy
 from itertools import chain
 from os.path import isfile, join
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Union
 
 import numpy as np
 import pandas as pd
+import torch
 
-from .tsdataset import TimeSeriesDataset
+from .losses import pytorch as pytorch_losses
+from .tsdataset import TimeSeriesDataset, _arrow_to_frame, _trim_rows
 from neuralforecast.models import (
     GRU,
     LSTM,
@@ -38,84 +42,117 @@ from neuralforecast.models import (
 )
 
 # %% ../nbs/core.ipynb 5
+def _shift_dates(dates, shifts, freq):
+    """
+    Computes `dates[i] + shifts[i] * freq` for integer or datetime `dates`.
+    Fixed frequencies use timedelta arithmetic, calendar frequencies
+    apply the offset once per distinct date and shift.
+    """
+    if issubclass(dates.dtype.type, np.integer):
+        return np.asarray(dates) + shifts.astype(dates.dtype)
+    dates = pd.DatetimeIndex(dates)
+    offset = pd.tseries.frequencies.to_offset(freq)
+    if isinstance(offset, pd.offsets.Tick):
+        return dates + pd.to_timedelta(shifts * offset.nanos, unit="ns")
+    # offset every distinct date by every distinct shift and gather the results
+    date_codes, uniq_dates = pd.factorize(dates)
+    shift_codes, uniq_shifts = pd.factorize(shifts)
+    shifted = [uniq_dates + shift * offset for shift in uniq_shifts]
+    shifted = shifted[0].append(shifted[1:])
+    return shifted[shift_codes * len(uniq_dates) + date_codes]
+
+# %% ../nbs/core.ipynb 6
+def _cv_windows(n_series, h, test_size, step_size=1):
+    """
+    Series index and cutoff of every cross validation window, the cutoff is the
+    shift of the window's last observed date with respect to the series last date.
+    """
+    # Windows of each series, test_size can be different for each series
+    test_sizes = np.broadcast_to(test_size, n_series)
+    n_windows = (test_sizes - h) // step_size + 1
+    series_idx = np.repeat(np.arange(n_series), n_windows)
+    window_idx = np.arange(len(series_idx)) - np.repeat(
+        n_windows.cumsum() - n_windows, n_windows
+    )
+    cutoffs = window_idx * step_size - test_sizes[series_idx]
+    return series_idx, cutoffs
+
+# %% ../nbs/core.ipynb 7
 def _cv_dates(last_dates, freq, h, test_size, step_size=1):
-    # assuming step_size = 1
-    if (test_size - h) % step_size:
+    if (np.asarray(test_size - h) % step_size).any():
         raise Exception("`test_size - h` should be module `step_size`")
-    n_windows = int((test_size - h) / step_size) + 1
-    if len(np.unique(last_dates)) == 1:
-        if issubclass(last_dates.dtype.type, np.integer):
-            total_dates = np.arange(last_dates[0] - test_size + 1, last_dates[0] + 1)
-            out = np.empty((h * n_windows, 2), dtype=last_dates.dtype)
-            freq = 1
-        else:
-            total_dates = pd.date_range(end=last_dates[0], periods=test_size, freq=freq)
-            out = np.empty((h * n_windows, 2), dtype="datetime64[s]")
-        for i_window, cutoff in enumerate(
-            range(-test_size, -h + 1, step_size), start=0
-        ):
-            end_cutoff = cutoff + h
-            out[h * i_window : h * (i_window + 1), 0] = (
-                total_dates[cutoff:]
-                if end_cutoff == 0
-                else total_dates[cutoff:end_cutoff]
-            )
-            out[h * i_window : h * (i_window + 1), 1] = np.tile(
-                total_dates[cutoff] - freq, h
-            )
-        dates = pd.DataFrame(
-            np.tile(out, (len(last_dates), 1)), columns=["ds", "cutoff"]
-        )
-    else:
-        dates = pd.concat(
-            [
-                _cv_dates(np.array([ld]), freq, h, test_size, step_size)
-                for ld in last_dates
-            ]
-        )
-        dates = dates.reset_index(drop=True)
+    series_idx, cutoffs = _cv_windows(len(last_dates), h, test_size, step_size)
+
+    # Shifts of the cutoffs and forecasted dates with respect to the last date
+    cutoff_shifts = np.repeat(cutoffs, h)
+    ds_shifts = cutoff_shifts + np.tile(np.arange(1, h + 1), len(series_idx))
+    row_last_dates = pd.Index(last_dates)[series_idx].repeat(h)
+    dates = pd.DataFrame(
+        {
+            "ds": _shift_dates(row_last_dates, ds_shifts, freq),
+            "cutoff": _shift_dates(row_last_dates, cutoff_shifts, freq),
+        }
+    )
     return dates
 
-# %% ../nbs/core.ipynb 6
+# %% ../nbs/core.ipynb 8
 def _insample_dates(uids, last_dates, freq, h, len_series, step_size=1):
     """
     Generate insample dates for `predict_insample` function. Uses `_cv_dates`
     method with separate sizes and last dates for each series.
     """
-    if (len(np.unique(last_dates)) == 1) and (len(np.unique(len_series)) == 1):
-        # Dates can be generated simulatenously if ld and ls are the same for all series
-        dates = _cv_dates(last_dates, freq, h, len_series[0], step_size)
-        dates["unique_id"] = np.repeat(uids, len(dates) // len(uids))
-    else:
-        dates = []
-        for ui, ld, ls in zip(uids, last_dates, len_series):
-            # Dates have to be generated for each series separately, considering its own ld and ls
-            dates_series = _cv_dates(np.array([ld]), freq, h, ls, step_size)
-            dates_series["unique_id"] = ui
-            dates.append(dates_series)
-        dates = pd.concat(dates)
-    dates = dates.reset_index(drop=True)
-    dates = dates[["unique_id", "ds", "cutoff"]]
+    len_series = np.asarray(len_series)
+    dates = _cv_dates(last_dates, freq, h, len_series, step_size)
+    n_windows = (len_series - h) // step_size + 1
+    dates.insert(0, "unique_id", np.repeat(np.asarray(uids), n_windows * h))
     return dates
 
-# %% ../nbs/core.ipynb 7
+# %% ../nbs/core.ipynb 9
 def _future_dates(dataset, uids, last_dates, freq, h):
     """
     Generate future dates for `predict` function.
     """
-    if issubclass(last_dates.dtype.type, np.integer):
-        last_date_f = lambda x: np.arange(x + 1, x + 1 + h, dtype=last_dates.dtype)
-    else:
-        last_date_f = lambda x: pd.date_range(x + freq, periods=h, freq=freq)
-    if len(np.unique(last_dates)) == 1:
-        dates = np.tile(last_date_f(last_dates[0]), len(dataset))
-    else:
-        dates = np.hstack([last_date_f(last_date) for last_date in last_dates])
+    shifts = np.tile(np.arange(1, h + 1), len(last_dates))
+    dates = _shift_dates(pd.Index(last_dates).repeat(h), shifts, freq)
     idx = pd.Index(np.repeat(uids, h), name="unique_id")
     df = pd.DataFrame({"ds": dates}, index=idx)
     return df
 
-# %% ../nbs/core.ipynb 11
+# %% ../nbs/core.ipynb 10
+def _cv_positions(indptr, h, test_size, step_size=1, right_trim=0):
+    """
+    Positions in the dataset of the dates generated by `_cv_dates` for series
+    delimited by `indptr`, whose last `right_trim` observations are excluded.
+    Also returns a mask of the positions that fall inside their series.
+    """
+    starts = indptr[:-1]
+    ends = indptr[1:] - right_trim
+    series_idx, cutoffs = _cv_windows(len(starts), h, test_size, step_size)
+    positions = ends[series_idx] + cutoffs
+    positions = (positions[:, None] + np.arange(h)).ravel()
+    available = positions >= np.repeat(starts[series_idx], h)
+    return positions, available
+
+# %% ../nbs/core.ipynb 16
+def _frame_type(df):
+    """Library of the input frame, the outputs are returned in the same format."""
+    module = type(df).__module__.split(".")[0]
+    return module if module in ("polars", "pyarrow") else "pandas"
+
+
+def _to_frame(data, frame_type, index=None):
+    """Builds an output frame from a dict of columns without copying them."""
+    if frame_type == "polars":
+        import polars
+
+        return polars.DataFrame(data)
+    if frame_type == "pyarrow":
+        import pyarrow
+
+        return pyarrow.table(data)
+    return pd.DataFrame(data, index=index, copy=False)
+
+# %% ../nbs/core.ipynb 17
 MODEL_FILENAME_DICT = {
     "gru": GRU,
     "lstm": LSTM,
@@ -153,10 +190,232 @@ MODEL_FILENAME_DICT = {
     "autotimesnet": TimesNet,
 }
 
-# %% ../nbs/core.ipynb 12
+# %% ../nbs/core.ipynb 18
+_SAVE_FORMAT_VERSION = 2
+
+
+def _write_arrays(path, arrays):
+    """
+    Writes the tensors and numpy arrays of `arrays` one after the other in a single file, aligned to 64 bytes.
+    Returns the manifest entries used by `_read_arrays` to recover them.
+    """
+    entries = {}
+    offset = 0
+    with open(path, "wb") as f:
+        for name, value in arrays.items():
+            if isinstance(value, torch.Tensor):
+                value = value.detach().cpu().contiguous()
+                entry = {
+                    "kind": "torch",
+                    "dtype": str(value.dtype).replace("torch.", ""),
+                }
+                data = value.reshape(-1).view(torch.uint8).numpy()
+            else:
+                value = np.ascontiguousarray(value)
+                if value.dtype == object:
+                    value = value.astype(str)
+                entry = {"kind": "numpy", "dtype": value.dtype.str}
+                data = value.reshape(-1).view(np.uint8)
+            padding = -offset % 64
+            f.write(b"\0" * padding)
+            offset += padding
+            f.write(data.tobytes())
+            entries[name] = {**entry, "shape": list(value.shape), "offset": offset}
+            offset += data.size
+    return entries
+
+
+def _read_arrays(path, entries, mmap=False):
+    """
+    Reads the arrays written by `_write_arrays`. With `mmap`, the file is memory mapped
+    in copy-on-write mode and the arrays are views of it, so they're only read when used.
+    """
+    if not entries:
+        return {}
+    if mmap:
+        buffer = np.memmap(path, dtype=np.uint8, mode="c")
+    else:
+        buffer = np.fromfile(path, dtype=np.uint8)
+    arrays = {}
+    for name, entry in entries.items():
+        shape = tuple(entry["shape"])
+        count = int(np.prod(shape))
+        if entry["kind"] == "torch":
+            dtype = getattr(torch, entry["dtype"])
+            if count == 0:
+                arrays[name] = torch.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = torch.frombuffer(
+                    buffer, dtype=dtype, count=count, offset=entry["offset"]
+                ).reshape(shape)
+        else:
+            arrays[name] = np.frombuffer(
+                buffer,
+                dtype=np.dtype(entry["dtype"]),
+                count=count,
+                offset=entry["offset"],
+            ).reshape(shape)
+    return arrays
+
+
+def _is_json(value):
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _encode_hparams(hparams):
+    """
+    Splits the model hyperparameters in json serializable values, losses and other objects.
+    Losses are described by their class, attributes and tensors, the other objects can only be pickled.
+    Returns the json description and the tensors and objects that are stored apart.
+    """
+    values, losses, tensors, objects = {}, {}, {}, {}
+    for name, value in hparams.items():
+        if _is_json(value):
+            values[name] = value
+            continue
+        if type(value).__module__ == pytorch_losses.__name__:
+            attrs = {
+                k: v
+                for k, v in vars(value).items()
+                if not k.startswith("_") and k != "training"
+            }
+            # some losses keep plain tensors as attributes, e.g. the horizon weights
+            attr_tensors = {
+                k: v for k, v in attrs.items() if isinstance(v, torch.Tensor)
+            }
+            attrs = {k: v for k, v in attrs.items() if k not in attr_tensors}
+            if _is_json(attrs):
+                losses[name] = {
+                    "class": type(value).__name__,
+                    "attrs": attrs,
+                    "tensors": list(attr_tensors),
+                    "parameters": {
+                        k: p.requires_grad for k, p in value.named_parameters()
+                    },
+                }
+                for k, tensor in {**value.state_dict(), **attr_tensors}.items():
+                    tensors[f"{name}.{k}"] = tensor
+                continue
+        objects[name] = value
+    return {"values": values, "losses": losses}, tensors, objects
+
+
+def _decode_hparams(encoded, tensors, objects):
+    """Hyperparameters described by `_encode_hparams`."""
+    hparams = {**encoded["values"], **objects}
+    for name, loss in encoded["losses"].items():
+        loss_cls = getattr(pytorch_losses, loss["class"])
+        value = loss_cls.__new__(loss_cls)
+        torch.nn.Module.__init__(value)
+        value.__dict__.update(loss["attrs"])
+        for k, tensor in tensors.items():
+            if not k.startswith(f"{name}."):
+                continue
+            k = k[len(name) + 1 :]
+            if k in loss["parameters"]:
+                value.register_parameter(
+                    k,
+                    torch.nn.Parameter(
+                        tensor.clone(), requires_grad=loss["parameters"][k]
+                    ),
+                )
+            elif k in loss["tensors"]:
+                setattr(value, k, tensor.clone())
+            else:
+                value.register_buffer(k, tensor.clone())
+        hparams[name] = value
+    return hparams
+
+
+def _flatten_quantized(state_dict):
+    """
+    The int8 linear layers keep their weight and bias in a tuple, which is split in plain tensors.
+    Their dtypes are skipped, they're restored from the loaded model by `_unflatten_quantized`.
+    """
+    flat = {}
+    for k, v in state_dict.items():
+        if isinstance(v, torch.dtype):
+            continue
+        if isinstance(v, tuple):
+            weight, bias = v
+            flat[f"{k}.weight"] = weight.int_repr()
+            flat[f"{k}.scale"] = torch.tensor(weight.q_scale(), dtype=torch.float64)
+            flat[f"{k}.zero_point"] = torch.tensor(weight.q_zero_point())
+            if bias is not None:
+                flat[f"{k}.bias"] = bias
+        else:
+            flat[k] = v
+    return flat
+
+
+def _unflatten_quantized(weights, state_dict):
+    """Inverse of `_flatten_quantized`, `state_dict` is the one of the quantized model being loaded."""
+    # the int8 layers read their version from the metadata
+    weights = OrderedDict(weights)
+    weights._metadata = state_dict._metadata
+    for k, v in state_dict.items():
+        if isinstance(v, torch.dtype):
+            weights[k] = v
+        elif isinstance(v, tuple):
+            weight = torch._make_per_tensor_quantized_tensor(
+                weights.pop(f"{k}.weight"),
+                weights.pop(f"{k}.scale").item(),
+                weights.pop(f"{k}.zero_point").item(),
+            )
+            weights[k] = (weight, weights.pop(f"{k}.bias", None))
+    return weights
+
+
+def _quantizable_model(model):
+    """Model whose linear layers can be quantized, auto models quantize the selected one."""
+    if hasattr(model, "cls_model"):
+        model = model.model
+    return model if hasattr(model, "quantize") else None
+
+
+class _LazyModel:
+    """
+    Placeholder of a saved model, which is loaded by `loader` the first time one of its attributes is used.
+    Its name and horizon are available without loading it.
+    """
+
+    def __init__(self, loader, name, h):
+        self.__dict__.update(_loader=loader, _name=name, _model=None, h=h)
+
+    def _get_model(self):
+        if self._model is None:
+            self.__dict__["_model"] = self._loader()
+        return self._model
+
+    def __getattr__(self, name):
+        return getattr(self._get_model(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._get_model(), name, value)
+
+    def __repr__(self):
+        return self._name
+
+    def __deepcopy__(self, memo):
+        if self._model is None:
+            return _LazyModel(self._loader, self._name, self.h)
+        return deepcopy(self._model, memo)
+
+# %% ../nbs/core.ipynb 19
 class NeuralForecast:
     def __init__(
-        self, models: List[Any], freq: str, local_scaler_type: Optional[str] = None
+        self,
+        models: List[Any],
+        freq: str,
+        local_scaler_type: Optional[str] = None,
+        exog_dtype: Optional[Union[str, torch.dtype]] = None,
+        compact_mask: bool = False,
+        retention: Optional[Union[int, str]] = None,
+        keep_full_history: bool = False,
     ):
         """
         The `core.StatsForecast` class allows you to efficiently fit multiple `NeuralForecast` models
@@ -175,6 +434,19 @@ class NeuralForecast:
         local_scaler_type : str, optional (default=None)
             Scaler to apply per-serie to all features before fitting, which is inverted after predicting.
             Can be 'standard', 'robust', 'robust-iqr', 'minmax' or 'boxcox'
+        exog_dtype : str or torch.dtype, optional (default=None)
+            Storage dtype of the exogenous features in the dataset, e.g. 'bfloat16' or 'float16'.
+            They're upcasted to float32 when building the batches. None keeps them in float32.
+        compact_mask : bool (default=False)
+            Store the available mask as bits, or skip it when all the observations are available.
+        retention : int or str, optional (default=None)
+            Number of steps of each serie kept in the stored dataset, the older ones are dropped on `predict` and `save`.
+            'inference' keeps the `max(input_size) + h` steps that the models use to predict,
+            recurrent models use their `inference_input_size` and the full history if it's -1.
+            None keeps the full history.
+        keep_full_history : bool (default=False)
+            Keep the full history apart when the stored dataset is trimmed by `retention`.
+            It's restored by `fit` and `cross_validation` without `df` and by `predict_insample`.
 
         Returns
         -------
@@ -190,17 +462,77 @@ class NeuralForecast:
         self.models = [deepcopy(model) for model in self.models_init]
         self.freq = pd.tseries.frequencies.to_offset(freq)
         self.local_scaler_type = local_scaler_type
+        self.exog_dtype = exog_dtype
+        self.compact_mask = compact_mask
+        if (
+            retention is not None
+            and retention != "inference"
+            and (not isinstance(retention, int) or retention < 1)
+        ):
+            raise ValueError(
+                "retention must be a positive integer, 'inference' or None"
+            )
+        self.retention = retention
+        self.keep_full_history = keep_full_history
+        self.full_dataset = None
+        self.full_ds = None
 
         # Flags and attributes
         self._fitted = False
+        self._frame_type = "pandas"
 
     def _prepare_fit(self, df, static_df, sort_df, scaler_type):
         # TODO: uids, last_dates and ds should be properties of the dataset class. See github issue.
-        dataset, uids, last_dates, ds = TimeSeriesDataset.from_df(
-            df=df, static_df=static_df, sort_df=sort_df, scaler_type=scaler_type
+        dataset, uids, last_dates, ds, sort_idxs = TimeSeriesDataset.from_df(
+            df=df,
+            static_df=static_df,
+            sort_df=sort_df,
+            scaler_type=scaler_type,
+            return_sort_idxs=True,
+            exog_dtype=self.exog_dtype,
+            compact_mask=self.compact_mask,
         )
+        # positions of the dataset rows in `df`, used to attach its columns to the outputs
+        self._sort_idxs = sort_idxs
+        self._frame_type = _frame_type(df)
         return dataset, uids, last_dates, ds
 
+    def _retention_size(self):
+        """Number of steps of each serie kept by `retention`, None keeps the full history."""
+        if self.retention != "inference":
+            return self.retention
+        input_sizes = []
+        for model in self.models:
+            # auto models store the selected model in `model`
+            if hasattr(model, "cls_model"):
+                model = model.model
+            if model.SAMPLING_TYPE == "recurrent":
+                input_sizes.append(model.inference_input_size)
+            else:
+                input_sizes.append(model.input_size)
+        if min(input_sizes) < 1:
+            return None
+        return max(input_sizes) + self.h
+
+    def _retain(self):
+        """Drops the steps of the stored dataset that aren't kept by `retention`."""
+        max_size = self._retention_size()
+        if max_size is None or self.dataset.max_size <= max_size:
+            return
+        if self.keep_full_history and self.full_dataset is None:
+            self.full_dataset, self.full_ds = self.dataset, self.ds
+        rows, _ = _trim_rows(self.dataset.indptr, max_size=max_size)
+        scalers = self.dataset.scalers_
+        self.dataset = TimeSeriesDataset.trim_dataset(self.dataset, max_size=max_size)
+        self.dataset.scalers_ = scalers
+        self.ds = self.ds[rows]
+
+    def _restore_full_history(self):
+        """Uses the full history kept by `keep_full_history` as the stored dataset."""
+        if self.full_dataset is not None:
+            self.dataset, self.ds = self.full_dataset, self.full_ds
+            self.full_dataset, self.full_ds = None, None
+
     def fit(
         self,
         df: Optional[pd.DataFrame] = None,
@@ -217,10 +549,10 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas.DataFrame, optional (default=None)
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
             If None, a previously stored dataset is required.
-        static_df : pandas.DataFrame, optional (default=None)
+        static_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`] and static exogenous.
         val_size : int, optional (default=0)
             Size of validation set.
@@ -254,7 +586,9 @@ class NeuralForecast:
                 scaler_type=self.local_scaler_type,
             )
             self.sort_df = sort_df
+            self.full_dataset, self.full_ds = None, None
         else:
+            self._restore_full_history()
             if verbose:
                 print("Using stored dataset.")
 
@@ -275,6 +609,37 @@ class NeuralForecast:
 
         self._fitted = True
 
+    def append(self, df: pd.DataFrame):
+        """Append new observations to the stored dataset.
+
+        Extends the series of the stored dataset in place with the rows of `df`,
+        so that `predict` without `df` uses them without processing the full history again.
+        The new rows are scaled with the fitted local scalers.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table
+            DataFrame with columns [`unique_id`, `ds`, `y`] and the exogenous variables of the stored dataset.
+            Its ids must be in the stored dataset and its dates after their last date.
+
+        Returns
+        -------
+        self : NeuralForecast
+            Returns `NeuralForecast` class with the updated dataset.
+        """
+        if not hasattr(self, "dataset"):
+            raise Exception(
+                "You must have a stored dataset to append observations to it."
+            )
+        self.last_dates, self.ds = self.dataset.append(
+            df=df, uids=self.uids, ds=self.ds
+        )
+        if self.full_dataset is not None:
+            _, self.full_ds = self.full_dataset.append(
+                df=df, uids=self.uids, ds=self.full_ds
+            )
+        return self
+
     def predict(
         self,
         df: Optional[pd.DataFrame] = None,
@@ -282,6 +647,7 @@ class NeuralForecast:
         futr_df: Optional[pd.DataFrame] = None,
         sort_df: bool = True,
         verbose: bool = False,
+        quantized: bool = False,
         **data_kwargs,
     ):
         """Predict with core.NeuralForecast.
@@ -290,25 +656,27 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas.DataFrame, optional (default=None)
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
             If a DataFrame is passed, it is used to generate forecasts.
-        static_df : pandas.DataFrame, optional (default=None)
+        static_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`] and static exogenous.
-        futr_df : pandas.DataFrame, optional (default=None)
+        futr_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with [`unique_id`, `ds`] columns and `df`'s future exogenous.
         sort_df : bool (default=True)
             Sort `df` before fitting.
         verbose : bool (default=False)
             Print processing steps.
+        quantized : bool (default=False)
+            Predict with int8 linear layers, on CPU, the windows based models without quantizing them, see `quantize`.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
         Returns
         -------
-        fcsts_df : pandas.DataFrame
+        fcsts_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table
             DataFrame with insample `models` columns for point predictions and probabilistic
-            predictions for all fitted `models`.
+            predictions for all fitted `models`, in the format of the input `df`.
         """
         if (df is None) and not (hasattr(self, "dataset")):
             raise Exception("You must pass a DataFrame or have one stored.")
@@ -316,6 +684,12 @@ class NeuralForecast:
         if not self._fitted:
             raise Exception("You must fit the model before predicting.")
 
+        # The future exogenous are joined with the forecast dates in pandas
+        if futr_df is not None:
+            futr_df = _arrow_to_frame(futr_df)
+            if not isinstance(futr_df, pd.DataFrame):
+                futr_df = futr_df.to_pandas()
+
         needed_futr_exog = set(
             chain.from_iterable(getattr(m, "futr_exog_list", []) for m in self.models)
         )
@@ -337,9 +711,13 @@ class NeuralForecast:
             dataset, uids, last_dates, _ = self._prepare_fit(
                 df=df, static_df=static_df, sort_df=sort_df, scaler_type=None
             )
+            max_size = self._retention_size()
+            if max_size is not None and dataset.max_size > max_size:
+                dataset = TimeSeriesDataset.trim_dataset(dataset, max_size=max_size)
             dataset.scalers_ = self.dataset.scalers_
             dataset._transform_temporal()
         else:
+            self._retain()
             dataset = self.dataset
             uids = self.uids
             last_dates = self.last_dates
@@ -388,7 +766,12 @@ class NeuralForecast:
         for model in self.models:
             old_test_size = model.get_test_size()
             model.set_test_size(self.h)  # To predict h steps ahead
-            model_fcsts = model.predict(dataset=dataset, **data_kwargs)
+            if quantized and _quantizable_model(model) is not None:
+                model_fcsts = model.predict(
+                    dataset=dataset, quantized=True, **data_kwargs
+                )
+            else:
+                model_fcsts = model.predict(dataset=dataset, **data_kwargs)
             # Append predictions in memory placeholder
             output_length = len(model.loss.output_names)
             fcsts[:, col_idx : col_idx + output_length] = model_fcsts
@@ -398,9 +781,14 @@ class NeuralForecast:
             indptr = np.append(0, np.full(len(uids), self.h).cumsum())
             fcsts = self.dataset._invert_target_transform(fcsts, indptr)
 
-        # Declare predictions pd.DataFrame
-        fcsts = pd.DataFrame.from_records(fcsts, columns=cols, index=fcsts_df.index)
-        fcsts_df = pd.concat([fcsts_df, fcsts], axis=1)
+        # Declare predictions DataFrame, pandas outputs keep the ids in the index
+        data = {"ds": fcsts_df["ds"].values, **dict(zip(cols, fcsts.T))}
+        if self._frame_type == "pandas":
+            fcsts_df = _to_frame(data, self._frame_type, index=fcsts_df.index)
+        else:
+            fcsts_df = _to_frame(
+                {"unique_id": fcsts_df.index.values, **data}, self._frame_type
+            )
 
         return fcsts_df
 
@@ -424,10 +812,10 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas.DataFrame, optional (default=None)
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
             If None, a previously stored dataset is required.
-        static_df : pandas.DataFrame, optional (default=None)
+        static_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`] and static exogenous.
         n_windows : int (default=1)
             Number of windows used for cross validation.
@@ -448,9 +836,9 @@ class NeuralForecast:
 
         Returns
         -------
-        fcsts_df : pandas.DataFrame
+        fcsts_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table
             DataFrame with insample `models` columns for point predictions and probabilistic
-            predictions for all fitted `models`.
+            predictions for all fitted `models`, in the format of the input `df`.
         """
         if (df is None) and not (hasattr(self, "dataset")):
             raise Exception("You must pass a DataFrame or have one stored.")
@@ -464,7 +852,9 @@ class NeuralForecast:
                 scaler_type=self.local_scaler_type,
             )
             self.sort_df = sort_df
+            self.full_dataset, self.full_ds = None, None
         else:
+            self._restore_full_history()
             if verbose:
                 print("Using stored dataset.")
 
@@ -508,8 +898,6 @@ class NeuralForecast:
             test_size=test_size,
             step_size=step_size,
         )
-        idx = pd.Index(np.repeat(self.uids, h * n_windows), name="unique_id")
-        fcsts_df.index = idx
 
         col_idx = 0
         fcsts = np.full(
@@ -534,12 +922,40 @@ class NeuralForecast:
 
         self._fitted = True
 
-        # Add predictions to forecasts DataFrame
-        fcsts = pd.DataFrame.from_records(fcsts, columns=cols, index=fcsts_df.index)
-        fcsts_df = pd.concat([fcsts_df, fcsts], axis=1)
-
-        # Add original input df's y to forecasts DataFrame
-        fcsts_df = fcsts_df.merge(df, how="left", on=["unique_id", "ds"])
+        # Add predictions and original input df's columns to forecasts DataFrame.
+        # Rows are taken by position from the dataset layout, series shorter than the
+        # test set get missing values in the dates before their start.
+        positions, available = _cv_positions(
+            indptr=self.dataset.indptr, h=h, test_size=test_size, step_size=step_size
+        )
+        if df is not None:
+            df = _arrow_to_frame(df)
+            df_cols = [col for col in df.columns if col not in ("unique_id", "ds")]
+            rows = positions if self._sort_idxs is None else self._sort_idxs[positions]
+            rows = np.where(available, rows, 0)
+            if isinstance(df, pd.DataFrame):
+                in_sample = df[df_cols].take(rows)
+            else:
+                in_sample = df.select(df_cols)[rows].to_pandas()
+        else:
+            y = self.dataset._column(0)[np.where(available, positions, 0)].numpy()
+            if self.dataset.scalers_ is not None:
+                y = self.dataset._invert_target_transform(y[:, None], indptr)[:, 0]
+            in_sample = pd.DataFrame({"y": y})
+        if not available.all():
+            in_sample = in_sample.where(
+                pd.Series(available, index=in_sample.index), axis=0
+            )
+        fcsts_df = _to_frame(
+            {
+                "unique_id": np.repeat(self.uids, h * n_windows),
+                "ds": fcsts_df["ds"].values,
+                "cutoff": fcsts_df["cutoff"].values,
+                **dict(zip(cols, fcsts.T)),
+                **{col: in_sample[col].values for col in in_sample.columns},
+            },
+            self._frame_type,
+        )
         return fcsts_df
 
     def predict_insample(self, step_size: int = 1):
@@ -555,13 +971,14 @@ class NeuralForecast:
 
         Returns
         -------
-        fcsts_df : pandas.DataFrame
-            DataFrame with insample predictions for all fitted `models`.
+        fcsts_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table
+            DataFrame with insample predictions for all fitted `models`, in the format of the input `df`.
         """
         if not self._fitted:
             raise Exception(
                 "The models must be fitted first with `fit` or `cross_validation`."
             )
+        self._restore_full_history()
 
         for model in self.models:
             if model.SAMPLING_TYPE == "recurrent":
@@ -606,7 +1023,6 @@ class NeuralForecast:
             len_series=len_series,
             step_size=step_size,
         )
-        fcsts_df = fcsts_df.set_index("unique_id")
 
         col_idx = 0
         fcsts = np.full((len(fcsts_df), len(cols)), np.nan, dtype=np.float32)
@@ -623,26 +1039,90 @@ class NeuralForecast:
             col_idx += output_length
             model.set_test_size(test_size=test_size)  # Set original test_size
 
-        # Add predictions to forecasts DataFrame
-        fcsts = pd.DataFrame.from_records(fcsts, columns=cols, index=fcsts_df.index)
-        fcsts_df = pd.concat([fcsts_df, fcsts], axis=1)
-
-        # Add original input df's y to forecasts DataFrame
-        Y_df = pd.DataFrame.from_records(
-            self.dataset.temporal[:, [0]].numpy(), columns=["y"], index=self.ds
+        # Add original input df's y, taken by position from the dataset layout
+        positions, _ = _cv_positions(
+            indptr=self.dataset.indptr,
+            h=self.h,
+            test_size=len_series,
+            step_size=step_size,
+            right_trim=test_size,
         )
-        Y_df = Y_df.reset_index(drop=False)
-        fcsts_df = fcsts_df.merge(Y_df, how="left", on=["unique_id", "ds"])
+        fcsts = np.hstack([fcsts, self.dataset._column(0)[positions].numpy()[:, None]])
         if self.dataset.scalers_ is not None:
-            sizes = fcsts_df.groupby("unique_id", observed=True).size().values
+            sizes = ((len_series - self.h) // step_size + 1) * self.h
             indptr = np.append(0, sizes.cumsum())
-            invert_cols = cols + ["y"]
-            fcsts_df[invert_cols] = self.dataset._invert_target_transform(
-                fcsts_df[invert_cols].values, indptr
-            )
+            fcsts = self.dataset._invert_target_transform(fcsts, indptr)
+
+        # Add predictions to forecasts DataFrame
+        fcsts_df = _to_frame(
+            {
+                "unique_id": fcsts_df["unique_id"].values,
+                "ds": fcsts_df["ds"].values,
+                "cutoff": fcsts_df["cutoff"].values,
+                **dict(zip(cols + ["y"], fcsts.T)),
+            },
+            self._frame_type,
+        )
 
         return fcsts_df
 
+    def quantize(
+        self,
+        df: Optional[pd.DataFrame] = None,
+        static_df: Optional[pd.DataFrame] = None,
+        max_drift: Optional[float] = None,
+        sort_df: bool = True,
+    ):
+        """Quantize core.NeuralForecast's windows based models.
+
+        Post-training dynamic int8 quantization of the linear layers of the windows based models
+        for CPU inference, see `BaseWindows.quantize`. The models are quantized in place,
+        they are saved and loaded quantized. The accuracy drift of each model is the relative change
+        of the mean absolute error of its forecasts of the last `h` values of `df`.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
+            Holdout DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
+            Defaults to the stored dataset.
+        static_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
+            DataFrame with columns [`unique_id`] and static exogenous.
+        max_drift : float, optional (default=None)
+            The models whose accuracy drift is larger are kept in float.
+        sort_df : bool (default=True)
+            Sort `df` before quantizing.
+
+        Returns
+        -------
+        drifts : dict
+            Accuracy drift of each windows based model, by model column name.
+        """
+        if not self._fitted:
+            raise Exception("You must fit the model before quantizing.")
+
+        if df is not None:
+            dataset, *_ = self._prepare_fit(
+                df=df, static_df=static_df, sort_df=sort_df, scaler_type=None
+            )
+            dataset.scalers_ = self.dataset.scalers_
+            dataset._transform_temporal()
+        else:
+            self._retain()
+            dataset = self.dataset
+
+        drifts = {}
+        count_names = {"model": 0}
+        for model in self.models:
+            model_name = repr(model)
+            count_names[model_name] = count_names.get(model_name, -1) + 1
+            if count_names[model_name] > 0:
+                model_name += str(count_names[model_name])
+            model = _quantizable_model(model)
+            if (model is None) or model.quantized:
+                continue
+            drifts[model_name] = model.quantize(dataset=dataset, max_drift=max_drift)
+        return drifts
+
     # Save list of models with pytorch lightning save_checkpoint function
     def save(
         self,
@@ -650,6 +1130,7 @@ class NeuralForecast:
         model_index: Optional[List] = None,
         save_dataset: bool = True,
         overwrite: bool = False,
+        format: str = "ckpt",
     ):
         """Save NeuralForecast core class.
 
@@ -667,7 +1148,13 @@ class NeuralForecast:
             Whether to save dataset or not.
         overwrite : bool (default=False)
             Whether to overwrite files or not.
+        format : str (default='ckpt')
+            'ckpt' saves a Lightning checkpoint per model and pickles the dataset and configuration.
+            'manifest' saves the weights and the datasets as raw arrays described by a versioned `manifest.json`,
+            which can be memory mapped and whose models can be loaded on first use, see `load`.
         """
+        if format not in ("ckpt", "manifest"):
+            raise ValueError(f"format must be 'ckpt' or 'manifest', got {format}")
         # Standarize path without '/'
         if path[-1] == "/":
             path = path[:-1]
@@ -688,6 +1175,12 @@ class NeuralForecast:
                 "Directory is not empty. Set `overwrite=True` to overwrite files."
             )
 
+        if format == "manifest":
+            self._save_manifest(
+                path=path, model_index=model_index, save_dataset=save_dataset
+            )
+            return
+
         # Save models
         count_names = {"model": 0}
         for i, model in enumerate(self.models):
@@ -699,10 +1192,14 @@ class NeuralForecast:
             count_names[model_name] = count_names.get(model_name, -1) + 1
             model.save(f"{path}/{model_name}_{count_names[model_name]}.ckpt")
 
-        # Save dataset
+        # Save dataset, the full history is kept in a separate file
         if (save_dataset) and (hasattr(self, "dataset")):
+            self._retain()
             with open(f"{path}/dataset.pkl", "wb") as f:
                 pickle.dump(self.dataset, f)
+            if self.full_dataset is not None:
+                with open(f"{path}/full_dataset.pkl", "wb") as f:
+                    pickle.dump(self.full_dataset, f)
         elif save_dataset:
             raise Exception(
                 "You need to have a stored dataset to save it, \
@@ -717,14 +1214,195 @@ class NeuralForecast:
             "last_dates": self.last_dates,
             "ds": self.ds,
             "sort_df": self.sort_df,
+            "exog_dtype": self.exog_dtype,
+            "compact_mask": self.compact_mask,
+            "retention": self.retention,
+            "keep_full_history": self.keep_full_history,
+            "full_ds": self.full_ds,
             "_fitted": self._fitted,
         }
 
         with open(f"{path}/configuration.pkl", "wb") as f:
             pickle.dump(config_dict, f)
 
+    def _save_manifest(self, path, model_index, save_dataset):
+        manifest = {
+            "format": "neuralforecast",
+            "version": _SAVE_FORMAT_VERSION,
+            "models": [],
+            "datasets": {},
+        }
+
+        # Save models, each one in its own file with its hyperparameters in the manifest
+        count_names = {"model": 0}
+        for i, model in enumerate(self.models):
+            if i not in model_index:
+                continue
+            model_name = repr(model).lower().replace("_", "")
+            count_names[model_name] = count_names.get(model_name, -1) + 1
+            name = f"{model_name}_{count_names[model_name]}"
+            # auto models save the selected model
+            if hasattr(model, "cls_model"):
+                model = model.model
+            hparams, hparams_tensors, objects = _encode_hparams(dict(model.hparams))
+            quantized = getattr(model, "quantized", False)
+            state_dict = model.state_dict()
+            if quantized:
+                state_dict = _flatten_quantized(state_dict)
+            arrays = {
+                **{f"weights/{k}": v for k, v in state_dict.items()},
+                **{f"hparams/{k}": v for k, v in hparams_tensors.items()},
+            }
+            entry = {
+                "name": name,
+                "repr": repr(model),
+                "class": type(model).__name__,
+                "hparams": hparams,
+                "objects": None,
+                "quantized": quantized,
+            }
+            entry["arrays"] = _write_arrays(f"{path}/{name}.bin", arrays)
+            if objects:
+                entry["objects"] = f"{name}.objects.pkl"
+                with open(f"{path}/{entry['objects']}", "wb") as f:
+                    pickle.dump(objects, f)
+            manifest["models"].append(entry)
+
+        # Save datasets
+        if (save_dataset) and (hasattr(self, "dataset")):
+            self._retain()
+            for name in ["dataset", "full_dataset"]:
+                dataset = getattr(self, name)
+                if dataset is not None:
+                    arrays, attrs = dataset._to_arrays()
+                    manifest["datasets"][name] = {
+                        "attrs": attrs,
+                        "arrays": _write_arrays(f"{path}/{name}.bin", arrays),
+                    }
+        elif save_dataset:
+            raise Exception(
+                "You need to have a stored dataset to save it, \
+                             set `save_dataset=False` to skip saving dataset."
+            )
+
+        # Save configuration
+        arrays = {}
+        for name in ["uids", "last_dates", "ds", "full_ds"]:
+            value = getattr(self, name, None)
+            if value is not None:
+                arrays[name] = np.asarray(value)
+        exog_dtype = self.exog_dtype
+        if exog_dtype is not None:
+            exog_dtype = str(exog_dtype).replace("torch.", "")
+        manifest["config"] = {
+            "h": self.h,
+            "freq": self.freq.freqstr,
+            "local_scaler_type": self.local_scaler_type,
+            "exog_dtype": exog_dtype,
+            "compact_mask": self.compact_mask,
+            "retention": self.retention,
+            "keep_full_history": self.keep_full_history,
+            "sort_df": getattr(self, "sort_df", None),
+            "_fitted": self._fitted,
+            "arrays": _write_arrays(f"{path}/configuration.bin", arrays),
+        }
+
+        # The manifest is written last, a directory without it is an incomplete save
+        with open(f"{path}/manifest.json", "w") as f:
+            json.dump(manifest, f, indent=2)
+
     @staticmethod
-    def load(path, verbose=False, **kwargs):
+    def _load_manifest(path, verbose=False, lazy=False, mmap=False, **kwargs):
+        with open(f"{path}/manifest.json") as f:
+            manifest = json.load(f)
+        if manifest["version"] > _SAVE_FORMAT_VERSION:
+            raise Exception(
+                f"The directory was saved with the version {manifest['version']} of the format, "
+                f"which is newer than the supported one ({_SAVE_FORMAT_VERSION}). Please upgrade neuralforecast."
+            )
+        config = manifest["config"]
+        model_classes = {cls.__name__: cls for cls in MODEL_FILENAME_DICT.values()}
+
+        def model_loader(entry):
+            def load_model():
+                arrays = _read_arrays(
+                    f"{path}/{entry['name']}.bin", entry["arrays"], mmap=mmap
+                )
+                objects = {}
+                if entry["objects"] is not None:
+                    with open(f"{path}/{entry['objects']}", "rb") as f:
+                        objects = pickle.load(f)
+                hparams_tensors = {
+                    k[len("hparams/") :]: v
+                    for k, v in arrays.items()
+                    if k.startswith("hparams/")
+                }
+                hparams = _decode_hparams(entry["hparams"], hparams_tensors, objects)
+                model = model_classes[entry["class"]](**{**hparams, **kwargs})
+                weights = {
+                    k[len("weights/") :]: v
+                    for k, v in arrays.items()
+                    if k.startswith("weights/")
+                }
+                if entry.get("quantized", False):
+                    model.quantize()
+                    weights = _unflatten_quantized(weights, model.state_dict())
+                # with mmap the parameters keep the mapped tensors instead of copying them
+                model.load_state_dict(weights, assign=mmap)
+                if verbose:
+                    print(f"Model {entry['name']} loaded.")
+                return model
+
+            return load_model
+
+        if verbose:
+            print(10 * "-" + " Loading models " + 10 * "-")
+        models = []
+        for entry in manifest["models"]:
+            load_model = model_loader(entry)
+            models.append(
+                _LazyModel(load_model, entry["repr"], config["h"])
+                if lazy
+                else load_model()
+            )
+
+        # Create NeuralForecast object
+        neuralforecast = NeuralForecast(
+            models=models,
+            freq=config["freq"],
+            local_scaler_type=config["local_scaler_type"],
+            exog_dtype=config["exog_dtype"],
+            compact_mask=config["compact_mask"],
+            retention=config["retention"],
+            keep_full_history=config["keep_full_history"],
+        )
+
+        if verbose:
+            print(10 * "-" + " Loading dataset " + 10 * "-")
+        datasets = {}
+        for name, entry in manifest["datasets"].items():
+            arrays = _read_arrays(f"{path}/{name}.bin", entry["arrays"], mmap=mmap)
+            datasets[name] = TimeSeriesDataset._from_arrays(arrays, entry["attrs"])
+        arrays = _read_arrays(f"{path}/configuration.bin", config["arrays"], mmap=mmap)
+        if "dataset" in datasets:
+            neuralforecast.dataset = datasets["dataset"]
+            neuralforecast.uids = pd.Index(arrays["uids"], name="unique_id")
+            neuralforecast.last_dates = pd.Index(arrays["last_dates"], name="ds")
+            neuralforecast.ds = arrays["ds"]
+            neuralforecast.sort_df = config["sort_df"]
+            if "full_dataset" in datasets:
+                neuralforecast.full_dataset = datasets["full_dataset"]
+                neuralforecast.full_ds = arrays["full_ds"]
+            if verbose:
+                print("Dataset loaded.")
+        elif verbose:
+            print("No dataset found in directory.")
+
+        neuralforecast._fitted = config["_fitted"]
+        return neuralforecast
+
+    @staticmethod
+    def load(path, verbose=False, lazy=False, mmap=False, **kwargs):
         """Load NeuralForecast
 
         `core.NeuralForecast`'s method to load checkpoint from path.
@@ -733,9 +1411,15 @@ class NeuralForecast:
         -----------
         path : str
             Directory to save current status.
+        verbose : bool (default=False)
+            Print processing steps.
+        lazy : bool (default=False)
+            Only for the 'manifest' format. Load each model the first time it's used, e.g. by `predict`.
+        mmap : bool (default=False)
+            Only for the 'manifest' format. Memory map the weights and the datasets instead of reading them.
         kwargs
             Additional keyword arguments to be passed to the function
-            `load_from_checkpoint`.
+            `load_from_checkpoint`, with the 'manifest' format they override the saved hyperparameters.
 
         Returns
         -------
@@ -743,6 +1427,10 @@ class NeuralForecast:
             Instantiated `NeuralForecast` class.
         """
         files = [f for f in os.listdir(path) if isfile(join(path, f))]
+        if "manifest.json" in files:
+            return NeuralForecast._load_manifest(
+                path, verbose=verbose, lazy=lazy, mmap=mmap, **kwargs
+            )
 
         # Load models
         models_ckpt = [f for f in files if f.endswith(".ckpt")]
@@ -774,6 +1462,12 @@ class NeuralForecast:
             dataset = None
             if verbose:
                 print("No dataset found in directory.")
+        full_dataset = None
+        if "full_dataset.pkl" in files:
+            with open(f"{path}/full_dataset.pkl", "rb") as f:
+                full_dataset = pickle.load(f)
+            if verbose:
+                print("Full history loaded.")
 
         if verbose:
             print(10 * "-" + " Loading configuration " + 10 * "-")
@@ -787,7 +1481,14 @@ class NeuralForecast:
             raise Exception("No configuration found in directory.")
 
         # Create NeuralForecast object
-        neuralforecast = NeuralForecast(models=models, freq=config_dict["freq"])
+        neuralforecast = NeuralForecast(
+            models=models,
+            freq=config_dict["freq"],
+            exog_dtype=config_dict.get("exog_dtype"),
+            compact_mask=config_dict.get("compact_mask", False),
+            retention=config_dict.get("retention"),
+            keep_full_history=config_dict.get("keep_full_history", False),
+        )
 
         # Dataset
         if dataset is not None:
@@ -796,6 +1497,9 @@ class NeuralForecast:
             neuralforecast.last_dates = config_dict["last_dates"]
             neuralforecast.ds = config_dict["ds"]
             neuralforecast.sort_df = config_dict["sort_df"]
+            if full_dataset is not None:
+                neuralforecast.full_dataset = full_dataset
+                neuralforecast.full_ds = config_dict["full_ds"]
 
         # Fitted flag
         neuralforecast._fitted = config_dict["_fitted"]
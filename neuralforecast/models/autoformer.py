@@ -472,6 +472,11 @@ class Autoformer(BaseWindows):
     `random_seed`: int=1, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
+    `dataloader_kwargs`: dict, optional, list of parameters passed into the PyTorch Lightning dataloader by the `TimeSeriesDataLoader`. <br>
+    `compile`: bool=False, if True the `forward` runs compiled with `torch.compile`, on batches padded to a power of two size.<br>
+    `compile_mode`: str='default', mode of `torch.compile`, 'default', 'reduce-overhead' or 'max-autotune'.<br>
+    `windows_sampling`: str='series', 'series' samples `windows_batch_size` windows from `batch_size` series, 'global' samples them uniformly from all the valid windows of the dataset.<br>
+    `valid_series_fraction`: float=1.0, fraction of series used for validation, sampled once per `fit` and kept fixed across validation checks.<br>
     `alias`: str, optional,  Custom name of the model.<br>
     `**trainer_kwargs`: int,  keyword trainer arguments inherited from [PyTorch Lighning's trainer](https://pytorch-lightning.readthedocs.io/en/stable/api/pytorch_lightning.trainer.trainer.Trainer.html?highlight=trainer).<br>
 
@@ -517,6 +522,11 @@ class Autoformer(BaseWindows):
         random_seed: int = 1,
         num_workers_loader: int = 0,
         drop_last_loader: bool = False,
+        dataloader_kwargs=None,
+        compile=False,
+        compile_mode="default",
+        windows_sampling="series",
+        valid_series_fraction=1.0,
         **trainer_kwargs,
     ):
         super(Autoformer, self).__init__(
@@ -542,6 +552,11 @@ class Autoformer(BaseWindows):
             scaler_type=scaler_type,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            dataloader_kwargs=dataloader_kwargs,
+            compile=compile,
+            compile_mode=compile_mode,
+            windows_sampling=windows_sampling,
+            valid_series_fraction=valid_series_fraction,
             random_seed=random_seed,
             **trainer_kwargs,
         )
@@ -668,7 +683,7 @@ class Autoformer(BaseWindows):
             x_mark_enc = None
             x_mark_dec = None
 
-        x_dec = torch.zeros(size=(len(insample_y), self.h, 1)).to(insample_y.device)
+        x_dec = torch.zeros(size=(insample_y.shape[0], self.h, 1)).to(insample_y.device)
         x_dec = torch.cat([insample_y[:, -self.label_len :, :], x_dec], dim=1)
 
         # decomp init
@@ -104,6 +104,11 @@ class DeepAR(BaseWindows):
     `random_seed`: int, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
+    `dataloader_kwargs`: dict, optional, list of parameters passed into the PyTorch Lightning dataloader by the `TimeSeriesDataLoader`. <br>
+    `compile`: bool=False, if True the `forward` runs compiled with `torch.compile`, on batches padded to a power of two size.<br>
+    `compile_mode`: str='default', mode of `torch.compile`, 'default', 'reduce-overhead' or 'max-autotune'.<br>
+    `windows_sampling`: str='series', 'series' samples `windows_batch_size` windows from `batch_size` series, 'global' samples them uniformly from all the valid windows of the dataset.<br>
+    `valid_series_fraction`: float=1.0, fraction of series used for validation, sampled once per `fit` and kept fixed across validation checks.<br>
     `alias`: str, optional,  Custom name of the model.<br>
     `**trainer_kwargs`: int,  keyword trainer arguments inherited from [PyTorch Lighning's trainer](https://pytorch-lightning.readthedocs.io/en/stable/api/pytorch_lightning.trainer.trainer.Trainer.html?highlight=trainer).<br>    
 
@@ -149,6 +154,11 @@ class DeepAR(BaseWindows):
         random_seed: int = 1,
         num_workers_loader=0,
         drop_last_loader=False,
+        dataloader_kwargs=None,
+        compile=False,
+        compile_mode="default",
+        windows_sampling="series",
+        valid_series_fraction=1.0,
         **trainer_kwargs
     ):
         # DeepAR does not support historic exogenous variables
@@ -195,6 +205,11 @@ class DeepAR(BaseWindows):
             scaler_type=scaler_type,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            dataloader_kwargs=dataloader_kwargs,
+            compile=compile,
+            compile_mode=compile_mode,
+            windows_sampling=windows_sampling,
+            valid_series_fraction=valid_series_fraction,
             random_seed=random_seed,
             **trainer_kwargs
         )
@@ -261,6 +276,11 @@ class DeepAR(BaseWindows):
 
         # Model Predictions
         output = self.train_forward(windows_batch)
+        # bfloat16 with precision='bf16-mixed', the losses run in float32
+        if isinstance(output, tuple):
+            output = tuple(o.float() for o in output)
+        else:
+            output = output.float()
 
         if self.loss.is_distribution_output:
             _, y_loc, y_scale = self._inv_normalization(
@@ -337,7 +357,7 @@ class DeepAR(BaseWindows):
             )
 
             # Model Predictions
-            output_batch = self(windows_batch)
+            output_batch = self._forward(windows_batch)
             # Monte Carlo already returns y_hat with mean and quantiles
             output_batch = output_batch[:, :, 1:]  # Remove mean
             valid_loss_batch = self.valid_loss(
@@ -398,7 +418,7 @@ class DeepAR(BaseWindows):
             )
 
             # Model Predictions
-            y_hat = self(windows_batch)
+            y_hat = self._forward(windows_batch)
             # Monte Carlo already returns y_hat with mean and quantiles
             y_hats.append(y_hat)
         y_hat = torch.cat(y_hats, dim=0)
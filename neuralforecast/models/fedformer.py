@@ -307,10 +307,10 @@ class FourierBlock(nn.Module):
             )
         )
 
-    # Complex multiplication
+    # Complex multiplication of all the modes
     def compl_mul1d(self, input, weights):
-        # (batch, in_channel, x ), (in_channel, out_channel, x) -> (batch, out_channel, x)
-        return torch.einsum("bhi,hio->bho", input, weights)
+        # (batch, head, in_channel, modes), (head, in_channel, out_channel, modes) -> (batch, head, out_channel, modes)
+        return torch.einsum("bhix,hiox->bhox", input, weights)
 
     def forward(self, q, k, v, mask):
         # size = [B, L, H, E]
@@ -319,12 +319,11 @@ class FourierBlock(nn.Module):
         x = q.permute(0, 2, 3, 1)
         # Compute Fourier coefficients
         x_ft = torch.fft.rfft(x, dim=-1)
-        # Perform Fourier neural operations
+        # Perform Fourier neural operations, the selected modes are kept in the lowest frequencies
         out_ft = torch.zeros(B, H, E, L // 2 + 1, device=x.device, dtype=torch.cfloat)
-        for wi, i in enumerate(self.index):
-            out_ft[:, :, :, wi] = self.compl_mul1d(
-                x_ft[:, :, :, i], self.weights1[:, :, :, wi]
-            )
+        out_ft[:, :, :, : len(self.index)] = self.compl_mul1d(
+            x_ft[:, :, :, self.index], self.weights1
+        )
         # Return to time domain
         x = torch.fft.irfft(out_ft, n=x.size(-1))
         return (x, None)
@@ -381,19 +380,9 @@ class FourierCrossAttention(nn.Module):
         xk = k.permute(0, 2, 3, 1)
         # xv = v.permute(0, 2, 3, 1)
 
-        # Compute Fourier coefficients
-        xq_ft_ = torch.zeros(
-            B, H, E, len(self.index_q), device=xq.device, dtype=torch.cfloat
-        )
-        xq_ft = torch.fft.rfft(xq, dim=-1)
-        for i, j in enumerate(self.index_q):
-            xq_ft_[:, :, :, i] = xq_ft[:, :, :, j]
-        xk_ft_ = torch.zeros(
-            B, H, E, len(self.index_kv), device=xq.device, dtype=torch.cfloat
-        )
-        xk_ft = torch.fft.rfft(xk, dim=-1)
-        for i, j in enumerate(self.index_kv):
-            xk_ft_[:, :, :, i] = xk_ft[:, :, :, j]
+        # Compute Fourier coefficients of the selected modes
+        xq_ft_ = torch.fft.rfft(xq, dim=-1)[:, :, :, self.index_q]
+        xk_ft_ = torch.fft.rfft(xk, dim=-1)[:, :, :, self.index_kv]
 
         # Attention mechanism on frequency domain
         xqk_ft = torch.einsum("bhex,bhey->bhxy", xq_ft_, xk_ft_)
@@ -409,8 +398,7 @@ class FourierCrossAttention(nn.Module):
         xqkv_ft = torch.einsum("bhxy,bhey->bhex", xqk_ft, xk_ft_)
         xqkvw = torch.einsum("bhex,heox->bhox", xqkv_ft, self.weights1)
         out_ft = torch.zeros(B, H, E, L // 2 + 1, device=xq.device, dtype=torch.cfloat)
-        for i, j in enumerate(self.index_q):
-            out_ft[:, :, :, j] = xqkvw[:, :, :, i]
+        out_ft[:, :, :, self.index_q] = xqkvw
 
         # Return to time domain
         out = torch.fft.irfft(
@@ -418,7 +406,7 @@ class FourierCrossAttention(nn.Module):
         )
         return (out, None)
 
-# %% ../../nbs/models.fedformer.ipynb 11
+# %% ../../nbs/models.fedformer.ipynb 12
 class FEDformer(BaseWindows):
     """FEDformer
 
@@ -467,6 +455,11 @@ class FEDformer(BaseWindows):
     `random_seed`: int=1, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
+    `dataloader_kwargs`: dict, optional, list of parameters passed into the PyTorch Lightning dataloader by the `TimeSeriesDataLoader`. <br>
+    `compile`: bool=False, if True the `forward` runs compiled with `torch.compile`, on batches padded to a power of two size.<br>
+    `compile_mode`: str='default', mode of `torch.compile`, 'default', 'reduce-overhead' or 'max-autotune'.<br>
+    `windows_sampling`: str='series', 'series' samples `windows_batch_size` windows from `batch_size` series, 'global' samples them uniformly from all the valid windows of the dataset.<br>
+    `valid_series_fraction`: float=1.0, fraction of series used for validation, sampled once per `fit` and kept fixed across validation checks.<br>
     `alias`: str, optional,  Custom name of the model.<br>
     `**trainer_kwargs`: int,  keyword trainer arguments inherited from [PyTorch Lighning's trainer](https://pytorch-lightning.readthedocs.io/en/stable/api/pytorch_lightning.trainer.trainer.Trainer.html?highlight=trainer).<br>
 
@@ -511,6 +504,11 @@ class FEDformer(BaseWindows):
         random_seed: int = 1,
         num_workers_loader: int = 0,
         drop_last_loader: bool = False,
+        dataloader_kwargs=None,
+        compile=False,
+        compile_mode="default",
+        windows_sampling="series",
+        valid_series_fraction=1.0,
         **trainer_kwargs,
     ):
         super(FEDformer, self).__init__(
@@ -535,6 +533,11 @@ class FEDformer(BaseWindows):
             scaler_type=scaler_type,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            dataloader_kwargs=dataloader_kwargs,
+            compile=compile,
+            compile_mode=compile_mode,
+            windows_sampling=windows_sampling,
+            valid_series_fraction=valid_series_fraction,
             random_seed=random_seed,
             **trainer_kwargs,
         )
@@ -660,7 +663,7 @@ class FEDformer(BaseWindows):
             x_mark_enc = None
             x_mark_dec = None
 
-        x_dec = torch.zeros(size=(len(insample_y), self.h, self.dec_in)).to(
+        x_dec = torch.zeros(size=(insample_y.shape[0], self.h, self.dec_in)).to(
             insample_y.device
         )
         x_dec = torch.cat([insample_y[:, -self.label_len :, :], x_dec], dim=1)
@@ -50,6 +50,9 @@ class GRU(BaseRecurrent):
     `random_seed`: int=1, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
+    `dataloader_kwargs`: dict, optional, list of parameters passed into the PyTorch Lightning dataloader by the `TimeSeriesDataLoader`. <br>
+    `compile`: bool=False, if True the `forward` runs compiled with `torch.compile`, on batches padded to a power of two size.<br>
+    `compile_mode`: str='default', mode of `torch.compile`, 'default', 'reduce-overhead' or 'max-autotune'.<br>
     `alias`: str, optional,  Custom name of the model.<br>
     `**trainer_kwargs`: int,  keyword trainer arguments inherited from [PyTorch Lighning's trainer](https://pytorch-lightning.readthedocs.io/en/stable/api/pytorch_lightning.trainer.trainer.Trainer.html?highlight=trainer).<br>
     """
@@ -86,6 +89,9 @@ class GRU(BaseRecurrent):
         random_seed=1,
         num_workers_loader=0,
         drop_last_loader=False,
+        dataloader_kwargs=None,
+        compile=False,
+        compile_mode="default",
         **trainer_kwargs
     ):
         super(GRU, self).__init__(
@@ -107,6 +113,9 @@ class GRU(BaseRecurrent):
             stat_exog_list=stat_exog_list,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            dataloader_kwargs=dataloader_kwargs,
+            compile=compile,
+            compile_mode=compile_mode,
             random_seed=random_seed,
             **trainer_kwargs
         )
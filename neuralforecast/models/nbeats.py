@@ -24,7 +24,7 @@ class IdentityBasis(nn.Module):
     def forward(self, theta: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
         backcast = theta[:, : self.backcast_size]
         forecast = theta[:, self.backcast_size :]
-        forecast = forecast.reshape(len(forecast), -1, self.out_features)
+        forecast = forecast.reshape(forecast.shape[0], -1, self.out_features)
         return backcast, forecast
 
 
@@ -73,7 +73,7 @@ class TrendBasis(nn.Module):
         backcast_theta = theta[:, :polynomial_size]
         forecast_theta = theta[:, polynomial_size:]
         forecast_theta = forecast_theta.reshape(
-            len(forecast_theta), polynomial_size, -1
+            forecast_theta.shape[0], polynomial_size, -1
         )
         backcast = torch.einsum("bp,pt->bt", backcast_theta, self.backcast_basis)
         forecast = torch.einsum("bpq,pt->btq", forecast_theta, self.forecast_basis)
@@ -135,7 +135,9 @@ class SeasonalityBasis(nn.Module):
         harmonic_size = self.forecast_basis.shape[0]  # [harmonic_size, L+H]
         backcast_theta = theta[:, :harmonic_size]
         forecast_theta = theta[:, harmonic_size:]
-        forecast_theta = forecast_theta.reshape(len(forecast_theta), harmonic_size, -1)
+        forecast_theta = forecast_theta.reshape(
+            forecast_theta.shape[0], harmonic_size, -1
+        )
         backcast = torch.einsum("bp,pt->bt", backcast_theta, self.backcast_basis)
         forecast = torch.einsum("bpq,pt->btq", forecast_theta, self.forecast_basis)
         return backcast, forecast
@@ -227,6 +229,11 @@ class NBEATS(BaseWindows):
     `random_seed`: int, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
+    `dataloader_kwargs`: dict, optional, list of parameters passed into the PyTorch Lightning dataloader by the `TimeSeriesDataLoader`. <br>
+    `compile`: bool=False, if True the `forward` runs compiled with `torch.compile`, on batches padded to a power of two size.<br>
+    `compile_mode`: str='default', mode of `torch.compile`, 'default', 'reduce-overhead' or 'max-autotune'.<br>
+    `windows_sampling`: str='series', 'series' samples `windows_batch_size` windows from `batch_size` series, 'global' samples them uniformly from all the valid windows of the dataset.<br>
+    `valid_series_fraction`: float=1.0, fraction of series used for validation, sampled once per `fit` and kept fixed across validation checks.<br>
     `alias`: str, optional,  Custom name of the model.<br>
     `**trainer_kwargs`: int,  keyword trainer arguments inherited from [PyTorch Lighning's trainer](https://pytorch-lightning.readthedocs.io/en/stable/api/pytorch_lightning.trainer.trainer.Trainer.html?highlight=trainer).<br>
 
@@ -267,6 +274,11 @@ class NBEATS(BaseWindows):
         random_seed: int = 1,
         num_workers_loader: int = 0,
         drop_last_loader: bool = False,
+        dataloader_kwargs=None,
+        compile=False,
+        compile_mode="default",
+        windows_sampling="series",
+        valid_series_fraction=1.0,
         **trainer_kwargs,
     ):
         # Inherit BaseWindows class
@@ -289,6 +301,11 @@ class NBEATS(BaseWindows):
             scaler_type=scaler_type,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            dataloader_kwargs=dataloader_kwargs,
+            compile=compile,
+            compile_mode=compile_mode,
+            windows_sampling=windows_sampling,
+            valid_series_fraction=valid_series_fraction,
             random_seed=random_seed,
             **trainer_kwargs,
         )
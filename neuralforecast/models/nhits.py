@@ -22,6 +22,7 @@ class _IdentityBasis(nn.Module):
         forecast_size: int,
         interpolation_mode: str,
         out_features: int = 1,
+        n_knots: Optional[int] = None,
     ):
         super().__init__()
         assert (interpolation_mode in ["linear", "nearest"]) or (
@@ -31,14 +32,34 @@ class _IdentityBasis(nn.Module):
         self.backcast_size = backcast_size
         self.interpolation_mode = interpolation_mode
         self.out_features = out_features
+        # The interpolation is linear in the knots, so when their number is known
+        # it is precomputed as a [n_knots,H] matrix (not saved in the checkpoints)
+        interpolation_matrix = None
+        if n_knots is not None:
+            eye = torch.eye(n_knots)
+            if "cubic" in interpolation_mode:
+                # [K,None,None,K] -> [K,None,H,H] -> [K,H]
+                interpolation_matrix = F.interpolate(
+                    eye[:, None, None, :], size=forecast_size, mode="bicubic"
+                )[:, 0, 0, :]
+            else:
+                interpolation_matrix = F.interpolate(
+                    eye[:, None, :], size=forecast_size, mode=interpolation_mode
+                )[:, 0, :]
+        self.register_buffer(
+            "interpolation_matrix", interpolation_matrix, persistent=False
+        )
 
     def forward(self, theta: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
         backcast = theta[:, : self.backcast_size]
         knots = theta[:, self.backcast_size :]
 
         # Interpolation is performed on default dim=-1 := H
-        knots = knots.reshape(len(knots), self.out_features, -1)
-        if self.interpolation_mode in ["nearest", "linear"]:
+        knots = knots.reshape(knots.shape[0], self.out_features, -1)
+        if self.interpolation_matrix is not None:
+            # [B,Q,K] @ [K,H] -> [B,Q,H]
+            forecast = torch.matmul(knots, self.interpolation_matrix)
+        elif self.interpolation_mode in ["nearest", "linear"]:
             # knots = knots[:,None,:]
             forecast = F.interpolate(
                 knots, size=self.forecast_size, mode=self.interpolation_mode
@@ -68,7 +89,7 @@ class _IdentityBasis(nn.Module):
         forecast = forecast.permute(0, 2, 1)
         return backcast, forecast
 
-# %% ../../nbs/models.nhits.ipynb 10
+# %% ../../nbs/models.nhits.ipynb 11
 ACTIVATIONS = ["ReLU", "Softplus", "Tanh", "SELU", "LeakyReLU", "PReLU", "Sigmoid"]
 
 POOLING = ["MaxPool1d", "AvgPool1d"]
@@ -152,7 +173,7 @@ class NHITSBlock(nn.Module):
 
         # Flatten MLP inputs [B, L+H, C] -> [B, (L+H)*C]
         # Contatenate [ Y_t, | X_{t-L},..., X_{t} | F_{t-L},..., F_{t+H} | S ]
-        batch_size = len(insample_y)
+        batch_size = insample_y.shape[0]
         if self.hist_input_size > 0:
             hist_exog = hist_exog.permute(0, 2, 1)  # [B, L, C] -> [B, C, L]
             hist_exog = self.pooling_layer(hist_exog)
@@ -179,7 +200,7 @@ class NHITSBlock(nn.Module):
         backcast, forecast = self.basis(theta)
         return backcast, forecast
 
-# %% ../../nbs/models.nhits.ipynb 11
+# %% ../../nbs/models.nhits.ipynb 12
 class NHITS(BaseWindows):
     """NHITS
 
@@ -221,6 +242,11 @@ class NHITS(BaseWindows):
     `random_seed`: int, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
+    `dataloader_kwargs`: dict, optional, list of parameters passed into the PyTorch Lightning dataloader by the `TimeSeriesDataLoader`. <br>
+    `compile`: bool=False, if True the `forward` runs compiled with `torch.compile`, on batches padded to a power of two size.<br>
+    `compile_mode`: str='default', mode of `torch.compile`, 'default', 'reduce-overhead' or 'max-autotune'.<br>
+    `windows_sampling`: str='series', 'series' samples `windows_batch_size` windows from `batch_size` series, 'global' samples them uniformly from all the valid windows of the dataset.<br>
+    `valid_series_fraction`: float=1.0, fraction of series used for validation, sampled once per `fit` and kept fixed across validation checks.<br>
     `alias`: str, optional,  Custom name of the model.<br>
     `**trainer_kwargs`: int,  keyword trainer arguments inherited from [PyTorch Lighning's trainer](https://pytorch-lightning.readthedocs.io/en/stable/api/pytorch_lightning.trainer.trainer.Trainer.html?highlight=trainer).<br>
 
@@ -267,6 +293,11 @@ class NHITS(BaseWindows):
         random_seed: int = 1,
         num_workers_loader=0,
         drop_last_loader=False,
+        dataloader_kwargs=None,
+        compile=False,
+        compile_mode="default",
+        windows_sampling="series",
+        valid_series_fraction=1.0,
         **trainer_kwargs,
     ):
         # Inherit BaseWindows class
@@ -293,6 +324,11 @@ class NHITS(BaseWindows):
             scaler_type=scaler_type,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            dataloader_kwargs=dataloader_kwargs,
+            compile=compile,
+            compile_mode=compile_mode,
+            windows_sampling=windows_sampling,
+            valid_series_fraction=valid_series_fraction,
             random_seed=random_seed,
             **trainer_kwargs,
         )
@@ -344,14 +380,14 @@ class NHITS(BaseWindows):
                     stack_types[i] == "identity"
                 ), f"Block type {stack_types[i]} not found!"
 
-                n_theta = input_size + self.loss.outputsize_multiplier * max(
-                    h // n_freq_downsample[i], 1
-                )
+                n_knots = max(h // n_freq_downsample[i], 1)
+                n_theta = input_size + self.loss.outputsize_multiplier * n_knots
                 basis = _IdentityBasis(
                     backcast_size=input_size,
                     forecast_size=h,
                     out_features=self.loss.outputsize_multiplier,
                     interpolation_mode=interpolation_mode,
+                    n_knots=n_knots,
                 )
 
                 nbeats_block = NHITSBlock(
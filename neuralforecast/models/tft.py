@@ -78,6 +78,78 @@ class GRN(nn.Module):
         x = self.layer_norm(x)
         return x
 
+
+class GroupedGRN(nn.Module):
+    """
+    `num_inputs` GRNs, one for each input variable, with their weights stacked
+    so that all the variables go through each layer in a single batched matmul.
+    """
+
+    # stacked parameter -> parameter of each GRN, used to load the state of a list of GRNs
+    GRN_PARAMS = {
+        "lin_a_weight": "lin_a.weight",
+        "lin_a_bias": "lin_a.bias",
+        "lin_i_weight": "lin_i.weight",
+        "lin_i_bias": "lin_i.bias",
+        "glu_weight": "glu.lin.weight",
+        "glu_bias": "glu.lin.bias",
+        "ln_weight": "layer_norm.ln.weight",
+        "ln_bias": "layer_norm.ln.bias",
+    }
+
+    def __init__(self, num_inputs, hidden_size, dropout=0):
+        super().__init__()
+        self.num_inputs = num_inputs
+        self.hidden_size = hidden_size
+        # initialized as the list of GRNs, so that the same seed gives the same weights
+        # without inputs, e.g. the static encoder without static exogenous, there are no weights
+        grns = [
+            GRN(input_size=hidden_size, hidden_size=hidden_size)
+            for _ in range(num_inputs)
+        ]
+        for name, grn_name in self.GRN_PARAMS.items():
+            if grns:
+                value = torch.stack(
+                    [grn.get_parameter(grn_name).detach() for grn in grns]
+                )
+                self.register_parameter(name, nn.Parameter(value))
+        self.dropout = nn.Dropout(dropout)
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        # checkpoints saved with a list of GRNs
+        if f"{prefix}0.lin_a.weight" in state_dict:
+            for name, grn_name in self.GRN_PARAMS.items():
+                state_dict[prefix + name] = torch.stack(
+                    [
+                        state_dict.pop(f"{prefix}{i}.{grn_name}")
+                        for i in range(self.num_inputs)
+                    ]
+                )
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
+    def forward(self, a: Tensor) -> Tensor:
+        # [..., num_inputs, hidden_size] -> [num_inputs, N, hidden_size]
+        batch_shape = a.shape[:-2]
+        a = a.reshape(-1, self.num_inputs, self.hidden_size).transpose(0, 1)
+        x = torch.baddbmm(
+            self.lin_a_bias.unsqueeze(1), a, self.lin_a_weight.transpose(1, 2)
+        )
+        x = F.elu(x)
+        x = torch.baddbmm(
+            self.lin_i_bias.unsqueeze(1), x, self.lin_i_weight.transpose(1, 2)
+        )
+        x = self.dropout(x)
+        x = torch.baddbmm(
+            self.glu_bias.unsqueeze(1), x, self.glu_weight.transpose(1, 2)
+        )
+        x = F.glu(x)
+        x = x + a
+        x = F.layer_norm(x, (self.hidden_size,), eps=1e-3)
+        x = x * self.ln_weight.unsqueeze(1) + self.ln_bias.unsqueeze(1)
+        return x.transpose(0, 1).reshape(
+            *batch_shape, self.num_inputs, self.hidden_size
+        )
+
 # %% ../../nbs/models.tft.ipynb 13
 class TFTEmbedding(nn.Module):
     def __init__(
@@ -175,29 +247,25 @@ class VariableSelectionNetwork(nn.Module):
             output_size=num_inputs,
             context_hidden_size=hidden_size,
         )
-        self.var_grns = nn.ModuleList(
-            [
-                GRN(input_size=hidden_size, hidden_size=hidden_size, dropout=dropout)
-                for _ in range(num_inputs)
-            ]
+        self.var_grns = GroupedGRN(
+            num_inputs=num_inputs, hidden_size=hidden_size, dropout=dropout
         )
 
     def forward(self, x: Tensor, context: Optional[Tensor] = None):
         Xi = x.reshape(*x.shape[:-2], -1)
         grn_outputs = self.joint_grn(Xi, c=context)
         sparse_weights = F.softmax(grn_outputs, dim=-1)
-        transformed_embed_list = [m(x[..., i, :]) for i, m in enumerate(self.var_grns)]
-        transformed_embed = torch.stack(transformed_embed_list, dim=-1)
-        # the line below performs batched matrix vector multiplication
-        # for temporal features it's bthf,btf->bth
-        # for static features it's bhf,bf->bh
+        transformed_embed = self.var_grns(x)
+        # the line below performs batched vector matrix multiplication
+        # for temporal features it's btf,btfh->bth
+        # for static features it's bf,bfh->bh
         variable_ctx = torch.matmul(
-            transformed_embed, sparse_weights.unsqueeze(-1)
-        ).squeeze(-1)
+            sparse_weights.unsqueeze(-2), transformed_embed
+        ).squeeze(-2)
 
         return variable_ctx, sparse_weights
 
-# %% ../../nbs/models.tft.ipynb 15
+# %% ../../nbs/models.tft.ipynb 16
 class InterpretableMultiHeadAttention(nn.Module):
     def __init__(self, n_head, hidden_size, example_length, attn_dropout, dropout):
         super().__init__()
@@ -252,7 +320,7 @@ class InterpretableMultiHeadAttention(nn.Module):
 
         return out, attn_vec
 
-# %% ../../nbs/models.tft.ipynb 18
+# %% ../../nbs/models.tft.ipynb 19
 class StaticCovariateEncoder(nn.Module):
     def __init__(self, hidden_size, num_static_vars, dropout):
         super().__init__()
@@ -278,7 +346,7 @@ class StaticCovariateEncoder(nn.Module):
 
         return cs, ce, ch, cc
 
-# %% ../../nbs/models.tft.ipynb 20
+# %% ../../nbs/models.tft.ipynb 21
 class TemporalCovariateEncoder(nn.Module):
     def __init__(self, hidden_size, num_historic_vars, num_future_vars, dropout):
         super(TemporalCovariateEncoder, self).__init__()
@@ -317,7 +385,7 @@ class TemporalCovariateEncoder(nn.Module):
         temporal_features = self.input_gate_ln(temporal_features)
         return temporal_features
 
-# %% ../../nbs/models.tft.ipynb 22
+# %% ../../nbs/models.tft.ipynb 23
 class TemporalFusionDecoder(nn.Module):
     def __init__(
         self, n_head, hidden_size, example_length, encoder_length, attn_dropout, dropout
@@ -378,7 +446,7 @@ class TemporalFusionDecoder(nn.Module):
 
         return x
 
-# %% ../../nbs/models.tft.ipynb 24
+# %% ../../nbs/models.tft.ipynb 25
 class TFT(BaseWindows):
     """TFT
 
@@ -417,6 +485,11 @@ class TFT(BaseWindows):
     `random_seed`: int, random seed initialization for replicability.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
+    `dataloader_kwargs`: dict, optional, list of parameters passed into the PyTorch Lightning dataloader by the `TimeSeriesDataLoader`. <br>
+    `compile`: bool=False, if True the `forward` runs compiled with `torch.compile`, on batches padded to a power of two size.<br>
+    `compile_mode`: str='default', mode of `torch.compile`, 'default', 'reduce-overhead' or 'max-autotune'.<br>
+    `windows_sampling`: str='series', 'series' samples `windows_batch_size` windows from `batch_size` series, 'global' samples them uniformly from all the valid windows of the dataset.<br>
+    `valid_series_fraction`: float=1.0, fraction of series used for validation, sampled once per `fit` and kept fixed across validation checks.<br>
     `alias`: str, optional,  Custom name of the model.<br>
     `**trainer_kwargs`: int,  keyword trainer arguments inherited from [PyTorch Lighning's trainer](https://pytorch-lightning.readthedocs.io/en/stable/api/pytorch_lightning.trainer.trainer.Trainer.html?highlight=trainer).<br>
 
@@ -456,6 +529,11 @@ class TFT(BaseWindows):
         scaler_type: str = "robust",
         num_workers_loader=0,
         drop_last_loader=False,
+        dataloader_kwargs=None,
+        compile=False,
+        compile_mode="default",
+        windows_sampling="series",
+        valid_series_fraction=1.0,
         random_seed: int = 1,
         **trainer_kwargs
     ):
@@ -479,6 +557,11 @@ class TFT(BaseWindows):
             scaler_type=scaler_type,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            dataloader_kwargs=dataloader_kwargs,
+            compile=compile,
+            compile_mode=compile_mode,
+            windows_sampling=windows_sampling,
+            valid_series_fraction=valid_series_fraction,
             random_seed=random_seed,
             **trainer_kwargs
         )
@@ -173,6 +173,16 @@ class TimesNet(BaseWindows):
         Workers to be used by `TimeSeriesDataLoader`.
     drop_last_loader : bool (default=False)
         If True `TimeSeriesDataLoader` drops last non-full batch.
+    dataloader_kwargs : dict, optional (default=None)
+        List of parameters passed into the PyTorch Lightning dataloader by the `TimeSeriesDataLoader`.
+    compile : bool (default=False)
+        If True the `forward` runs compiled with `torch.compile`, on batches padded to a power of two size.
+    compile_mode : str (default='default')
+        Mode of `torch.compile`, 'default', 'reduce-overhead' or 'max-autotune'.
+    windows_sampling : str (default='series')
+        'series' samples `windows_batch_size` windows from `batch_size` series, 'global' samples them uniformly from all the valid windows of the dataset.
+    valid_series_fraction : float (default=1.0)
+        Fraction of series used for validation, sampled once per `fit` and kept fixed across validation checks.
     **trainer_kwargs
         Keyword trainer arguments inherited from [PyTorch Lighning's trainer](https://pytorch-lightning.readthedocs.io/en/stable/api/pytorch_lightning.trainer.trainer.Trainer.html?highlight=trainer)
 
@@ -215,6 +225,11 @@ class TimesNet(BaseWindows):
         random_seed: int = 1,
         num_workers_loader: int = 0,
         drop_last_loader: bool = False,
+        dataloader_kwargs=None,
+        compile=False,
+        compile_mode="default",
+        windows_sampling="series",
+        valid_series_fraction=1.0,
         **trainer_kwargs
     ):
         super(TimesNet, self).__init__(
@@ -240,6 +255,11 @@ class TimesNet(BaseWindows):
             scaler_type=scaler_type,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            dataloader_kwargs=dataloader_kwargs,
+            compile=compile,
+            compile_mode=compile_mode,
+            windows_sampling=windows_sampling,
+            valid_series_fraction=valid_series_fraction,
             random_seed=random_seed,
             **trainer_kwargs
         )
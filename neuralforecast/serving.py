@@ -0,0 +1,181 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/serving.ipynb.
+
+# %% auto 0
+__all__ = ['OnnxForecaster']
+
+# %% ../nbs/serving.ipynb 3
+import json
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from utilsforecast.processing import make_future_dataframe
+
+# %% ../nbs/serving.ipynb 5
+class OnnxForecaster:
+    """ONNX Forecaster
+
+    Runs the ONNX graph of a model exported with its `export_onnx` method.
+    The graph contains the `TemporalNorm` normalization of the model but not the
+    `local_scaler_type` of `NeuralForecast`, the data is used as given.
+
+    **Parameters:**<br>
+    `path`: str, path of the ONNX file.<br>
+    `freq`: str or int, optional, frequency of the data, needed to predict from DataFrames.<br>
+    `batch_size`: int=128, number of series of each run of the graph, the recurrent graphs hold all their windows in memory.<br>
+    `providers`: List[str], optional, onnxruntime execution providers, defaults to the CPU.<br>
+    """
+
+    def __init__(
+        self,
+        path: str,
+        freq: Optional[Union[str, int]] = None,
+        batch_size: int = 128,
+        providers: Optional[List[str]] = None,
+    ):
+        import onnxruntime as ort
+
+        if providers is None:
+            providers = ["CPUExecutionProvider"]
+        self.session = ort.InferenceSession(path, providers=providers)
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        if "neuralforecast" not in metadata:
+            raise Exception(f"{path} was not exported with `export_onnx`.")
+        metadata = json.loads(metadata["neuralforecast"])
+        self.model_name = metadata["model"]
+        self.kind = metadata["kind"]
+        self.h = metadata["h"]
+        self.input_size = metadata["input_size"]
+        self.temporal_cols = metadata["temporal_cols"]
+        self.static_cols = metadata["static_cols"]
+        self.futr_exog_list = metadata["futr_exog_list"]
+        self.output_names = metadata["output_names"]
+        self.freq = freq
+        self.batch_size = batch_size
+
+    def __repr__(self):
+        return f"OnnxForecaster(model={self.model_name})"
+
+    def _predict(self, temporal, indptr, max_size, static=None):
+        # Same inputs as the models' predict batches: the series are left padded
+        # with zeros, the windows models only see their last input_size + h rows.
+        n_times = self.input_size + self.h if self.kind == "windows" else max_size
+        rows = indptr[1:, None] - n_times + np.arange(n_times)
+        n_series = len(indptr) - 1
+        fcsts = []
+        for start in range(0, n_series, self.batch_size):
+            end = min(start + self.batch_size, n_series)
+            batch_rows = rows[start:end]
+            available = batch_rows >= indptr[start:end, None]
+            x = np.where(available[:, :, None], temporal[np.maximum(batch_rows, 0)], 0)
+            if self.kind == "recurrent":
+                x = x.transpose(0, 2, 1)  # [B, T, C] -> [B, C, T]
+            inputs = {"temporal": np.ascontiguousarray(x, dtype=np.float32)}
+            if len(self.static_cols):
+                inputs["static"] = np.ascontiguousarray(
+                    static[start:end], dtype=np.float32
+                )
+            y_hat = self.session.run(None, inputs)[0]
+            fcsts.append(y_hat.reshape(-1, len(self.output_names)))
+        return np.concatenate(fcsts)
+
+    def predict_dataset(self, dataset):
+        """Predict from a TimeSeriesDataset.
+
+        **Parameters:**<br>
+        `dataset`: NeuralForecast's `TimeSeriesDataset` with the `h` future rows of each series,
+        as updated by `NeuralForecast.predict`.<br>
+
+        **Returns:**<br>
+        `fcsts`: np.ndarray of shape `[n_series * h, n_outputs]`, like the models' `predict`.
+        """
+        missing = set(self.temporal_cols) - set(dataset.temporal_cols)
+        if len(missing):
+            raise Exception(f"{missing} temporal variables not found in input dataset")
+        temporal = np.stack(
+            [
+                dataset._column(dataset.temporal_cols.get_loc(col)).numpy()
+                for col in self.temporal_cols
+            ],
+            axis=1,
+        )
+        static = None
+        if len(self.static_cols):
+            static_cols = [] if dataset.static_cols is None else dataset.static_cols
+            missing = set(self.static_cols) - set(static_cols)
+            if len(missing):
+                raise Exception(
+                    f"{missing} static exogenous variables not found in input dataset"
+                )
+            static = np.asarray(dataset.static)[
+                :, static_cols.get_indexer(self.static_cols)
+            ]
+        return self._predict(
+            temporal=temporal,
+            indptr=np.asarray(dataset.indptr),
+            max_size=dataset.max_size,
+            static=static,
+        )
+
+    def predict(self, df, static_df=None, futr_df=None):
+        """Predict from DataFrames.
+
+        **Parameters:**<br>
+        `df`: pandas DataFrame with columns [`unique_id`, `ds`, `y`] and the historic and future exogenous.<br>
+        `static_df`: pandas DataFrame, optional, with columns [`unique_id`] and the static exogenous.<br>
+        `futr_df`: pandas DataFrame, optional, with columns [`unique_id`, `ds`] and the future exogenous of the horizon.<br>
+
+        **Returns:**<br>
+        `fcsts_df`: pandas DataFrame indexed by `unique_id` with the `ds` of the horizon and the forecasts,
+        like `NeuralForecast.predict`.
+        """
+        if self.freq is None:
+            raise Exception("OnnxForecaster needs a `freq` to predict from DataFrames.")
+        df = df.sort_values(["unique_id", "ds"], kind="stable")
+        uids, counts = np.unique(df["unique_id"].to_numpy(), return_counts=True)
+        last_dates = df["ds"].iloc[counts.cumsum() - 1].reset_index(drop=True)
+        fcsts_df = make_future_dataframe(
+            uids=pd.Series(uids), last_times=last_dates, freq=self.freq, h=self.h
+        )
+
+        # Future rows with the future exogenous, the rest of the columns are unknown
+        futr_rows = fcsts_df.copy()
+        if len(self.futr_exog_list):
+            if futr_df is None:
+                raise ValueError(
+                    f"Models require the following future exogenous features: {set(self.futr_exog_list)}. "
+                    "Please provide them through the `futr_df` argument."
+                )
+            futr_rows = futr_rows.merge(
+                futr_df[["unique_id", "ds"] + self.futr_exog_list],
+                on=["unique_id", "ds"],
+                how="left",
+            )
+            if futr_rows[self.futr_exog_list].isnull().any().any():
+                raise ValueError(
+                    f"`futr_df` must have one row per id and ds in the forecasting horizon ({self.h})."
+                )
+        futr_rows["available_mask"] = 1
+        if "available_mask" not in df.columns:
+            df = df.assign(available_mask=1)
+        data = pd.concat([df, futr_rows]).sort_values(
+            ["unique_id", "ds"], kind="stable"
+        )
+        data = data.reindex(columns=self.temporal_cols)
+        indptr = np.append(0, (counts + self.h).cumsum())
+        static = None
+        if len(self.static_cols):
+            static = (
+                static_df.set_index("unique_id").loc[uids, self.static_cols].to_numpy()
+            )
+        fcsts = self._predict(
+            temporal=data.to_numpy(dtype=np.float32),
+            indptr=indptr,
+            max_size=(counts + self.h).max(),
+            static=static,
+        )
+
+        cols = [self.model_name + name for name in self.output_names]
+        fcsts_df = fcsts_df.set_index("unique_id")
+        fcsts_df[cols] = fcsts
+        return fcsts_df
@@ -1,25 +1,245 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/tsdataset.ipynb.
 
 # %% auto 0
-__all__ = ['TimeSeriesLoader', 'TimeSeriesDataset', 'TimeSeriesDataModule']
+__all__ = ['TimeSeriesLoader', 'TimeSeriesDataset', 'TimeSeriesWindowsDataset', 'TimeSeriesDataModule']
 
 # %% ../nbs/tsdataset.ipynb 4
+import copy
+import queue
+import threading
 import warnings
 from collections.abc import Mapping
-from typing import Dict, Optional, TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from utilsforecast.target_transforms import BaseTargetTransform
+from typing import Optional
 
 import numpy as np
 import pandas as pd
 import pytorch_lightning as pl
 import torch
 from torch.utils.data import Dataset, DataLoader
+from utilsforecast.compat import POLARS_INSTALLED, njit, pl_DataFrame
 from utilsforecast.grouped_array import GroupedArray
-from utilsforecast.processing import DataFrameProcessor
+from utilsforecast.processing import (
+    counts_by_id,
+    maybe_compute_sort_indices,
+    validate_format,
+)
 
 # %% ../nbs/tsdataset.ipynb 5
+def _arrow_to_frame(df):
+    """Converts an Arrow table to a polars DataFrame, which shares its buffers,
+    or to a pandas DataFrame when polars is not installed. Other inputs are returned as they are.
+    """
+    if type(df).__module__.split(".")[0] != "pyarrow":
+        return df
+    if POLARS_INSTALLED:
+        import polars
+
+        return polars.from_arrow(df)
+    return df.to_pandas(split_blocks=True)
+
+# %% ../nbs/tsdataset.ipynb 6
+def _trim_rows(indptr, left_trim=0, right_trim=0, max_size=None):
+    """
+    Rows kept from each serie when removing `left_trim` and `right_trim` steps
+    and then keeping at most its last `max_size` steps. Returns the rows and the new `indptr`.
+    """
+    sizes = np.diff(indptr) - left_trim - right_trim
+    starts = indptr[:-1] + left_trim
+    if max_size is not None:
+        starts = starts + np.maximum(sizes - max_size, 0)
+        sizes = np.minimum(sizes, max_size)
+    new_indptr = np.append(0, sizes.cumsum()).astype(np.int32)
+    series = np.repeat(np.arange(sizes.size), sizes)
+    rows = np.arange(new_indptr[-1]) - new_indptr[series] + starts[series]
+    return rows, new_indptr
+
+# %% ../nbs/tsdataset.ipynb 7
+@njit
+def _standard_stats(x):
+    return np.nanmean(x), np.nanstd(x)
+
+
+@njit
+def _minmax_stats(x):
+    min_ = np.nanmin(x)
+    return min_, np.nanmax(x) - min_
+
+
+@njit
+def _robust_mad_stats(x):
+    median = np.nanmedian(x)
+    return median, np.nanmedian(np.abs(x - median))
+
+
+@njit
+def _robust_iqr_stats(x):
+    q25, median, q75 = np.nanquantile(x, (0.25, 0.5, 0.75))
+    return median, q75 - q25
+
+
+@njit
+def _local_fit_transform(data, indptr, cols, stats_fn):
+    """
+    Fits the offset and scale of each serie in the columns `cols` of `data` and scales them in place,
+    with a single pass over the series. Returns the statistics with shape (len(cols), n_groups, 2).
+    """
+    n_groups = indptr.size - 1
+    stats = np.empty((cols.size, n_groups, 2), dtype=data.dtype)
+    eps = np.finfo(data.dtype).eps
+    for i in range(n_groups):
+        start, end = indptr[i], indptr[i + 1]
+        for k in range(cols.size):
+            x = np.ascontiguousarray(data[start:end, cols[k]])
+            stats[k, i, 0], stats[k, i, 1] = stats_fn(x)
+            offset, scale = stats[k, i, 0], stats[k, i, 1]
+            # constant series are only shifted
+            if abs(scale) < eps:
+                data[start:end, cols[k]] = x - offset
+            else:
+                data[start:end, cols[k]] = (x - offset) / scale
+    return stats
+
+
+@njit
+def _local_scale(x, indptr, stats, inverse):
+    """Scales the rows of each serie in the 2D array `x` with its offset and scale in `stats`."""
+    out = np.empty_like(x)
+    eps = np.finfo(stats.dtype).eps
+    for i in range(indptr.size - 1):
+        start, end = indptr[i], indptr[i + 1]
+        offset, scale = stats[i, 0], stats[i, 1]
+        if abs(scale) < eps:
+            scale = np.ones(1, dtype=stats.dtype)[0]
+        if inverse:
+            out[start:end] = x[start:end] * scale + offset
+        else:
+            out[start:end] = (x[start:end] - offset) / scale
+    return out
+
+
+class _LocalScaler(Mapping):
+    """
+    Scales each serie of several temporal columns with its own statistics.
+
+    All the columns are fitted in a single pass over the series and their statistics are kept
+    in the `stats_` array, with shape (n_cols, n_groups, 2) for the offset and scale
+    or (n_cols, n_groups, 1) for the boxcox lambdas. Indexing by column gives the
+    equivalent `utilsforecast` target transform, which shares the statistics.
+    """
+
+    stats_fns = {
+        "standard": _standard_stats,
+        "robust": _robust_mad_stats,
+        "robust-iqr": _robust_iqr_stats,
+        "minmax": _minmax_stats,
+    }
+
+    def __init__(self, scaler_type, cols):
+        if scaler_type not in [*self.stats_fns, "boxcox"]:
+            raise ValueError(
+                f"scaler_type must be one of {[*self.stats_fns, 'boxcox']}"
+            )
+        self.scaler_type = scaler_type
+        self.cols = list(cols)
+
+    def fit_transform(self, data: np.ndarray, indptr: np.ndarray, cols) -> np.ndarray:
+        """Fits the columns of the scaler, which are taken from `data` by the names `cols`, and scales them in place."""
+        idxs = np.array([list(cols).index(col) for col in self.cols], dtype=np.int64)
+        if self.scaler_type != "boxcox":
+            self.stats_ = _local_fit_transform(
+                data, indptr, idxs, self.stats_fns[self.scaler_type]
+            )
+            return data
+        # the lambdas come from an optimization on each serie
+        from utilsforecast.target_transforms import LocalBoxCox
+
+        self.stats_ = np.empty((idxs.size, indptr.size - 1, 1), dtype=data.dtype)
+        for k, idx in enumerate(idxs):
+            ga = GroupedArray(np.ascontiguousarray(data[:, idx]), indptr)
+            self.stats_[k, :, 0] = LocalBoxCox().fit(ga).lmbdas_
+        return self.transform(data, indptr, cols)
+
+    def scale(
+        self, x: np.ndarray, indptr: np.ndarray, col: str, inverse: bool = False
+    ) -> np.ndarray:
+        """Scales the series of `x` with the statistics of `col`, 2D inputs use them in all their columns."""
+        stats = self.stats_[self.cols.index(col)]
+        if self.scaler_type == "boxcox":
+            from scipy.special import boxcox1p, inv_boxcox1p
+
+            lmbdas = np.repeat(stats[:, 0], np.diff(indptr))
+            if x.ndim == 2:
+                lmbdas = lmbdas[:, None]
+            return inv_boxcox1p(x, lmbdas) if inverse else boxcox1p(x, lmbdas)
+        out = _local_scale(
+            np.ascontiguousarray(x).reshape(x.shape[0], -1), indptr, stats, inverse
+        )
+        return out.reshape(x.shape)
+
+    def transform(
+        self, data: np.ndarray, indptr: np.ndarray, cols, inverse: bool = False
+    ) -> np.ndarray:
+        """Scales in place the columns of `data` named `cols` that belong to the scaler, the other ones are kept."""
+        for idx, col in enumerate(cols):
+            if col in self.cols:
+                data[:, idx] = self.scale(data[:, idx], indptr, col, inverse=inverse)
+        return data
+
+    def inverse_transform(
+        self, data: np.ndarray, indptr: np.ndarray, col: str = "y"
+    ) -> np.ndarray:
+        """Inverts the scaling of all the columns of `data`, e.g. the forecasts of each model, with the statistics of `col`."""
+        return self.scale(data, indptr, col, inverse=True)
+
+    def __getitem__(self, col):
+        from utilsforecast import target_transforms
+
+        if col not in self.cols:
+            raise KeyError(col)
+        stats = self.stats_[self.cols.index(col)]
+        if self.scaler_type == "boxcox":
+            scaler = target_transforms.LocalBoxCox()
+            scaler.lmbdas_ = stats[:, 0]
+            return scaler
+        scaler = {
+            "standard": target_transforms.LocalStandardScaler,
+            "robust": lambda: target_transforms.LocalRobustScaler(scale="mad"),
+            "robust-iqr": lambda: target_transforms.LocalRobustScaler(scale="iqr"),
+            "minmax": target_transforms.LocalMinMaxScaler,
+        }[self.scaler_type]()
+        scaler.stats_ = stats
+        return scaler
+
+    def __contains__(self, col):
+        return col in self.cols
+
+    def __iter__(self):
+        return iter(self.cols)
+
+    def __len__(self):
+        return len(self.cols)
+
+    @staticmethod
+    def _from_transforms(scalers):
+        """Scaler with the statistics of the `utilsforecast` target transforms in `scalers`, by column."""
+        first = next(iter(scalers.values()))
+        stats_fn = getattr(first, "stats_fn", None)
+        scaler_type = {
+            "LocalStandardScaler": "standard",
+            "LocalMinMaxScaler": "minmax",
+            "LocalBoxCox": "boxcox",
+            "LocalRobustScaler": "robust-iqr"
+            if getattr(stats_fn, "__name__", "").endswith("iqr_stats")
+            else "robust",
+        }[type(first).__name__]
+        scaler = _LocalScaler(scaler_type, scalers.keys())
+        if scaler_type == "boxcox":
+            scaler.stats_ = np.stack([s.lmbdas_ for s in scalers.values()])[..., None]
+        else:
+            scaler.stats_ = np.stack([s.stats_ for s in scalers.values()])
+        return scaler
+
+# %% ../nbs/tsdataset.ipynb 8
 class TimeSeriesLoader(DataLoader):
     """TimeSeriesLoader DataLoader.
     [Source code](https://github.com/Nixtla/neuralforecast1/blob/main/neuralforecast/tsdataset.py).
@@ -36,15 +256,28 @@ class TimeSeriesLoader(DataLoader):
     `shuffle`: (bool, optional): set to `True` to have the data reshuffled at every epoch (default: `False`).<br>
     `sampler`: (Sampler or Iterable, optional): defines the strategy to draw samples from the dataset.<br>
                 Can be any `Iterable` with `__len__` implemented. If specified, `shuffle` must not be specified.<br>
+    `pin_memory`: (bool, optional): if `True` the batches are copied into pinned memory before being returned (default: `False`).<br>
+    `prefetch_batches`: (int, optional): number of batches prepared ahead by a background thread when `num_workers=0` (default: 0).<br>
     """
 
     def __init__(self, dataset, **kwargs):
         if "collate_fn" in kwargs:
             kwargs.pop("collate_fn")
+        self.prefetch_batches = kwargs.pop("prefetch_batches", 0)
         kwargs_ = {**kwargs, **dict(collate_fn=self._collate_fn)}
         DataLoader.__init__(self, dataset=dataset, **kwargs_)
 
+    def __iter__(self):
+        iterator = super().__iter__()
+        if self.prefetch_batches > 0 and self.num_workers == 0:
+            return _PrefetchIterator(iterator, self.prefetch_batches)
+        return iterator
+
     def _collate_fn(self, batch):
+        # Batches gathered by `TimeSeriesDataset.__getitems__` are already collated
+        if isinstance(batch, Mapping):
+            return batch
+
         elem = batch[0]
         elem_type = type(elem)
 
@@ -74,7 +307,40 @@ class TimeSeriesLoader(DataLoader):
 
         raise TypeError(f"Unknown {elem_type}")
 
-# %% ../nbs/tsdataset.ipynb 7
+# %% ../nbs/tsdataset.ipynb 9
+class _PrefetchIterator:
+    """Iterates over `iterator` while a background thread keeps
+    up to `n_batches` batches ready in a queue."""
+
+    _sentinel = object()
+
+    def __init__(self, iterator, n_batches):
+        self.queue = queue.Queue(maxsize=n_batches)
+        self.thread = threading.Thread(
+            target=self._worker, args=(iterator,), daemon=True
+        )
+        self.thread.start()
+
+    def _worker(self, iterator):
+        try:
+            for batch in iterator:
+                self.queue.put(batch)
+        except Exception as e:
+            self.queue.put(e)
+        self.queue.put(self._sentinel)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        batch = self.queue.get()
+        if batch is self._sentinel:
+            raise StopIteration
+        if isinstance(batch, Exception):
+            raise batch
+        return batch
+
+# %% ../nbs/tsdataset.ipynb 11
 class TimeSeriesDataset(Dataset):
     def __init__(
         self,
@@ -87,39 +353,24 @@ class TimeSeriesDataset(Dataset):
         static_cols=None,
         sorted=False,
         scaler_type=None,
+        exog_dtype=None,
+        compact_mask=False,
     ):
         super().__init__()
 
         if scaler_type is None:
-            self.scalers_: Optional[Dict[str, "BaseTargetTransform"]] = None
+            self.scalers_: Optional[_LocalScaler] = None
         else:
-            # delay the import because these require numba, which isn't a requirement
-            from utilsforecast.target_transforms import (
-                LocalBoxCox,
-                LocalMinMaxScaler,
-                LocalRobustScaler,
-                LocalStandardScaler,
-            )
+            cols = [col for col in temporal_cols if col != "available_mask"]
+            self.scalers_ = _LocalScaler(scaler_type, cols)
+            self.scalers_.fit_transform(temporal, indptr, temporal_cols)
 
-            type2scaler = {
-                "standard": LocalStandardScaler,
-                "robust": lambda: LocalRobustScaler(scale="mad"),
-                "robust-iqr": lambda: LocalRobustScaler(scale="iqr"),
-                "minmax": LocalMinMaxScaler,
-                "boxcox": LocalBoxCox,
-            }
-            if scaler_type not in type2scaler:
-                raise ValueError(f"scaler_type must be one of {type2scaler.keys()}")
-            self.scalers_ = {}
-            for i, col in enumerate(temporal_cols):
-                if col == "available_mask":
-                    continue
-                ga = GroupedArray(temporal[:, i], indptr)
-                self.scalers_[col] = type2scaler[scaler_type]()
-                temporal[:, i] = self.scalers_[col].fit_transform(ga)
-
-        self.temporal = torch.tensor(temporal, dtype=torch.float)
         self.temporal_cols = pd.Index(list(temporal_cols))
+        self.exog_dtype = (
+            getattr(torch, exog_dtype) if isinstance(exog_dtype, str) else exog_dtype
+        )
+        self.compact_mask = compact_mask
+        self._set_temporal(torch.as_tensor(temporal, dtype=torch.float))
 
         if static is not None:
             self.static = torch.tensor(static, dtype=torch.float)
@@ -143,7 +394,7 @@ class TimeSeriesDataset(Dataset):
             temporal = torch.zeros(
                 size=(len(self.temporal_cols), self.max_size), dtype=torch.float32
             )
-            ts = self.temporal[self.indptr[idx] : self.indptr[idx + 1], :]
+            ts = self._take(slice(self.indptr[idx], self.indptr[idx + 1]))
             temporal[: len(self.temporal_cols), -len(ts) :] = ts.permute(1, 0)
 
             # Add static data if available
@@ -159,11 +410,33 @@ class TimeSeriesDataset(Dataset):
             return item
         raise ValueError(f"idx must be int, got {type(idx)}")
 
+    def __getitems__(self, idxs):
+        # Used by the DataLoader to build a whole batch at once: every series
+        # is sliced from `temporal` into a single left padded buffer,
+        # avoiding one allocation and `__getitem__` call per series
+        temporal = torch.zeros(
+            size=(len(idxs), self.max_size, len(self.temporal_cols)),
+            dtype=torch.float32,
+        )
+        for i, idx in enumerate(idxs):
+            start, end = self.indptr[idx], self.indptr[idx + 1]
+            temporal[i, self.max_size - (end - start) :] = self._take(slice(start, end))
+        temporal = temporal.permute(0, 2, 1).contiguous()
+
+        if self.static is None:
+            return dict(temporal=temporal, temporal_cols=self.temporal_cols)
+        return dict(
+            static=self.static[idxs],
+            static_cols=self.static_cols,
+            temporal=temporal,
+            temporal_cols=self.temporal_cols,
+        )
+
     def __len__(self):
         return self.n_groups
 
     def __repr__(self):
-        return f"TimeSeriesDataset(n_data={self.temporal.shape[0]:,}, n_groups={self.n_groups:,})"
+        return f"TimeSeriesDataset(n_data={len(self._temporal):,}, n_groups={self.n_groups:,})"
 
     def __eq__(self, other):
         if not hasattr(other, "data") or not hasattr(other, "indptr"):
@@ -172,27 +445,301 @@ class TimeSeriesDataset(Dataset):
             self.indptr, other.indptr
         )
 
+    def __getstate__(self):
+        # the appended rows live in views of larger buffers, only their rows are saved
+        state = self.__dict__.copy()
+        if state.pop("_buffers", None):
+            for name in ["_temporal", "_exog"]:
+                if state[name] is not None:
+                    state[name] = state[name].clone()
+        return state
+
+    def __setstate__(self, state):
+        # datasets pickled before the compact storage keep `temporal` as an attribute
+        if "temporal" in state:
+            state = {**state, "exog_dtype": None, "compact_mask": False}
+            temporal = state.pop("temporal")
+            self.__dict__.update(state)
+            self._set_temporal(temporal)
+        else:
+            self.__dict__.update(state)
+        # and before the local scaler, a `utilsforecast` target transform by column
+        if isinstance(self.__dict__.get("scalers_"), dict):
+            self.scalers_ = _LocalScaler._from_transforms(self.scalers_)
+        self._buffers = {}
+
+    def _to_arrays(self):
+        """
+        Splits the dataset in its tensors and arrays, and its json serializable attributes.
+        The fitted statistics of `scalers_` are stored as arrays. See `_from_arrays`.
+        """
+        arrays, attrs = {}, {}
+        for name, value in self.__getstate__().items():
+            if name == "scalers_":
+                continue
+            if isinstance(value, (torch.Tensor, np.ndarray)):
+                arrays[name] = value
+            elif isinstance(value, pd.Index):
+                attrs[name] = value.tolist()
+            elif isinstance(value, torch.dtype):
+                attrs[name] = str(value).replace("torch.", "")
+            elif isinstance(value, np.generic):
+                attrs[name] = value.item()
+            else:
+                attrs[name] = value
+        attrs["scalers_"] = None
+        if self.scalers_ is not None:
+            attrs["scalers_"] = {
+                "scaler_type": self.scalers_.scaler_type,
+                "cols": self.scalers_.cols,
+            }
+            arrays["scalers_/stats_"] = self.scalers_.stats_
+        return arrays, attrs
+
+    @staticmethod
+    def _from_arrays(arrays, attrs):
+        """Dataset with the `arrays` and `attrs` returned by `_to_arrays`, the arrays aren't copied."""
+        state = {k: v for k, v in attrs.items() if k != "scalers_"}
+        state.update({k: v for k, v in arrays.items() if not k.startswith("scalers_/")})
+        for name in ["temporal_cols", "static_cols"]:
+            if state[name] is not None:
+                state[name] = pd.Index(state[name])
+        if state["exog_dtype"] is not None:
+            state["exog_dtype"] = getattr(torch, state["exog_dtype"])
+        state["scalers_"] = None
+        if attrs["scalers_"] is not None:
+            state["scalers_"] = _LocalScaler(**attrs["scalers_"])
+            state["scalers_"].stats_ = arrays["scalers_/stats_"]
+        dataset = TimeSeriesDataset.__new__(TimeSeriesDataset)
+        dataset.__setstate__(state)
+        return dataset
+
+    def _set_temporal(self, temporal):
+        """
+        Stores the float32 `temporal` tensor. The exogenous columns are kept in `exog_dtype`
+        and, if `compact_mask`, the available mask is packed in bits or dropped when it's all ones.
+        """
+        n_cols = len(self.temporal_cols)
+        self._buffers = {}
+        self._mask_idx = None
+        if self.compact_mask and "available_mask" in self.temporal_cols:
+            self._mask_idx = self.temporal_cols.get_loc("available_mask")
+        self._exog_idx = []
+        if self.exog_dtype is not None:
+            self._exog_idx = [
+                i
+                for i, col in enumerate(self.temporal_cols)
+                if col not in ("y", "available_mask")
+            ]
+        self._temporal_idx = [
+            i for i in range(n_cols) if i != self._mask_idx and i not in self._exog_idx
+        ]
+        if len(self._temporal_idx) == n_cols:
+            self._temporal = temporal
+        else:
+            self._temporal = temporal[:, self._temporal_idx].contiguous()
+        self._exog = (
+            temporal[:, self._exog_idx].to(self.exog_dtype) if self._exog_idx else None
+        )
+        self._mask = None
+        if self._mask_idx is not None:
+            self._mask = self._pack_mask(temporal[:, self._mask_idx])
+
+    @staticmethod
+    def _pack_mask(mask):
+        """Available mask packed in bits, None when all the observations are available."""
+        available = mask.numpy() > 0
+        if available.all():
+            return None
+        return torch.from_numpy(np.packbits(available))
+
+    def _mask_rows(self, rows):
+        """Available mask of the `rows` (slice or index tensor) as float32."""
+        if isinstance(rows, slice):
+            rows = torch.arange(*rows.indices(len(self._temporal)))
+        if self._mask is None:
+            return torch.ones(rows.shape, dtype=torch.float32)
+        bits = self._mask[rows >> 3].long() >> (7 - (rows & 7))
+        return (bits & 1).float()
+
+    def _take(self, rows):
+        """Rows of `temporal` as a float32 tensor, the compact columns are upcasted."""
+        if not isinstance(rows, slice):
+            rows = torch.as_tensor(rows)
+        data = self._temporal[rows]
+        n_cols = len(self.temporal_cols)
+        if len(self._temporal_idx) == n_cols:
+            return data
+        out = data.new_empty((*data.shape[:-1], n_cols))
+        out[..., self._temporal_idx] = data
+        if self._exog is not None:
+            out[..., self._exog_idx] = self._exog[rows].float()
+        if self._mask_idx is not None:
+            out[..., self._mask_idx] = self._mask_rows(rows)
+        return out
+
+    def _column(self, i):
+        """Column `i` of `temporal` as a float32 tensor."""
+        if i in self._temporal_idx:
+            return self._temporal[:, self._temporal_idx.index(i)]
+        if i in self._exog_idx:
+            return self._exog[:, self._exog_idx.index(i)].float()
+        return self._mask_rows(slice(None))
+
+    def _set_column(self, i, values):
+        if i in self._temporal_idx:
+            self._temporal[:, self._temporal_idx.index(i)] = values
+        elif i in self._exog_idx:
+            self._exog[:, self._exog_idx.index(i)] = values.to(self.exog_dtype)
+        else:
+            self._mask = self._pack_mask(values)
+
+    @property
+    def temporal(self):
+        """float32 tensor with all the `temporal_cols`, only copied with a compact storage."""
+        return self._take(slice(None))
+
+    def _select_rows(self, rows, indptr, max_size, min_size, other=None):
+        """
+        New dataset with the selected `rows`, which index this dataset's rows
+        followed by `other`'s ones when given. Keeps the storage format.
+        """
+        rows = torch.as_tensor(rows)
+        dataset = copy.copy(self)
+        for name in ["_temporal", "_exog"]:
+            part = getattr(self, name)
+            if part is not None:
+                if other is not None:
+                    part = torch.cat([part, getattr(other, name)])
+                setattr(dataset, name, part[rows])
+        if self._mask_idx is not None:
+            mask = self._mask_rows(slice(None))
+            if other is not None:
+                mask = torch.cat([mask, other._mask_rows(slice(None))])
+            dataset._mask = self._pack_mask(mask[rows])
+        dataset.indptr = indptr
+        dataset.n_groups = indptr.size - 1
+        dataset.max_size = max_size
+        dataset.min_size = min_size
+        dataset.scalers_ = None
+        dataset.updated = False
+        dataset._buffers = {}
+        return dataset
+
     def _invert_target_transform(
         self, data: np.ndarray, indptr: np.ndarray
     ) -> np.ndarray:
         if self.scalers_ is None:
             return data
-        for i in range(data.shape[1]):
-            ga = GroupedArray(data[:, i], indptr)
-            data[:, i] = self.scalers_["y"].inverse_transform(ga)
-        return data
+        return self.scalers_.inverse_transform(data, indptr)
 
     def _transform_temporal(self) -> None:
         if self.scalers_ is None:
             return
         for i, col in enumerate(self.temporal_cols):
-            if col == "available_mask":
-                continue
-            scaler = self.scalers_.get(col, None)
-            if scaler is None:
+            if col in self.scalers_:
+                self._set_column(
+                    i,
+                    torch.from_numpy(
+                        self.scalers_.scale(self._column(i).numpy(), self.indptr, col)
+                    ),
+                )
+
+    def append(self, df, uids, ds):
+        """Appends the rows of `df` at the end of their series, in place.
+
+        Only the new rows are sorted and scaled (with the fitted `scalers_`). The storage
+        is grown geometrically, so the series stay contiguous without reallocating it
+        on every call.
+
+        **Parameters:**<br>
+        `df`: pandas, polars DataFrame or pyarrow Table with the `temporal_cols` of the dataset.<br>
+        `uids`: pandas Index with the ids of the dataset series.<br>
+        `ds`: numpy array with the sorted dates of the dataset rows.<br>
+
+        **Returns:**<br>
+        `dates`: pandas Index with the last date of each serie.<br>
+        `ds`: numpy array with the sorted dates of the updated dataset.<br>
+        """
+        df = _arrow_to_frame(df)
+        if not isinstance(df, pd.DataFrame):
+            df = df.to_pandas()
+        missing = set(self.temporal_cols) - set(df.columns) - {"available_mask"}
+        if missing:
+            raise ValueError(f"The following columns are missing from `df`: {missing}")
+        series = uids.get_indexer(df["unique_id"])
+        if (series < 0).any():
+            raise ValueError(
+                "`df` contains ids that are not in the dataset, use `fit` or `predict` with the full `df` for new series."
+            )
+        new_ds = df["ds"].to_numpy()
+        order = np.lexsort((new_ds, series))
+        counts = np.bincount(series, minlength=self.n_groups)
+
+        # Destination of the current and the new rows
+        sizes = np.diff(self.indptr)
+        new_sizes = sizes + counts
+        new_indptr = np.append(0, new_sizes.cumsum()).astype(np.int32)
+        n_rows, n_new = len(ds), len(order)
+        old_rows = np.arange(n_rows) + np.repeat(
+            new_indptr[:-1] - self.indptr[:-1], sizes
+        )
+        counts_indptr = np.append(0, counts.cumsum())
+        new_rows = np.arange(n_new) + np.repeat(
+            new_indptr[:-1] + sizes - counts_indptr[:-1], counts
+        )
+        updated_ds = np.empty(new_indptr[-1], dtype=ds.dtype)
+        updated_ds[old_rows] = ds
+        updated_ds[new_rows] = new_ds[order]
+        if not (updated_ds[new_rows] > updated_ds[new_rows - 1]).all():
+            raise ValueError(
+                "The dates in `df` must be unique and after the last date of each serie."
+            )
+
+        # New rows in the dataset format
+        temporal = np.empty((n_new, len(self.temporal_cols)), dtype=np.float32)
+        for i, col in enumerate(self.temporal_cols):
+            temporal[:, i] = df[col].to_numpy()[order] if col in df.columns else 1.0
+        if self.scalers_ is not None:
+            self.scalers_.transform(temporal, counts_indptr, self.temporal_cols)
+        temporal = torch.from_numpy(temporal)
+
+        # Move the current rows from the end, so that only a chunk is copied at a time
+        old_rows = torch.from_numpy(old_rows)
+        new_rows = torch.from_numpy(new_rows)
+        for name, idxs in [
+            ("_temporal", self._temporal_idx),
+            ("_exog", self._exog_idx),
+        ]:
+            part = getattr(self, name)
+            if part is None:
                 continue
-            ga = GroupedArray(self.temporal[:, i].numpy(), self.indptr)
-            self.temporal[:, i] = torch.from_numpy(scaler.transform(ga))
+            buffer = self._buffers.get(name)
+            if buffer is None or len(buffer) < len(updated_ds):
+                buffer = part.new_empty((int(1.5 * len(updated_ds)), part.shape[1]))
+                buffer[old_rows] = part
+            else:
+                chunk = 2**20
+                for end in range(n_rows, 0, -chunk):
+                    start = max(end - chunk, 0)
+                    buffer[old_rows[start:end]] = part[start:end].clone()
+            buffer[new_rows] = temporal[:, idxs].to(part.dtype)
+            self._buffers[name] = buffer
+            setattr(self, name, buffer[: len(updated_ds)])
+        if self._mask_idx is not None:
+            mask = np.ones(len(updated_ds), dtype=bool)
+            if self._mask is not None:
+                mask[old_rows] = np.unpackbits(self._mask.numpy(), count=n_rows).astype(
+                    bool
+                )
+            mask[new_rows] = temporal[:, self._mask_idx].numpy() > 0
+            self._mask = self._pack_mask(torch.from_numpy(mask))
+
+        self.indptr = new_indptr
+        self.max_size = new_sizes.max()
+        self.min_size = new_sizes.min()
+        dates = pd.Index(updated_ds[new_indptr[1:] - 1], name="ds")
+        return dates, updated_ds
 
     @staticmethod
     def update_dataset(dataset, future_df):
@@ -213,55 +760,49 @@ class TimeSeriesDataset(Dataset):
         future_df = future_df[["unique_id", "ds"] + temporal_cols.tolist()]
 
         # Process future_df
-        futr_dataset, *_ = dataset.from_df(df=future_df, sort_df=dataset.sorted)
+        futr_dataset, *_ = dataset.from_df(
+            df=future_df,
+            sort_df=dataset.sorted,
+            exog_dtype=dataset.exog_dtype,
+            compact_mask=dataset.compact_mask,
+        )
         futr_dataset.scalers_ = dataset.scalers_
         futr_dataset._transform_temporal()
 
-        # Define and fill new temporal with updated information
-        len_temporal, col_temporal = dataset.temporal.shape
-        new_temporal = torch.zeros(size=(len_temporal + len(future_df), col_temporal))
-        new_indptr = [0]
-        new_max_size = 0
-
-        acum = 0
-        for i in range(dataset.n_groups):
-            series_length = dataset.indptr[i + 1] - dataset.indptr[i]
-            new_length = (
-                series_length + futr_dataset.indptr[i + 1] - futr_dataset.indptr[i]
-            )
-            new_temporal[acum : (acum + series_length), :] = dataset.temporal[
-                dataset.indptr[i] : dataset.indptr[i + 1], :
-            ]
-            new_temporal[
-                (acum + series_length) : (acum + new_length), :
-            ] = futr_dataset.temporal[
-                futr_dataset.indptr[i] : futr_dataset.indptr[i + 1], :
-            ]
-
-            acum += new_length
-            new_indptr.append(acum)
-            if new_length > new_max_size:
-                new_max_size = new_length
+        # Rows of each serie followed by its future rows, indexed over both datasets
+        sizes = np.diff(dataset.indptr)
+        new_sizes = sizes + np.diff(futr_dataset.indptr)
+        new_indptr = np.append(0, new_sizes.cumsum()).astype(np.int32)
+        series = np.repeat(np.arange(dataset.n_groups), new_sizes)
+        positions = np.arange(new_indptr[-1]) - new_indptr[series]
+        rows = np.where(
+            positions < sizes[series],
+            dataset.indptr[series] + positions,
+            len(dataset._temporal)
+            + futr_dataset.indptr[series]
+            + positions
+            - sizes[series],
+        )
 
         # Define new dataset
-        updated_dataset = TimeSeriesDataset(
-            temporal=new_temporal,
-            temporal_cols=dataset.temporal_cols.copy(),
-            indptr=np.array(new_indptr).astype(np.int32),
-            max_size=new_max_size,
+        updated_dataset = dataset._select_rows(
+            rows=rows,
+            indptr=new_indptr,
+            max_size=new_sizes.max(),
             min_size=dataset.min_size,
-            static=dataset.static,
-            static_cols=dataset.static_cols,
-            sorted=dataset.sorted,
+            other=futr_dataset,
         )
 
         return updated_dataset
 
     @staticmethod
-    def trim_dataset(dataset, left_trim: int = 0, right_trim: int = 0):
+    def trim_dataset(
+        dataset, left_trim: int = 0, right_trim: int = 0, max_size: Optional[int] = None
+    ):
         """
         Trim temporal information from a dataset.
         Returns temporal indexes [t+left:t-right] for all series.
+        If `max_size` is given, only the last `max_size` of them are kept.
         """
         if dataset.min_size <= left_trim + right_trim:
             raise Exception(
@@ -269,43 +810,33 @@ class TimeSeriesDataset(Dataset):
                                 must be lower than the shorter time series ({dataset.min_size})"
             )
 
-        # Define and fill new temporal with trimmed information
-        len_temporal, col_temporal = dataset.temporal.shape
-        total_trim = (left_trim + right_trim) * dataset.n_groups
-        new_temporal = torch.zeros(size=(len_temporal - total_trim, col_temporal))
-        new_indptr = [0]
-
-        acum = 0
-        for i in range(dataset.n_groups):
-            series_length = dataset.indptr[i + 1] - dataset.indptr[i]
-            new_length = series_length - left_trim - right_trim
-            new_temporal[acum : (acum + new_length), :] = dataset.temporal[
-                dataset.indptr[i] + left_trim : dataset.indptr[i + 1] - right_trim, :
-            ]
-            acum += new_length
-            new_indptr.append(acum)
-
-        new_max_size = dataset.max_size - left_trim - right_trim
-        new_min_size = dataset.min_size - left_trim - right_trim
+        # Rows of each serie without the trimmed ones
+        rows, new_indptr = _trim_rows(dataset.indptr, left_trim, right_trim, max_size)
+        new_sizes = np.diff(new_indptr)
 
         # Define new dataset
-        updated_dataset = TimeSeriesDataset(
-            temporal=new_temporal,
-            temporal_cols=dataset.temporal_cols.copy(),
-            indptr=np.array(new_indptr).astype(np.int32),
-            max_size=new_max_size,
-            min_size=new_min_size,
-            static=dataset.static,
-            static_cols=dataset.static_cols,
-            sorted=dataset.sorted,
+        updated_dataset = dataset._select_rows(
+            rows=rows,
+            indptr=new_indptr,
+            max_size=new_sizes.max(),
+            min_size=new_sizes.min(),
         )
 
         return updated_dataset
 
     @staticmethod
-    def from_df(df, static_df=None, sort_df=False, scaler_type=None):
+    def from_df(
+        df,
+        static_df=None,
+        sort_df=False,
+        scaler_type=None,
+        return_sort_idxs=False,
+        exog_dtype=None,
+        compact_mask=False,
+    ):
         # TODO: protect on equality of static_df + df indexes
-        if df.index.name == "unique_id":
+        df = _arrow_to_frame(df)
+        if isinstance(df, pd.DataFrame) and df.index.name == "unique_id":
             warnings.warn(
                 "Passing the id as index is deprecated, please provide it as a column instead.",
                 DeprecationWarning,
@@ -313,7 +844,10 @@ class TimeSeriesDataset(Dataset):
             df = df.reset_index("unique_id")
         # Define indexes if not given
         if static_df is not None:
-            if static_df.index.name == "unique_id":
+            static_df = _arrow_to_frame(static_df)
+            if isinstance(static_df, pl_DataFrame):
+                static_df = static_df.to_pandas().set_index("unique_id")
+            elif static_df.index.name == "unique_id":
                 warnings.warn(
                     "Passing the id as index is deprecated, please provide it as a column instead.",
                     DeprecationWarning,
@@ -323,25 +857,44 @@ class TimeSeriesDataset(Dataset):
             if sort_df:
                 static_df = static_df.sort_index()
 
-        proc = DataFrameProcessor("unique_id", "ds", "y")
-        ids, times, data, indptr, sort_idxs = proc.process(df)
-        # processor sets y as the first column
-        temporal_cols = pd.Index(
-            ["y"] + df.columns.drop(["unique_id", "ds", "y"]).tolist()
+        validate_format(df, "unique_id", "ds", "y")
+        id_counts = counts_by_id(df, "unique_id")
+        ids = id_counts["unique_id"]
+        indptr = np.append(0, id_counts["counts"].to_numpy().cumsum()).astype(np.int32)
+        sort_idxs = maybe_compute_sort_indices(df, "unique_id", "ds")
+        if sort_idxs is not None:
+            sort_idxs = np.asarray(sort_idxs)
+
+        # Fill temporal column by column, sorting and casting each one once.
+        # The available mask is added without copying the other columns.
+        temporal_cols = ["y"] + [
+            col for col in df.columns if col not in ("unique_id", "ds", "y")
+        ]
+        if "available_mask" not in df.columns:
+            temporal_cols.append("available_mask")
+        temporal = np.empty((len(df), len(temporal_cols)), dtype=np.float32)
+        for i, col in enumerate(temporal_cols):
+            if col not in df.columns:
+                temporal[:, i] = 1.0
+                continue
+            values = df[col].to_numpy()
+            temporal[:, i] = values if sort_idxs is None else values[sort_idxs]
+        temporal_cols = pd.Index(temporal_cols)
+
+        # Sorted dates, the (unique_id, ds) pairs can be recovered from them, `indices` and `indptr`
+        ds = df["ds"].to_numpy()
+        if sort_idxs is not None:
+            ds = ds[sort_idxs]
+        indices = (
+            pd.Index(ids)
+            if isinstance(df, pd.DataFrame)
+            else pd.Index(ids.to_numpy(), name="unique_id")
         )
-        temporal = data.astype(np.float32, copy=False)
-        indices = pd.Index(ids)
-        dates = pd.Index(times, name="ds")
+        dates = pd.Index(ds[indptr[1:] - 1], name="ds")
         sizes = np.diff(indptr)
         max_size = max(sizes)
         min_size = min(sizes)
 
-        # Add Available mask efficiently (without adding column to df)
-        if "available_mask" not in df.columns:
-            available_mask = np.ones((len(temporal), 1), dtype=np.float32)
-            temporal = np.append(temporal, available_mask, axis=1)
-            temporal_cols = temporal_cols.append(pd.Index(["available_mask"]))
-
         # Static features
         if static_df is not None:
             static = static_df.values
@@ -360,13 +913,133 @@ class TimeSeriesDataset(Dataset):
             min_size=min_size,
             sorted=sort_df,
             scaler_type=scaler_type,
+            exog_dtype=exog_dtype,
+            compact_mask=compact_mask,
         )
-        ds = pd.MultiIndex.from_frame(df[["unique_id", "ds"]])
-        if sort_idxs is not None:
-            ds = ds[sort_idxs]
+        if return_sort_idxs:
+            # positions of the sorted rows in `df`, None if it was already sorted
+            return dataset, indices, dates, ds, sort_idxs
         return dataset, indices, dates, ds
 
-# %% ../nbs/tsdataset.ipynb 11
+# %% ../nbs/tsdataset.ipynb 19
+class TimeSeriesWindowsDataset(Dataset):
+    """Training windows of a `TimeSeriesDataset`.
+
+    Precomputes the `(series, start)` position of every valid training window of
+    size `input_size + h`, so that windows can be sampled uniformly across the whole
+    dataset and gathered directly from `temporal`, instead of unfolding all the
+    windows of a batch of series.
+    The windows match the ones built by `BaseWindows._create_windows(step='train')`
+    on a batch containing all the series: the last `cutoff` observations of each series
+    are dropped, series are left padded to the longest one (plus `input_size - 1` when
+    `start_padding_enabled`) and right padded with `h` zeros, and only windows with
+    available data in both the input and the output are kept.
+
+    **Parameters:**<br>
+    `dataset`: `TimeSeriesDataset` from which the windows are taken.<br>
+    `input_size`: int, autorregresive inputs size of the windows.<br>
+    `h`: int, forecast horizon of the windows.<br>
+    `step_size`: int=1, step size between each window.<br>
+    `start_padding_enabled`: bool=False, if True, windows can start `input_size - 1` steps before the series.<br>
+    `cutoff`: int=0, number of observations removed from the end of each series (validation and test).<br>
+    """
+
+    def __init__(
+        self,
+        dataset: TimeSeriesDataset,
+        input_size: int,
+        h: int,
+        step_size: int = 1,
+        start_padding_enabled: bool = False,
+        cutoff: int = 0,
+    ):
+        super().__init__()
+        self.dataset = dataset
+        self.window_size = input_size + h
+        self.temporal_cols = dataset.temporal_cols
+        self.static_cols = dataset.static_cols
+
+        # Padded length shared by all series
+        sizes = np.diff(dataset.indptr)
+        pad_start = input_size - 1 if start_padding_enabled else 0
+        padded_size = pad_start + dataset.max_size - cutoff + h
+        if padded_size < self.window_size:
+            raise Exception(
+                "Time series is too short for training, consider setting a smaller input size or set start_padding_enabled=True"
+            )
+
+        # Window starts whose input and output overlap the series' training data
+        self.series_start = dataset.indptr[:-1].astype(np.int64)
+        self.series_end = self.series_start + np.maximum(sizes - cutoff, 0)
+        first_obs = pad_start + dataset.max_size - sizes
+        last_obs = first_obs + (self.series_end - self.series_start) - 1
+        min_start = np.maximum(first_obs - input_size + 1, 0)
+        min_start = -(-min_start // step_size) * step_size
+        max_start = np.minimum(
+            last_obs - input_size if h > 0 else last_obs, padded_size - self.window_size
+        )
+        counts = np.maximum((max_start - min_start) // step_size + 1, 0)
+        series = np.repeat(np.arange(dataset.n_groups), counts)
+        window_pos = np.arange(counts.sum()) - np.repeat(
+            counts.cumsum() - counts, counts
+        )
+        starts = np.repeat(min_start, counts) + step_size * window_pos
+        # Start of the window as a row of `temporal`, can be before the series' start
+        starts = self.series_start[series] + starts - first_obs[series]
+
+        # Available conditions from the cumulative available mask
+        mask = dataset._column(dataset.temporal_cols.get_loc("available_mask")).numpy()
+        mask_cumsum = np.append(0, np.cumsum(mask > 0))
+
+        def n_available(start, end):
+            start = np.clip(start, self.series_start[series], self.series_end[series])
+            end = np.clip(end, self.series_start[series], self.series_end[series])
+            return mask_cumsum[end] - mask_cumsum[start]
+
+        condition = n_available(starts, starts + input_size) > 0
+        if h > 0:
+            condition &= n_available(starts + input_size, starts + self.window_size) > 0
+        if not condition.any():
+            raise Exception("No windows available for training")
+
+        self.series = series[condition]
+        self.starts = starts[condition]
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitems__(self, idxs):
+        # Gathers the windows [B, L+H, C] with a single index operation
+        series = self.series[idxs]
+        rows = self.starts[idxs, None] + np.arange(self.window_size)
+        available = (rows >= self.series_start[series, None]) & (
+            rows < self.series_end[series, None]
+        )
+        rows = torch.from_numpy(np.where(available, rows, 0))
+        windows = self.dataset._take(rows)
+        windows[~torch.from_numpy(available)] = 0
+
+        static = None if self.dataset.static is None else self.dataset.static[series]
+        return dict(
+            temporal=windows,
+            temporal_cols=self.temporal_cols,
+            static=static,
+            static_cols=self.static_cols,
+        )
+
+    def __getitem__(self, idx):
+        if isinstance(idx, int):
+            batch = self.__getitems__([idx])
+            batch["temporal"] = batch["temporal"][0]
+            if batch["static"] is not None:
+                batch["static"] = batch["static"][0]
+            return batch
+        raise ValueError(f"idx must be int, got {type(idx)}")
+
+    def __repr__(self):
+        return f"TimeSeriesWindowsDataset(n_windows={len(self):,}, n_groups={self.dataset.n_groups:,})"
+
+# %% ../nbs/tsdataset.ipynb 22
 class TimeSeriesDataModule(pl.LightningDataModule):
     def __init__(
         self,
@@ -375,31 +1048,39 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         valid_batch_size=1024,
         num_workers=0,
         drop_last=False,
+        train_dataset=None,
+        val_dataset=None,
+        **dataloaders_kwargs
     ):
         super().__init__()
         self.dataset = dataset
+        self.train_dataset = train_dataset if train_dataset is not None else dataset
+        self.val_dataset = val_dataset if val_dataset is not None else dataset
         self.batch_size = batch_size
         self.valid_batch_size = valid_batch_size
         self.num_workers = num_workers
         self.drop_last = drop_last
+        self.dataloaders_kwargs = dataloaders_kwargs
 
     def train_dataloader(self):
         loader = TimeSeriesLoader(
-            self.dataset,
+            self.train_dataset,
             batch_size=self.batch_size,
             num_workers=self.num_workers,
             shuffle=True,
             drop_last=self.drop_last,
+            **self.dataloaders_kwargs
         )
         return loader
 
     def val_dataloader(self):
         loader = TimeSeriesLoader(
-            self.dataset,
+            self.val_dataset,
             batch_size=self.valid_batch_size,
             num_workers=self.num_workers,
             shuffle=False,
             drop_last=self.drop_last,
+            **self.dataloaders_kwargs
         )
         return loader
 
@@ -409,5 +1090,6 @@ class TimeSeriesDataModule(pl.LightningDataModule):
             batch_size=self.valid_batch_size,
             num_workers=self.num_workers,
             shuffle=False,
+            **self.dataloaders_kwargs
         )
         return loader
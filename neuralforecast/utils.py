@@ -2,18 +2,30 @@
 
 # %% auto 0
 __all__ = ['AirPassengers', 'AirPassengersDF', 'unique_id', 'ds', 'y', 'AirPassengersPanel', 'snaive', 'airline1_dummy',
-           'airline2_dummy', 'AirPassengersStatic', 'generate_series', 'TimeFeature', 'SecondOfMinute', 'MinuteOfHour',
-           'HourOfDay', 'DayOfWeek', 'DayOfMonth', 'DayOfYear', 'MonthOfYear', 'WeekOfYear',
-           'time_features_from_frequency_str', 'augment_calendar_df']
+           'airline2_dummy', 'AirPassengersStatic', 'generate_series', 'generate_series_shards', 'write_series_parquet',
+           'TimeFeature', 'SecondOfMinute', 'MinuteOfHour', 'HourOfDay', 'DayOfWeek', 'DayOfMonth', 'DayOfYear',
+           'MonthOfYear', 'WeekOfYear', 'time_features_from_frequency_str', 'augment_calendar_df']
 
 # %% ../nbs/utils.ipynb 3
+import os
 import random
-from itertools import chain
+from typing import Iterable, Iterator, List, Optional
 
 import numpy as np
 import pandas as pd
 
 # %% ../nbs/utils.ipynb 6
+def _series_positions(series_lengths, max_length, equal_ends):
+    # Position of every row of the panel in a date range of `max_length` stamps
+    ends = np.cumsum(series_lengths)
+    positions = np.arange(ends[-1] if len(ends) else 0) - np.repeat(
+        ends - series_lengths, series_lengths
+    )
+    if equal_ends:
+        positions += np.repeat(max_length - series_lengths, series_lengths)
+    return positions
+
+# %% ../nbs/utils.ipynb 7
 def generate_series(
     n_series: int,
     freq: str = "D",
@@ -51,24 +63,17 @@ def generate_series(
     total_length = series_lengths.sum()
 
     dates = pd.date_range("2000-01-01", periods=max_length, freq=freq).values
-    uids = [np.repeat(i, serie_length) for i, serie_length in enumerate(series_lengths)]
-    if equal_ends:
-        ds = [dates[-serie_length:] for serie_length in series_lengths]
-    else:
-        ds = [dates[:serie_length] for serie_length in series_lengths]
+    uids = np.repeat(np.arange(n_series), series_lengths)
+    ds = dates[_series_positions(series_lengths, max_length, equal_ends)]
 
     y = np.arange(total_length) % season + rng.rand(total_length) * 0.5
-    temporal_df = pd.DataFrame(
-        dict(unique_id=chain.from_iterable(uids), ds=chain.from_iterable(ds), y=y)
-    )
+    temporal_df = pd.DataFrame(dict(unique_id=uids, ds=ds, y=y))
 
     random.seed(seed)
     for i in range(n_temporal_features):
         random.seed(seed)
-        temporal_values = [
-            [random.randint(0, 100)] * serie_length for serie_length in series_lengths
-        ]
-        temporal_df[f"temporal_{i}"] = np.hstack(temporal_values)
+        temporal_values = [random.randint(0, 100) for _ in range(n_series)]
+        temporal_df[f"temporal_{i}"] = np.repeat(temporal_values, series_lengths)
         temporal_df[f"temporal_{i}"] = temporal_df[f"temporal_{i}"].astype("category")
         if i == 0:
             temporal_df["y"] = temporal_df["y"] * (
@@ -97,6 +102,111 @@ def generate_series(
     return temporal_df
 
 # %% ../nbs/utils.ipynb 11
+def generate_series_shards(
+    n_series: int,
+    shard_size: int = 100_000,
+    freq: str = "D",
+    min_length: int = 50,
+    max_length: int = 500,
+    n_temporal_features: int = 0,
+    n_static_features: int = 0,
+    equal_ends: bool = False,
+    categorical_id: bool = False,
+    shards: Optional[Iterable[int]] = None,
+    seed: int = 0,
+) -> Iterator:
+    """Generate Synthetic Panel Series by shards.
+
+    Streams a panel of `n_series` in shards of `shard_size` consecutive series ids, so
+    large panels never need to be in memory at once. Every shard draws from its own
+    generator seeded with `(seed, shard)`, a shard is the same regardless of which
+    other shards are generated, and shards can be produced independently in parallel.
+
+    **Parameters:**<br>
+    `n_series`: int, number of series for synthetic panel.<br>
+    `shard_size`: int, number of series of each shard.<br>
+    `freq`: str, frequency of the data, [panda's available frequencies](https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#offset-aliases).<br>
+    `min_length`: int, minimal length of synthetic panel's series.<br>
+    `max_length`: int, maximal length of synthetic panel's series.<br>
+    `n_temporal_features`: int, default=0, number of float temporal exogenous variables `temporal_{i}`.<br>
+    `n_static_features`: int, default=0, number of float static exogenous variables `static_{i}`.<br>
+    `equal_ends`: bool, if True, series finish in the same date stamp `ds`.<br>
+    `categorical_id`: bool, if True, `unique_id` is categorical, otherwise integer.<br>
+    `shards`: iterable of int, optional, shards to generate, defaults to all of them.<br>
+    `seed`: int, seed of the shards' generators.<br>
+
+    **Returns:**<br>
+    Iterator of `(shard, temporal_df)` tuples, or `(shard, temporal_df, static_df)` if `n_static_features > 0`.
+    Dataframes have `unique_id` as a column.
+    """
+    seasonalities = {"D": 7, "M": 12}
+    season = seasonalities[freq]
+    dates = pd.date_range("2000-01-01", periods=max_length, freq=freq).values
+    n_shards = -(-n_series // shard_size)
+    if shards is None:
+        shards = range(n_shards)
+
+    for shard in shards:
+        if not (0 <= shard < n_shards):
+            raise ValueError(f"shard must be in [0, {n_shards}), got {shard}")
+        rng = np.random.default_rng([seed, shard])
+        first_id = shard * shard_size
+        uids = np.arange(first_id, min(first_id + shard_size, n_series))
+        series_lengths = rng.integers(min_length, max_length + 1, len(uids))
+        total_length = series_lengths.sum()
+
+        positions = _series_positions(series_lengths, max_length, equal_ends)
+        temporal = {
+            "unique_id": np.repeat(uids, series_lengths),
+            "ds": dates[positions],
+            "y": positions % season + rng.random(total_length) * 0.5,
+        }
+        for i in range(n_temporal_features):
+            temporal[f"temporal_{i}"] = rng.random(total_length, dtype=np.float32)
+        temporal_df = pd.DataFrame(temporal)
+        if categorical_id:
+            temporal_df["unique_id"] = pd.Categorical.from_codes(
+                np.repeat(np.arange(len(uids)), series_lengths), categories=uids
+            )
+
+        if n_static_features == 0:
+            yield shard, temporal_df
+            continue
+        static_df = pd.DataFrame(
+            rng.random((len(uids), n_static_features), dtype=np.float32),
+            columns=[f"static_{i}" for i in range(n_static_features)],
+        )
+        static_df.insert(
+            0, "unique_id", pd.Categorical(uids) if categorical_id else uids
+        )
+        yield shard, temporal_df, static_df
+
+# %% ../nbs/utils.ipynb 13
+def write_series_parquet(path: str, n_series: int, **kwargs) -> List[str]:
+    """Write Synthetic Panel Series to parquet.
+
+    Writes every shard of `generate_series_shards` to its own `part-{shard}.parquet`
+    file in `path`, static features go to `static-{shard}.parquet`.
+    Needs a parquet engine like `pyarrow`.
+
+    **Parameters:**<br>
+    `path`: str, directory of the parquet files, created if missing.<br>
+    `n_series`: int, number of series for synthetic panel.<br>
+    `**kwargs`: additional arguments for `generate_series_shards`.<br>
+
+    **Returns:**<br>
+    `files`: list of str, paths of the written files.
+    """
+    os.makedirs(path, exist_ok=True)
+    files = []
+    for shard, *dfs in generate_series_shards(n_series=n_series, **kwargs):
+        for prefix, df in zip(["part", "static"], dfs):
+            file = os.path.join(path, f"{prefix}-{shard:05d}.parquet")
+            df.to_parquet(file, index=False)
+            files.append(file)
+    return files
+
+# %% ../nbs/utils.ipynb 18
 AirPassengers = np.array(
     [
         112.0,
@@ -247,7 +357,7 @@ AirPassengers = np.array(
     dtype=np.float32,
 )
 
-# %% ../nbs/utils.ipynb 12
+# %% ../nbs/utils.ipynb 19
 AirPassengersDF = pd.DataFrame(
     {
         "unique_id": np.ones(len(AirPassengers)),
@@ -256,7 +366,7 @@ AirPassengersDF = pd.DataFrame(
     }
 )
 
-# %% ../nbs/utils.ipynb 18
+# %% ../nbs/utils.ipynb 25
 # Declare Panel Data
 unique_id = np.concatenate(
     [["Airline1"] * len(AirPassengers), ["Airline2"] * len(AirPassengers)]
@@ -292,7 +402,7 @@ AirPassengersStatic = pd.DataFrame(
 
 AirPassengersPanel.groupby("unique_id").tail(4)
 
-# %% ../nbs/utils.ipynb 24
+# %% ../nbs/utils.ipynb 31
 from typing import List
 
 